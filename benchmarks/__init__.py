@@ -0,0 +1,28 @@
+"""
+Kuya Benchmarks
+Synthetic messy-data generators and a timing suite for every public Kuya API.
+
+Usage:
+    python -m benchmarks --rows 10000 100000 --cols 10 100 --output results.json
+    python -m benchmarks --compare old.json new.json
+"""
+
+from benchmarks.generators import make_messy_frame, iter_messy_chunks, write_messy_csv
+from benchmarks.suite import (
+    BENCHMARKS,
+    run_suite,
+    save_results,
+    load_results,
+    compare_results,
+)
+
+__all__ = [
+    'make_messy_frame',
+    'iter_messy_chunks',
+    'write_messy_csv',
+    'BENCHMARKS',
+    'run_suite',
+    'save_results',
+    'load_results',
+    'compare_results',
+]
@@ -0,0 +1,76 @@
+"""
+Command line entry point for the Kuya benchmark suite.
+
+Examples:
+    python -m benchmarks --rows 1e4 1e5 --cols 10 100 --output results.json
+    python -m benchmarks --groups clean eda --rows 1e6
+    python -m benchmarks --compare baseline.json results.json
+"""
+
+import argparse
+import sys
+
+import matplotlib
+matplotlib.use('Agg')
+
+from benchmarks.suite import BENCHMARKS, run_suite, save_results, compare_results
+
+
+def _size(value):
+    """Accept sizes like 10000, 1e4 or 1_000_000."""
+    return int(float(value.replace('_', '')))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Benchmark every public Kuya API on synthetic messy data'
+    )
+    parser.add_argument('--rows', nargs='+', type=_size, default=[10_000],
+                        help='Row counts (e.g. 1e4 1e6 1e8)')
+    parser.add_argument('--cols', nargs='+', type=_size, default=[10],
+                        help='Column counts (e.g. 10 500 5000)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Timed repetitions per benchmark (minimum is reported)')
+    parser.add_argument('--groups', nargs='+',
+                        choices=sorted({group for _, group, _ in BENCHMARKS}),
+                        help='Only run these benchmark groups')
+    parser.add_argument('--only', nargs='+', metavar='NAME',
+                        help='Only run these benchmarks')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Skip the tracemalloc peak-memory run')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', '-o', help='Write results JSON to this path')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'),
+                        help='Compare two results files instead of running')
+    parser.add_argument('--threshold', type=float, default=1.1,
+                        help='Slowdown ratio counted as a regression (default 1.1)')
+    parser.add_argument('--list', action='store_true', help='List benchmarks and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, group, _ in BENCHMARKS:
+            print(f"{group:<10} {name}")
+        return 0
+
+    if args.compare:
+        table = compare_results(args.compare[0], args.compare[1], threshold=args.threshold)
+        print(table.to_string(index=False))
+        regressions = int(table['regression'].sum())
+        if regressions:
+            print(f"\n⚠️  {regressions} regressions (>{args.threshold:.2f}x slower)")
+            return 1
+        print("\n✅ No regressions")
+        return 0
+
+    document = run_suite(rows=args.rows, cols=args.cols, repeat=args.repeat,
+                         groups=args.groups, names=args.only,
+                         memory=not args.no_memory, seed=args.seed)
+    if args.output:
+        save_results(document, args.output)
+        print(f"✓ Results saved to: {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Synthetic Messy Data Generators
+Realistic dirty datasets (missing values, outliers, mixed types, dates,
+high-cardinality strings, messy column names) at any size.
+
+Large datasets are produced chunk by chunk so 1e8-row files can be written
+without holding the whole frame in memory.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+
+# Column kinds cycled through to reach the requested width, modelled on
+# examples/example_6_advanced_showcase.py
+_KINDS = [
+    ('Customer ID', 'id'),
+    ('Purchase Amount ($)', 'amount'),
+    ('Quantity', 'quantity'),
+    ('Customer Rating', 'rating'),
+    ('Product Category', 'category'),
+    ('City', 'city'),
+    ('Customer Name', 'name'),
+    ('Member Since', 'date'),
+    ('Last Order Date', 'date_str'),
+    ('Discount Code', 'numeric_str'),
+    ('Is Active', 'flag'),
+]
+
+_CATEGORIES = np.array(['Electronics', 'Clothing', 'Home', 'Sports', 'Toys', 'Books'])
+_CITIES = np.array(['New York', 'new york ', 'LA', 'Los Angeles', 'Chicago',
+                    'Houston', 'Phoenix', 'CHICAGO', ' Phoenix'])
+
+
+def column_plan(n_cols):
+    """
+    Column names and kinds for a frame with n_cols columns.
+
+    Parameters:
+    -----------
+    n_cols : int
+        Number of columns
+
+    Returns:
+    --------
+    list of (name, kind) tuples
+    """
+    plan = []
+    for i in range(n_cols):
+        name, kind = _KINDS[i % len(_KINDS)]
+        repeat = i // len(_KINDS)
+        if repeat:
+            name = f"{name} {repeat}"
+        plan.append((name, kind))
+    return plan
+
+
+def _make_column(kind, start, n_rows, rng, missing_rate, outlier_rate):
+    """Generate one column of the given kind for rows [start, start + n_rows)."""
+    missing = rng.random(n_rows) < missing_rate if missing_rate > 0 else None
+
+    if kind == 'id':
+        return pd.Series(np.arange(start, start + n_rows) + 1001)
+
+    if kind == 'amount':
+        values = rng.uniform(50, 1000, n_rows)
+        outliers = rng.random(n_rows) < outlier_rate
+        values[outliers] *= rng.uniform(20, 100, outliers.sum())
+    elif kind == 'quantity':
+        values = rng.integers(1, 10, n_rows).astype(float)
+        outliers = rng.random(n_rows) < outlier_rate
+        values[outliers] = rng.integers(500, 5000, outliers.sum())
+    elif kind == 'rating':
+        values = rng.uniform(1, 5, n_rows)
+        outliers = rng.random(n_rows) < outlier_rate
+        values[outliers] = rng.choice([-100.0, -50.0, 100.0, 200.0, 300.0], outliers.sum())
+    elif kind == 'category':
+        values = _CATEGORIES[rng.integers(0, len(_CATEGORIES), n_rows)].astype(object)
+    elif kind == 'city':
+        values = _CITIES[rng.integers(0, len(_CITIES), n_rows)].astype(object)
+    elif kind == 'name':
+        ids = pd.Series(rng.integers(0, max(n_rows + start, 1) * 2, n_rows)).astype(str)
+        values = ('Customer ' + ids).to_numpy(dtype=object)
+        upper = rng.random(n_rows) < 0.05
+        values[upper] = [v.upper() + ' ' for v in values[upper]]
+    elif kind == 'date':
+        base = np.datetime64('2020-01-01')
+        days = rng.integers(0, 365 * 5, n_rows)
+        values = pd.Series(base + days.astype('timedelta64[D]'))
+        if missing is not None:
+            values[missing] = pd.NaT
+        return values
+    elif kind == 'date_str':
+        base = np.datetime64('2020-01-01')
+        days = rng.integers(0, 365 * 5, n_rows)
+        values = pd.Series(base + days.astype('timedelta64[D]')).dt.strftime('%Y-%m-%d')
+        values = values.to_numpy(dtype=object)
+    elif kind == 'numeric_str':
+        values = pd.Series(rng.integers(100, 999, n_rows)).astype(str).to_numpy(dtype=object)
+        junk = rng.random(n_rows) < outlier_rate
+        values[junk] = 'N/A'
+    elif kind == 'flag':
+        values = rng.random(n_rows) < 0.7
+        return pd.Series(values)
+    else:
+        raise ValueError(f"Unknown column kind: {kind}")
+
+    if missing is not None:
+        values[missing] = np.nan if values.dtype != object else None
+    return pd.Series(values)
+
+
+def _make_chunk(plan, start, n_rows, seed, chunk_index, missing_rate, outlier_rate):
+    rng = np.random.default_rng([seed, chunk_index])
+    columns = {
+        name: _make_column(kind, start, n_rows, rng, missing_rate, outlier_rate).to_numpy()
+        for name, kind in plan
+    }
+    return pd.DataFrame(columns, index=pd.RangeIndex(start, start + n_rows))
+
+
+def iter_messy_chunks(n_rows, n_cols, chunk_size=1_000_000, seed=42,
+                      missing_rate=0.05, outlier_rate=0.01):
+    """
+    Yield a messy dataset chunk by chunk.
+
+    Parameters:
+    -----------
+    n_rows : int
+        Total number of rows
+    n_cols : int
+        Number of columns
+    chunk_size : int, default=1_000_000
+        Rows per chunk
+    seed : int, default=42
+        Random seed; the same seed always yields the same data
+    missing_rate : float, default=0.05
+        Fraction of missing cells per column
+    outlier_rate : float, default=0.01
+        Fraction of outliers / junk values per column
+
+    Yields:
+    -------
+    pd.DataFrame
+    """
+    plan = column_plan(n_cols)
+    for chunk_index, start in enumerate(range(0, n_rows, chunk_size)):
+        size = min(chunk_size, n_rows - start)
+        yield _make_chunk(plan, start, size, seed, chunk_index, missing_rate, outlier_rate)
+
+
+def make_messy_frame(n_rows, n_cols, seed=42, missing_rate=0.05, outlier_rate=0.01,
+                     chunk_size=1_000_000):
+    """
+    Build a messy dataset in memory.
+
+    Parameters:
+    -----------
+    n_rows : int
+        Number of rows
+    n_cols : int
+        Number of columns
+    seed : int, default=42
+        Random seed
+    missing_rate : float, default=0.05
+        Fraction of missing cells per column
+    outlier_rate : float, default=0.01
+        Fraction of outliers / junk values per column
+    chunk_size : int, default=1_000_000
+        Rows generated per step
+
+    Returns:
+    --------
+    pd.DataFrame
+    """
+    chunks = list(iter_messy_chunks(n_rows, n_cols, chunk_size, seed,
+                                    missing_rate, outlier_rate))
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks)
+
+
+def write_messy_csv(path, n_rows, n_cols, chunk_size=1_000_000, seed=42,
+                    missing_rate=0.05, outlier_rate=0.01):
+    """
+    Stream a messy dataset to CSV without holding it in memory.
+
+    Parameters:
+    -----------
+    path : str
+        Output CSV path
+    n_rows, n_cols, chunk_size, seed, missing_rate, outlier_rate :
+        See iter_messy_chunks
+
+    Returns:
+    --------
+    str
+        The path written
+    """
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    header = True
+    for chunk in iter_messy_chunks(n_rows, n_cols, chunk_size, seed,
+                                   missing_rate, outlier_rate):
+        chunk.to_csv(path, mode='w' if header else 'a', header=header, index=False)
+        header = False
+    return path
@@ -0,0 +1,259 @@
+"""
+Benchmark Suite
+Times every public Kuya API on synthetic messy data and stores the results
+as JSON so runs from different versions can be compared.
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import tempfile
+import time
+import warnings
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.generators import make_messy_frame, write_messy_csv, column_plan
+
+
+def _first_col(ctx, kind):
+    """First column of the generated frame with the given kind, if any."""
+    for name, col_kind in column_plan(ctx['n_cols']):
+        if col_kind == kind:
+            return name
+    return None
+
+
+def _bench_load(ctx):
+    import kuya as ky
+    return ky.load(ctx['csv_path'])
+
+
+def _bench_save(ctx):
+    import kuya as ky
+    return ky.save(ctx['df'], os.path.join(ctx['workdir'], 'saved.csv'))
+
+
+def _bench_compare_groups(ctx):
+    group_col = _first_col(ctx, 'category')
+    value_col = _first_col(ctx, 'amount')
+    if group_col is None or value_col is None:
+        return None
+    return ctx['df'].compare_groups(group_col, value_col)
+
+
+def _bench_plot_histogram(ctx):
+    column = _first_col(ctx, 'amount')
+    if column is None:
+        return None
+    return ctx['df'].plot_histogram(column)
+
+
+def _bench_quick_clean(ctx):
+    from kuya.advanced import quick_clean
+    return quick_clean(ctx['df'])
+
+
+def _bench_auto_report(fmt):
+    def run(ctx):
+        from kuya.advanced import auto_report
+        return auto_report(ctx['df'], os.path.join(ctx['workdir'], 'report'), format=fmt)
+    return run
+
+
+# (name, group, function). Each function receives a context dict with the
+# KuyaDataFrame ('df'), a scratch directory ('workdir') and a CSV copy of the
+# data ('csv_path').
+BENCHMARKS = [
+    ('load_csv', 'io', _bench_load),
+    ('save_csv', 'io', _bench_save),
+    ('clean_missing_drop', 'clean', lambda ctx: ctx['df'].clean_missing(method='drop')),
+    ('clean_missing_fill', 'clean', lambda ctx: ctx['df'].clean_missing(method='fill')),
+    ('fix_dtypes', 'clean', lambda ctx: ctx['df'].fix_dtypes()),
+    ('handle_outliers_iqr', 'clean', lambda ctx: ctx['df'].handle_outliers(method='iqr')),
+    ('handle_outliers_zscore', 'clean', lambda ctx: ctx['df'].handle_outliers(method='zscore')),
+    ('standardize_columns', 'clean', lambda ctx: ctx['df'].standardize_columns(copy=False)),
+    ('clean_categories', 'clean', lambda ctx: ctx['df'].clean_categories()),
+    ('quick_clean', 'clean', _bench_quick_clean),
+    ('summary', 'eda', lambda ctx: ctx['df'].summary()),
+    ('check_missing', 'eda', lambda ctx: ctx['df'].check_missing()),
+    ('unique_summary', 'eda', lambda ctx: ctx['df'].unique_summary()),
+    ('unique_summary_approx', 'eda', lambda ctx: ctx['df'].unique_summary(approx=True)),
+    ('correlation_report', 'eda', lambda ctx: ctx['df'].correlation_report()),
+    ('correlation_report_kendall', 'eda',
+     lambda ctx: ctx['df'].correlation_report(method='kendall')),
+    ('quality_report', 'quality', lambda ctx: ctx['df'].quality_report()),
+    ('detect_duplicates', 'quality', lambda ctx: ctx['df'].detect_duplicates()),
+    ('remove_duplicates', 'quality', lambda ctx: ctx['df'].remove_duplicates()),
+    ('detect_duplicates_fuzzy', 'quality', lambda ctx: ctx['df'].detect_duplicates(fuzzy=True)),
+    ('suggest_dtypes', 'quality', lambda ctx: ctx['df'].suggest_dtypes()),
+    ('smart_encode', 'transform', lambda ctx: ctx['df'].smart_encode()),
+    ('normalize', 'transform', lambda ctx: ctx['df'].normalize()),
+    ('create_features', 'transform', lambda ctx: ctx['df'].create_features()),
+    ('auto_insights', 'insights', lambda ctx: ctx['df'].auto_insights()),
+    ('compare_groups', 'insights', _bench_compare_groups),
+    ('smart_analysis', 'insights', lambda ctx: ctx['df'].smart_analysis()),
+    ('auto_report_txt', 'reports', _bench_auto_report('txt')),
+    ('auto_report_html', 'reports', _bench_auto_report('html')),
+    ('plot_histogram', 'viz', _bench_plot_histogram),
+    ('corr_heatmap', 'viz', lambda ctx: ctx['df'].corr_heatmap(annot=False)),
+]
+
+
+def _time_call(fn, ctx, memory):
+    """Run fn once, silencing Kuya's console output. Returns (wall, cpu, peak_bytes)."""
+    import kuya as ky
+    import matplotlib.pyplot as plt
+
+    with warnings.catch_warnings(), contextlib.redirect_stdout(io.StringIO()):
+        warnings.simplefilter('ignore')
+        with ky.profile(memory=memory) as prof:
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            fn(ctx)
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+        plt.close('all')
+
+    peak = max((span.peak_memory for span in prof.spans if span.depth == 0), default=0)
+    return wall, cpu, peak if memory else None
+
+
+def run_suite(rows=(10_000,), cols=(10,), repeat=3, groups=None, names=None,
+              memory=True, seed=42, verbose=True):
+    """
+    Run the benchmark suite over a grid of dataset sizes.
+
+    Parameters:
+    -----------
+    rows : iterable of int, default=(10_000,)
+        Row counts to benchmark
+    cols : iterable of int, default=(10,)
+        Column counts to benchmark
+    repeat : int, default=3
+        Timed repetitions per benchmark; the minimum is reported
+    groups : list, optional
+        Only run these groups ('io', 'clean', 'eda', 'quality', 'transform',
+        'insights', 'reports', 'viz')
+    names : list, optional
+        Only run benchmarks with these names
+    memory : bool, default=True
+        Record peak memory with an extra tracemalloc-instrumented run
+    seed : int, default=42
+        Seed for the data generator
+    verbose : bool, default=True
+        Print progress
+
+    Returns:
+    --------
+    dict
+        JSON-serializable results document
+    """
+    import kuya as ky
+    from kuya.core import KuyaDataFrame
+
+    selected = [b for b in BENCHMARKS
+                if (groups is None or b[1] in groups) and (names is None or b[0] in names)]
+
+    results = []
+    for n_rows in rows:
+        for n_cols in cols:
+            if verbose:
+                print(f"📊 Dataset {n_rows:,} rows × {n_cols} columns")
+            with tempfile.TemporaryDirectory() as workdir:
+                ctx = {
+                    'n_rows': n_rows,
+                    'n_cols': n_cols,
+                    'workdir': workdir,
+                    'df': KuyaDataFrame(make_messy_frame(n_rows, n_cols, seed=seed)),
+                }
+                if any(name == 'load_csv' for name, _, _ in selected):
+                    ctx['csv_path'] = write_messy_csv(os.path.join(workdir, 'data.csv'),
+                                                      n_rows, n_cols, seed=seed)
+
+                for name, group, fn in selected:
+                    entry = {'name': name, 'group': group, 'rows': n_rows, 'cols': n_cols}
+                    try:
+                        timings = [_time_call(fn, ctx, memory=False) for _ in range(repeat)]
+                        walls = [t[0] for t in timings]
+                        entry.update({
+                            'wall_s': min(walls),
+                            'wall_mean_s': float(np.mean(walls)),
+                            'cpu_s': min(t[1] for t in timings),
+                            'repeat': repeat,
+                        })
+                        if memory:
+                            entry['peak_mb'] = _time_call(fn, ctx, memory=True)[2] / 1024**2
+                    except Exception as e:
+                        entry['error'] = f"{type(e).__name__}: {e}"
+
+                    results.append(entry)
+                    if verbose:
+                        if 'error' in entry:
+                            print(f"  ✗ {name:<24} {entry['error']}")
+                        else:
+                            print(f"  ✓ {name:<24} {entry['wall_s']:.4f}s")
+
+    return {
+        'kuya_version': ky.__version__,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'results': results,
+    }
+
+
+def save_results(document, path):
+    """Write a results document to JSON."""
+    with open(path, 'w') as f:
+        json.dump(document, f, indent=2)
+    return path
+
+
+def load_results(path):
+    """Read a results document from JSON."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_results(baseline, current, threshold=1.1):
+    """
+    Compare two benchmark runs.
+
+    Parameters:
+    -----------
+    baseline : dict or str
+        Results document (or path to one) to compare against
+    current : dict or str
+        Newer results document (or path to one)
+    threshold : float, default=1.1
+        Slowdown ratio above which a benchmark counts as a regression
+
+    Returns:
+    --------
+    pd.DataFrame
+        Per-benchmark wall times, ratio (current / baseline) and regression flag
+    """
+    if isinstance(baseline, str):
+        baseline = load_results(baseline)
+    if isinstance(current, str):
+        current = load_results(current)
+
+    keys = ['name', 'group', 'rows', 'cols']
+    old = pd.DataFrame(baseline['results'])
+    new = pd.DataFrame(current['results'])
+    for frame in (old, new):
+        if 'wall_s' not in frame:
+            frame['wall_s'] = np.nan
+
+    merged = old[keys + ['wall_s']].merge(new[keys + ['wall_s']], on=keys,
+                                          suffixes=('_baseline', '_current'))
+    merged['ratio'] = merged['wall_s_current'] / merged['wall_s_baseline']
+    merged['regression'] = merged['ratio'] > threshold
+    return merged.sort_values('ratio', ascending=False).reset_index(drop=True)
@@ -14,6 +14,13 @@ from kuya.clean import KuyaCleaner
 from kuya.eda import KuyaEDA
 from kuya.viz import KuyaViz
 from kuya.io import load, save
+from kuya.profiling import profile, KuyaProfiler
+from kuya.sketches import QuantileSketch, MomentAccumulator, HyperLogLog, TopKSketch, Histogram
+from kuya.fingerprints import RowFingerprintIndex
+from kuya.correlation import CovarianceAccumulator
+from kuya.missing import NullBitmap
+from kuya.groups import GroupIndex, group_tests
+from kuya.sampling import sample_rows, reservoir_sample
 
 # Import core DataFrame extension
 from kuya.core import KuyaDataFrame
@@ -42,6 +49,20 @@ __all__ = [
     'KuyaDataQuality',
     'KuyaTransform',
     'KuyaInsights',
+    'profile',
+    'KuyaProfiler',
+    'QuantileSketch',
+    'MomentAccumulator',
+    'HyperLogLog',
+    'TopKSketch',
+    'Histogram',
+    'RowFingerprintIndex',
+    'CovarianceAccumulator',
+    'NullBitmap',
+    'GroupIndex',
+    'group_tests',
+    'sample_rows',
+    'reservoir_sample',
 ]
 
 # Quick access message
@@ -7,6 +7,15 @@ import numpy as np
 from typing import List, Dict, Any, Optional
 import warnings
 
+from kuya.profiling import profiled, step
+from kuya.clean import _fill_values, _outlier_bounds, _outlier_mask
+from kuya.sketches import block_quantiles, distinct_counts, sketch_columns
+from kuya.correlation import association_matrix, correlation_matrix, strong_pairs
+from kuya.fingerprints import row_hashes, near_duplicate_groups, _subset_columns
+from kuya.missing import null_counts
+from kuya.groups import group_index, group_tests, _check_test, _kruskal, _ranked
+from kuya.sampling import sample_rows, sample_info, describe_sample, proportion_interval
+
 
 class KuyaDataQuality:
     """Advanced data quality assessment tools."""
@@ -14,43 +23,124 @@ class KuyaDataQuality:
     def __init__(self, df):
         self.df = df
     
-    def quality_report(self):
+    def _duplicate_mask(self, subset=None, keep='first', index=None, hashes=None):
+        """
+        Duplicate-row mask from row fingerprints.
+        
+        Rows whose hash is unique are never duplicates; only the rows sharing
+        a hash are compared exactly, so hash collisions cannot cause false
+        positives. Pass the row_hashes() of this call's frame as `hashes` to
+        reuse them between masks; they are never kept across calls, since
+        the frame may be edited in place. With a RowFingerprintIndex, rows
+        already seen in earlier batches count as duplicates too
+        (keep='first' only) and the index is updated.
+        """
+        if index is not None:
+            if subset is not None and _subset_columns(self.df, subset) != \
+                    _subset_columns(self.df, index.subset):
+                raise ValueError("subset must match the RowFingerprintIndex subset")
+            if keep != 'first':
+                raise ValueError("keep must be 'first' when using a RowFingerprintIndex")
+            if hashes is None:
+                hashes = row_hashes(self.df, index.subset)
+            return index.update_hashes(hashes)
+        
+        if hashes is None:
+            hashes = row_hashes(self.df, subset)
+        candidates = pd.Index(hashes).duplicated(keep=False)
+        mask = np.zeros(len(candidates), dtype=bool)
+        if candidates.any():
+            rows = self.df.iloc[np.flatnonzero(candidates)]
+            mask[candidates] = rows.duplicated(subset=subset, keep=keep).to_numpy()
+        return mask
+    
+    @profiled
+    def quality_report(self, quantiles='exact', error=0.01, approx=False, sample=None,
+                       stratify=None, bitmap=None):
         """
         Generate comprehensive data quality report.
         
+        Parameters:
+        -----------
+        quantiles : str or dict, default='exact'
+            How quartiles for the outlier check are computed: 'exact',
+            'approx' (QuantileSketch per column) or a {column: QuantileSketch}
+            dict built over a stream
+        error : float, default=0.01
+            Error bound for the approximate sketches (quantile rank error,
+            relative distinct-count error)
+        approx : bool or dict, default=False
+            Use HyperLogLog distinct counts for the constant and
+            high-cardinality checks (or a {column: HyperLogLog} dict)
+        sample : int or float, optional
+            Check a random sample of this many rows (or this fraction of the
+            rows). Rates are reported as estimates with 95% confidence
+            intervals
+        stratify : str, optional
+            Column whose groups keep their share of the sampled rows
+        bitmap : NullBitmap, optional
+            Null masks already built for this frame (see null_bitmap)
+        
         Returns:
         --------
         dict: Quality metrics and issues
         """
+        if sample is not None:
+            sampled = KuyaDataQuality(sample_rows(self.df, sample, stratify))
+            return sampled.quality_report(quantiles, error, approx)
+        info = sample_info(self.df)
+        rows = len(self.df) if info is None else info['population']
+        intervals = {}
+        
         print("=" * 70)
         print("🔍 DATA QUALITY REPORT")
         print("=" * 70)
+        if info is not None:
+            print(describe_sample(info))
         
         issues = []
         score = 100.0
         
+        def interval_text(name, count, n, population):
+            # Estimated share with its confidence interval (samples only)
+            if info is None:
+                return ""
+            _, lower, upper = proportion_interval(count, n, population)
+            intervals[name] = (float(lower) * 100, float(upper) * 100)
+            return f", 95% CI {lower * 100:.2f}–{upper * 100:.2f}%"
+        
         # Check missing values
-        missing_pct = (self.df.isnull().sum().sum() / (len(self.df) * len(self.df.columns))) * 100
+        n_cells = len(self.df) * len(self.df.columns)
+        missing_cells = int(null_counts(self.df, bitmap).sum())
+        missing_pct = (missing_cells / n_cells) * 100
         if missing_pct > 0:
-            issues.append(f"Missing values: {missing_pct:.2f}% of data")
+            ci = interval_text('missing_pct', missing_cells, n_cells, rows * len(self.df.columns))
+            issues.append(f"Missing values: {missing_pct:.2f}% of data{ci}")
             score -= min(missing_pct * 2, 20)
         
         # Check duplicates
-        dup_count = self.df.duplicated().sum()
+        dup_count = int(self._duplicate_mask().sum())
         if dup_count > 0:
             dup_pct = (dup_count / len(self.df)) * 100
-            issues.append(f"Duplicate rows: {dup_count} ({dup_pct:.2f}%)")
+            if info is None:
+                issues.append(f"Duplicate rows: {dup_count} ({dup_pct:.2f}%)")
+            else:
+                # Copies that were not sampled are invisible, so this is a lower bound
+                ci = interval_text('duplicates_pct', dup_count, len(self.df), rows)
+                dup_count = int(round(dup_count * rows / len(self.df)))
+                issues.append(f"Duplicate rows: at least ~{dup_count} ({dup_pct:.2f}%{ci})")
             score -= min(dup_pct, 15)
         
         # Check constant columns
-        constant_cols = [col for col in self.df.columns if self.df[col].nunique() == 1]
+        distinct = distinct_counts(self.df, approx=approx, error=error)
+        constant_cols = [col for col in self.df.columns if distinct[col] == 1]
         if constant_cols:
             issues.append(f"Constant columns: {len(constant_cols)} columns")
             score -= len(constant_cols) * 5
         
-        # Check high cardinality
+        # Check high cardinality (in a sample: nearly every sampled value distinct)
         high_card_cols = [col for col in self.df.select_dtypes(include=['object']).columns 
-                         if self.df[col].nunique() > len(self.df) * 0.9]
+                         if distinct[col] > len(self.df) * 0.9]
         if high_card_cols:
             issues.append(f"High cardinality: {len(high_card_cols)} columns")
             score -= len(high_card_cols) * 3
@@ -58,13 +148,12 @@ class KuyaDataQuality:
         # Check numeric outliers
         numeric_cols = self.df.select_dtypes(include=[np.number]).columns
         outlier_cols = []
-        for col in numeric_cols:
-            Q1 = self.df[col].quantile(0.25)
-            Q3 = self.df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            outliers = ((self.df[col] < (Q1 - 1.5 * IQR)) | (self.df[col] > (Q3 + 1.5 * IQR))).sum()
-            if outliers > len(self.df) * 0.05:
-                outlier_cols.append(col)
+        if len(numeric_cols) > 0:
+            block = self.df[numeric_cols]
+            lower, upper = _outlier_bounds(block, 'iqr', 1.5, quantiles, error)
+            outlier_counts = _outlier_mask(block, lower, upper).sum(axis=0)
+            outlier_cols = [col for col, count in zip(numeric_cols, outlier_counts)
+                            if count > len(self.df) * 0.05]
         if outlier_cols:
             issues.append(f"Columns with outliers: {len(outlier_cols)}")
             score -= len(outlier_cols) * 2
@@ -103,7 +192,7 @@ class KuyaDataQuality:
         
         print("=" * 70)
         
-        return {
+        result = {
             'score': score,
             'issues': issues,
             'missing_pct': missing_pct,
@@ -112,8 +201,14 @@ class KuyaDataQuality:
             'high_cardinality_cols': high_card_cols,
             'outlier_cols': outlier_cols
         }
+        if info is not None:
+            result['sample'] = info
+            result['intervals'] = intervals
+        return result
     
-    def detect_duplicates(self, subset=None):
+    @profiled
+    def detect_duplicates(self, subset=None, index=None, fuzzy=False, columns=None,
+                          threshold=0.9, num_perm=64):
         """
         Detect and show duplicate rows.
         
@@ -121,23 +216,102 @@ class KuyaDataQuality:
         -----------
         subset : list, optional
             Columns to consider for duplicates
+        index : RowFingerprintIndex, optional
+            Fingerprints of earlier chunks/files. Rows repeating an earlier
+            batch are reported as well, and this batch is added to the index
+        fuzzy : bool, default=False
+            Also match near-duplicates (different casing, spacing or small
+            typos) using MinHash signatures and locality-sensitive hashing
+        columns : list, optional
+            Columns compared when fuzzy=True. Defaults to subset, else the
+            text columns (all columns if there are none)
+        threshold : float, default=0.9
+            Minimum estimated similarity (Jaccard of character 3-grams) for
+            fuzzy matches
+        num_perm : int, default=64
+            MinHash signature length for fuzzy matching (higher = more accurate, slower)
         
         Returns:
         --------
-        pd.DataFrame: Duplicate rows
+        pd.DataFrame: Duplicate rows (with a 'duplicate_group' column when fuzzy=True)
         """
-        duplicates = self.df[self.df.duplicated(subset=subset, keep=False)]
+        if fuzzy:
+            if index is not None:
+                raise ValueError("index is not supported with fuzzy=True")
+            if columns is None:
+                columns = subset
+            if columns is None:
+                columns = self.df.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
+                columns = columns or list(self.df.columns)
+            
+            groups = near_duplicate_groups(self.df, columns, threshold, num_perm)
+            grouped = np.flatnonzero(groups >= 0)
+            if len(grouped) == 0:
+                print("✅ No near-duplicate rows found!")
+                return pd.DataFrame()
+            
+            order = grouped[np.argsort(groups[grouped], kind='stable')]
+            duplicates = self.df.iloc[order].copy()
+            duplicates['duplicate_group'] = groups[order]
+            n_groups = int(groups.max()) + 1
+            print(f"⚠️  Found {len(grouped) - n_groups} near-duplicate rows "
+                  f"in {n_groups} groups (similarity >= {threshold}):")
+            print(duplicates.head(10))
+            return duplicates
+        
+        # Hash once for this call; both masks below share the hashes
+        hashes = row_hashes(self.df, subset if index is None else index.subset)
+        if index is None:
+            duplicates = self.df[self._duplicate_mask(subset, keep=False, hashes=hashes)]
+        else:
+            duplicates = self.df[self._duplicate_mask(subset, index=index, hashes=hashes)]
         
         if len(duplicates) == 0:
             print("✅ No duplicate rows found!")
             return pd.DataFrame()
         
-        dup_count = self.df.duplicated(subset=subset).sum()
+        if index is None:
+            dup_count = int(self._duplicate_mask(subset, hashes=hashes).sum())
+        else:
+            dup_count = len(duplicates)
         print(f"⚠️  Found {dup_count} duplicate rows:")
         print(duplicates.head(10))
         
         return duplicates
     
+    @profiled
+    def drop_duplicates(self, subset=None, keep='first', ignore_index=False, index=None):
+        """
+        Remove duplicate rows using row fingerprints.
+        
+        Parameters:
+        -----------
+        subset : list, optional
+            Columns to consider for duplicates
+        keep : {'first', 'last', False}, default='first'
+            Which occurrence to keep (False drops every copy)
+        ignore_index : bool, default=False
+            Renumber the result 0..n-1
+        index : RowFingerprintIndex, optional
+            Fingerprints of earlier chunks/files; rows seen there are dropped
+            too and this batch is added to the index
+        
+        Returns:
+        --------
+        KuyaDataFrame
+            DataFrame without duplicate rows
+        """
+        from kuya.core import KuyaDataFrame
+        
+        mask = self._duplicate_mask(subset, keep, index)
+        result = self.df[~mask]
+        if ignore_index:
+            result = result.reset_index(drop=True)
+        
+        print(f"✓ Removed {int(mask.sum())} duplicate rows")
+        return KuyaDataFrame(result)
+    
+    @profiled
     def suggest_dtypes(self):
         """
         Suggest optimal data types for memory optimization.
@@ -193,6 +367,7 @@ class KuyaTransform:
     def __init__(self, df):
         self.df = df
     
+    @profiled
     def smart_encode(self, columns=None, method='auto'):
         """
         Intelligently encode categorical variables.
@@ -252,7 +427,8 @@ class KuyaTransform:
         
         return KuyaDataFrame(df_copy)
     
-    def normalize(self, columns=None, method='minmax'):
+    @profiled
+    def normalize(self, columns=None, method='minmax', quantiles='exact', error=0.01):
         """
         Normalize numeric columns.
         
@@ -262,6 +438,11 @@ class KuyaTransform:
             Columns to normalize
         method : str
             'minmax', 'zscore', 'robust'
+        quantiles : str or dict, default='exact'
+            For method='robust': 'exact', 'approx' (QuantileSketch per column)
+            or a {column: QuantileSketch} dict built over a stream
+        error : float, default=0.01
+            Rank error bound for quantiles='approx'
         
         Returns:
         --------
@@ -273,6 +454,9 @@ class KuyaTransform:
         if columns is None:
             columns = df_copy.select_dtypes(include=[np.number]).columns.tolist()
         
+        if method == 'robust':
+            robust_stats = block_quantiles(df_copy[columns], [0.25, 0.5, 0.75], quantiles, error)
+        
         for col in columns:
             if method == 'minmax':
                 min_val = df_copy[col].min()
@@ -285,9 +469,7 @@ class KuyaTransform:
                 df_copy[col] = (df_copy[col] - mean_val) / std_val
             
             elif method == 'robust':
-                median_val = df_copy[col].median()
-                q75 = df_copy[col].quantile(0.75)
-                q25 = df_copy[col].quantile(0.25)
+                q25, median_val, q75 = robust_stats[col].to_numpy()
                 iqr = q75 - q25
                 df_copy[col] = (df_copy[col] - median_val) / iqr
         
@@ -295,6 +477,7 @@ class KuyaTransform:
         
         return KuyaDataFrame(df_copy)
     
+    @profiled
     def create_features(self):
         """
         Auto-generate useful features from existing columns.
@@ -322,15 +505,16 @@ class KuyaTransform:
         numeric_cols = df_copy.select_dtypes(include=[np.number]).columns.tolist()
         if len(numeric_cols) >= 2:
             # Create ratio features for highly correlated columns
-            corr_matrix = df_copy[numeric_cols].corr()
-            for i in range(len(numeric_cols)):
-                for j in range(i+1, len(numeric_cols)):
-                    col1, col2 = numeric_cols[i], numeric_cols[j]
-                    if abs(corr_matrix.iloc[i, j]) > 0.7:
-                        # Avoid division by zero
-                        if (df_copy[col2] != 0).all():
-                            df_copy[f'{col1}_div_{col2}'] = df_copy[col1] / df_copy[col2]
-                            new_features.append(f'{col1}_div_{col2}')
+            corr_matrix = correlation_matrix(df_copy[numeric_cols])
+            pairs = strong_pairs(corr_matrix, threshold=0.7)
+            # Keep the original column-pair order for the new feature names
+            pairs = pairs.sort_values(['col1', 'col2'], key=lambda c: c.map(numeric_cols.index))
+            nonzero = (df_copy[numeric_cols] != 0).all()
+            for col1, col2 in zip(pairs['col1'], pairs['col2']):
+                # Avoid division by zero
+                if nonzero[col2]:
+                    df_copy[f'{col1}_div_{col2}'] = df_copy[col1] / df_copy[col2]
+                    new_features.append(f'{col1}_div_{col2}')
         
         if new_features:
             print(f"✓ Created {len(new_features)} new features:")
@@ -348,26 +532,51 @@ class KuyaInsights:
     def __init__(self, df):
         self.df = df
     
-    def auto_insights(self):
+    @profiled
+    def auto_insights(self, approx=False, error=0.01, sample=None, stratify=None, bitmap=None):
         """
         Generate automated insights from data.
         
+        Parameters:
+        -----------
+        approx : bool or dict, default=False
+            Use HyperLogLog distinct counts for categorical columns (or a
+            {column: HyperLogLog} dict built over a stream)
+        error : float, default=0.01
+            Relative error of the approximate counts
+        sample : int or float, optional
+            Derive the insights from a random sample of this many rows (or
+            this fraction of the rows); shares and correlations come with 95%
+            confidence intervals
+        stratify : str, optional
+            Column whose groups keep their share of the sampled rows
+        bitmap : NullBitmap, optional
+            Null masks already built for this frame (see null_bitmap)
+        
         Returns:
         --------
         list: List of insights
         """
+        if sample is not None:
+            return KuyaInsights(sample_rows(self.df, sample, stratify)).auto_insights(approx, error)
+        info = sample_info(self.df)
         insights = []
         
         print("=" * 70)
         print("💡 AUTOMATED INSIGHTS")
         print("=" * 70)
+        if info is not None:
+            print(describe_sample(info))
         
         # Insight 1: Data size
         rows, cols = self.df.shape
+        if info is not None:
+            rows = info['population']
         insights.append(f"Dataset contains {rows:,} rows and {cols} columns")
         
         # Insight 2: Missing data patterns
-        missing_cols = self.df.columns[self.df.isnull().any()].tolist()
+        missing = null_counts(self.df, bitmap)
+        missing_cols = missing.index[missing.to_numpy() > 0].tolist()
         if missing_cols:
             insights.append(f"{len(missing_cols)} columns have missing values")
         
@@ -381,27 +590,47 @@ class KuyaInsights:
         
         # Insight 4: Categorical insights
         cat_cols = self.df.select_dtypes(include=['object', 'category']).columns
+        distinct = distinct_counts(self.df, cat_cols, approx=approx, error=error)
+        top_values = sketch_columns(self.df, [col for col in cat_cols if distinct[col] < 10],
+                                    kind='topk')
+        # Approximate counts can't prove uniqueness; allow for the sketch error
+        id_threshold = len(self.df) if approx is False else len(self.df) * (1 - 3 * error)
+        if info is not None:
+            # In a sample, a unique identifier repeats no sampled value
+            id_threshold = len(self.df)
         for col in cat_cols:
-            nunique = self.df[col].nunique()
+            nunique = distinct[col]
             if nunique == 1:
                 insights.append(f"'{col}' has only one unique value - consider removing")
-            elif nunique == len(self.df):
+            elif nunique >= id_threshold:
                 insights.append(f"'{col}' appears to be a unique identifier")
-            elif nunique < 10:
-                top_val = self.df[col].mode()[0]
-                top_pct = (self.df[col] == top_val).sum() / len(self.df) * 100
+            elif 0 < nunique < 10:
+                top = top_values[col].top(1)
+                top_val, top_count = top['value'].iloc[0], int(top['count'].iloc[0])
+                top_pct = top_count / len(self.df) * 100
                 if top_pct > 50:
-                    insights.append(f"'{col}': '{top_val}' dominates ({top_pct:.1f}% of data)")
+                    ci = ""
+                    if info is not None:
+                        _, lower, upper = proportion_interval(top_count, len(self.df), rows)
+                        ci = f", 95% CI {lower * 100:.1f}–{upper * 100:.1f}%"
+                    insights.append(f"'{col}': '{top_val}' dominates ({top_pct:.1f}% of data{ci})")
         
         # Insight 5: Correlations
         if len(numeric_cols) >= 2:
-            corr_matrix = self.df[numeric_cols].corr()
-            for i in range(len(numeric_cols)):
-                for j in range(i+1, len(numeric_cols)):
-                    corr_val = corr_matrix.iloc[i, j]
-                    if abs(corr_val) > 0.8:
-                        col1, col2 = numeric_cols[i], numeric_cols[j]
-                        insights.append(f"Strong correlation between '{col1}' and '{col2}' ({corr_val:.2f})")
+            corr_matrix = correlation_matrix(self.df[numeric_cols], intervals=info is not None)
+            lower, upper = corr_matrix.attrs.get('ci_lower'), corr_matrix.attrs.get('ci_upper')
+            for col1, col2, corr_val in strong_pairs(corr_matrix, 0.8).itertuples(index=False):
+                ci = "" if lower is None else \
+                    f", 95% CI {lower.loc[col1, col2]:.2f}–{upper.loc[col1, col2]:.2f}"
+                insights.append(f"Strong correlation between '{col1}' and '{col2}' ({corr_val:.2f}{ci})")
+        
+        # Insight 6: Associations between categorical columns (identifiers excluded)
+        assoc_cols = [col for col in cat_cols if 1 < distinct[col] < id_threshold]
+        if len(assoc_cols) >= 2:
+            assoc_matrix = association_matrix(self.df, assoc_cols, bias_correction=True)
+            for col1, col2, value in strong_pairs(assoc_matrix, 0.8).itertuples(index=False):
+                insights.append(f"Strong association between '{col1}' and '{col2}' "
+                                f"(Cramér's V={value:.2f})")
         
         # Print insights
         print(f"\n🔍 Found {len(insights)} insights:\n")
@@ -412,7 +641,8 @@ class KuyaInsights:
         
         return insights
     
-    def compare_groups(self, group_col, value_col):
+    @profiled
+    def compare_groups(self, group_col, value_col, test='anova', alpha=0.05):
         """
         Compare groups and find significant differences.
         
@@ -422,23 +652,41 @@ class KuyaInsights:
             Column to group by
         value_col : str
             Column to analyze
+        test : str, default='anova'
+            Significance test: 'anova' (F-test from the group statistics)
+            or 'kruskal' (Kruskal-Wallis on ranks, robust to skew)
+        alpha : float, default=0.05
+            Significance level
         
         Returns:
         --------
-        pd.DataFrame: Group statistics
+        pd.DataFrame: Group statistics (attrs['test'] holds the test result)
         """
-        stats = self.df.groupby(group_col)[value_col].agg([
-            ('count', 'count'),
-            ('mean', 'mean'),
-            ('median', 'median'),
-            ('std', 'std'),
-            ('min', 'min'),
-            ('max', 'max')
-        ]).round(2)
+        _check_test(test)
+        # One group index serves the statistics and the test
+        index = group_index(self.df, group_col)
+        aggregates = index.aggregate(self.df[[value_col]],
+                                     ['count', 'mean', 'median', 'std', 'min', 'max'])
+        stats = aggregates[value_col]
+        if test == 'anova':
+            result = group_tests(self.df, group_col, [value_col], aggregates=aggregates)
+        else:
+            result = group_tests(self.df, group_col, [value_col], test='kruskal', index=index)
+        result = result.iloc[0]
+        stats = stats.round(2)
+        stats.attrs['test'] = {'test': test, **result.to_dict()}
         
         print(f"📊 Group Analysis: {value_col} by {group_col}")
         print(stats)
         
+        name = 'ANOVA F' if test == 'anova' else 'Kruskal-Wallis H'
+        if pd.isna(result['p_value']):
+            print(f"\n🧪 {name}: not enough groups or rows to test")
+        else:
+            verdict = "significant" if result['p_value'] < alpha else "no significant"
+            print(f"\n🧪 {name} = {result['statistic']:.2f}, p = {result['p_value']:.3g} "
+                  f"→ {verdict} difference between groups")
+        
         # Find significant differences
         overall_mean = self.df[value_col].mean()
         print(f"\n💡 Insights:")
@@ -448,12 +696,122 @@ class KuyaInsights:
             if abs(diff_pct) > 20:
                 direction = "above" if diff_pct > 0 else "below"
                 print(f"  • {group}: {abs(diff_pct):.1f}% {direction} average")
-        
+
         return stats
 
+    @profiled
+    def compare_all_groups(self, group_cols=None, value_cols=None, threshold=20,
+                           max_groups=50, n_jobs=None, test='anova', alpha=0.05):
+        """
+        Compare every categorical column's groups on every numeric column.
+
+        Each group column is aggregated in a single pass over all value
+        columns at once (through one group index per column), and groups more
+        than `threshold` percent away from the overall mean are flagged in
+        one vectorized step.
+
+        Parameters:
+        -----------
+        group_cols : list, optional
+            Columns to group by. Defaults to object and category columns
+        value_cols : list, optional
+            Columns to analyze. Defaults to numeric columns
+        threshold : float, default=20
+            Deviation from the overall mean (in %) that flags a group
+        max_groups : int, default=50
+            Skip group columns with more distinct values than this
+            (identifiers, free text). None keeps every column
+        n_jobs : int, optional
+            Threads used across group columns. Defaults to one
+        test : str, default='anova'
+            Significance test per (group column, value column): 'anova'
+            (F-test taken from the same aggregates) or 'kruskal'
+            (Kruskal-Wallis, with the value columns ranked once)
+        alpha : float, default=0.05
+            Significance level; only significant deviations are reported
+
+        Returns:
+        --------
+        pd.DataFrame
+            One row per (group column, group, value column): count, mean,
+            median, std, min, max, 'diff_pct' from the overall mean,
+            'flagged' (beyond the threshold), the test's 'statistic' and
+            'p_value', and 'significant'
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if group_cols is None:
+            group_cols = self.df.select_dtypes(include=['object', 'category']).columns
+        if value_cols is None:
+            value_cols = self.df.select_dtypes(include=[np.number]).columns
+        group_cols = [col for col in group_cols if col not in set(value_cols)]
+        value_cols = list(value_cols)
+
+        _check_test(test)
+        overall = self.df[value_cols].mean()
+        ranked = _ranked(self.df[value_cols]) if test == 'kruskal' and group_cols else None
+
+        def run(group_col):
+            # Each group column is factorized once, for its statistics and test
+            index = group_index(self.df, group_col)
+            if max_groups is not None and index.n_groups > max_groups:
+                return None
+            stats = index.aggregate(self.df[value_cols],
+                                    ['count', 'mean', 'median', 'std', 'min', 'max'])
+            if test == 'anova':
+                tests = group_tests(self.df, group_col, value_cols, aggregates=stats)
+            else:
+                tests = _kruskal(index, self.df[value_cols], ranked)
+            # (group, value column) rows with one column per statistic
+            stats = pd.concat({col: stats[col] for col in value_cols}, names=['value_col', 'group'])
+            stats = stats.reset_index()
+            stats.insert(0, 'group_col', group_col)
+            tests = tests.reindex(stats['value_col'])
+            stats['statistic'] = tests['statistic'].to_numpy()
+            stats['p_value'] = tests['p_value'].to_numpy()
+            return stats
+
+        if n_jobs and n_jobs > 1 and len(group_cols) > 1:
+            with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+                frames = list(pool.map(run, group_cols))
+        else:
+            frames = [run(col) for col in group_cols]
+        frames = [frame for frame in frames if frame is not None]
+
+        print(f"📊 Group Analysis: {len(value_cols)} value columns by {len(frames)} group columns")
+
+        columns = ['group_col', 'group', 'value_col', 'count', 'mean', 'median', 'std',
+                   'min', 'max', 'diff_pct', 'flagged', 'statistic', 'p_value', 'significant']
+        if not frames or not value_cols:
+            print("\n💡 No categorical and numeric columns to compare")
+            return pd.DataFrame(columns=columns)
+
+        result = pd.concat(frames, ignore_index=True)
+        base = overall.reindex(result['value_col']).to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            diff_pct = (result['mean'].to_numpy() - base) / base * 100
+        result['diff_pct'] = diff_pct
+        result['flagged'] = np.abs(diff_pct) > threshold
+        result['significant'] = result['p_value'].to_numpy() < alpha
+        result = result[columns]
+
+        flagged = result[result['flagged'] & result['significant']]
+        print(f"\n💡 Insights: {len(flagged)} groups differ significantly by more than "
+              f"{threshold}% from the average")
+        order = np.argsort(-np.abs(flagged['diff_pct'].to_numpy()), kind='stable')
+        for row in flagged.iloc[order[:20]].itertuples(index=False):
+            direction = "above" if row.diff_pct > 0 else "below"
+            print(f"  • {row.group_col}={row.group}: {row.value_col} "
+                  f"{abs(row.diff_pct):.1f}% {direction} average (p = {row.p_value:.3g})")
+        if len(flagged) > 20:
+            print(f"  ... and {len(flagged) - 20} more")
+
+        return result
+
 
 # Convenience Functions
 
+@profiled
 def quick_clean(df, handle_missing='auto', handle_outliers=True, 
                 standardize_cols=True, fix_types=True):
     """
@@ -487,7 +845,7 @@ def quick_clean(df, handle_missing='auto', handle_outliers=True,
     # Step 1: Standardize columns
     if standardize_cols:
         print("\n📝 Step 1/4: Standardizing column names...")
-        df_clean = df_clean.standardize_columns()
+        df_clean = df_clean.standardize_columns(copy=False)  # df_clean is already a copy
     
     # Step 2: Fix data types
     if fix_types:
@@ -496,33 +854,32 @@ def quick_clean(df, handle_missing='auto', handle_outliers=True,
     
     # Step 3: Handle missing values
     print("\n🔍 Step 3/4: Handling missing values...")
-    missing_before = df_clean.isnull().sum().sum()
-    
-    if handle_missing == 'auto':
-        # Smart detection: if < 5% missing, fill; otherwise drop
-        missing_pct = (missing_before / (df_clean.shape[0] * df_clean.shape[1])) * 100
-        if missing_pct < 5:
-            # Fill numeric with median, categorical with mode
-            numeric_cols = df_clean.select_dtypes(include=[np.number]).columns
-            for col in numeric_cols:
-                if df_clean[col].isnull().any():
-                    df_clean[col] = df_clean[col].fillna(df_clean[col].median())
-            
-            categorical_cols = df_clean.select_dtypes(include=['object']).columns
-            for col in categorical_cols:
-                if df_clean[col].isnull().any():
-                    mode_val = df_clean[col].mode()
-                    if len(mode_val) > 0:
-                        df_clean[col] = df_clean[col].fillna(mode_val[0])
-            print(f"  ✓ Filled {missing_before} missing values intelligently")
-        else:
+    with step('quick_clean.handle_missing', df_clean):
+        missing_counts = df_clean.isnull().sum()
+        missing_before = int(missing_counts.sum())
+    
+        if handle_missing == 'auto':
+            # Smart detection: if < 5% missing, fill; otherwise drop
+            missing_pct = (missing_before / (df_clean.shape[0] * df_clean.shape[1])) * 100
+            if missing_pct < 5:
+                # Fill numeric with median, categorical with mode (one fillna pass)
+                has_nulls = set(missing_counts.index[missing_counts > 0])
+                numeric_cols = [col for col in df_clean.select_dtypes(include=[np.number]).columns
+                                if col in has_nulls]
+                categorical_cols = [col for col in df_clean.select_dtypes(include=['object']).columns
+                                    if col in has_nulls]
+                df_clean = df_clean.fillna(
+                    _fill_values(df_clean, numeric_cols, categorical_cols, strategy='median')
+                )
+                print(f"  ✓ Filled {missing_before} missing values intelligently")
+            else:
+                df_clean = df_clean.dropna()
+                print(f"  ✓ Dropped rows with missing values ({missing_pct:.1f}% missing)")
+        elif handle_missing == 'drop':
             df_clean = df_clean.dropna()
-            print(f"  ✓ Dropped rows with missing values ({missing_pct:.1f}% missing)")
-    elif handle_missing == 'drop':
-        df_clean = df_clean.dropna()
-        print(f"  ✓ Dropped rows with missing values")
-    elif handle_missing == 'fill':
-        df_clean = df_clean.clean_missing(method='fill')
+            print(f"  ✓ Dropped rows with missing values")
+        elif handle_missing == 'fill':
+            df_clean = df_clean.clean_missing(method='fill')
     
     # Convert back to KuyaDataFrame after fillna
     df_clean = KuyaDataFrame(df_clean)
@@ -541,7 +898,8 @@ def quick_clean(df, handle_missing='auto', handle_outliers=True,
     return df_clean
 
 
-def smart_analysis(df):
+@profiled
+def smart_analysis(df, approx=False, error=0.01):
     """
     Automated intelligent analysis with AI-like insights.
     
@@ -549,6 +907,10 @@ def smart_analysis(df):
     -----------
     df : pd.DataFrame
         DataFrame to analyze
+    approx : bool or dict, default=False
+        Use HyperLogLog distinct counts (or a {column: HyperLogLog} dict)
+    error : float, default=0.01
+        Relative error of the approximate counts
     
     Returns:
     --------
@@ -593,14 +955,8 @@ def smart_analysis(df):
     # Analyze correlations
     numeric_cols = df.select_dtypes(include=[np.number]).columns
     if len(numeric_cols) >= 2:
-        corr_matrix = df[numeric_cols].corr()
-        high_corr = []
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i+1, len(corr_matrix.columns)):
-                if abs(corr_matrix.iloc[i, j]) > 0.8:
-                    high_corr.append((corr_matrix.columns[i], 
-                                     corr_matrix.columns[j], 
-                                     corr_matrix.iloc[i, j]))
+        corr_matrix = correlation_matrix(df[numeric_cols])
+        high_corr = list(strong_pairs(corr_matrix, 0.8).itertuples(index=False))
         
         if high_corr:
             insights['highlights'].append(
@@ -610,15 +966,16 @@ def smart_analysis(df):
                 insights['highlights'].append(f"   • {col1} ↔ {col2}: {corr:.3f}")
     
     # Analyze unique values
+    distinct = distinct_counts(df, approx=approx, error=error)
     for col in df.columns:
-        unique_pct = (df[col].nunique() / len(df)) * 100
+        unique_pct = (distinct[col] / len(df)) * 100
         if unique_pct > 95:
             insights['warnings'].append(
                 f"🔑 '{col}' might be an ID column ({unique_pct:.0f}% unique)"
             )
-        elif unique_pct < 5 and df[col].nunique() > 1:
+        elif unique_pct < 5 and distinct[col] > 1:
             insights['highlights'].append(
-                f"📊 '{col}' has low cardinality ({df[col].nunique()} unique values) - good for grouping"
+                f"📊 '{col}' has low cardinality ({distinct[col]} unique values) - good for grouping"
             )
     
     # Summary statistics
@@ -661,7 +1018,9 @@ def smart_analysis(df):
     return insights
 
 
-def auto_report(df, output_path='kuya_report', format='txt'):
+@profiled
+def auto_report(df, output_path='kuya_report', format='txt', approx=False, error=0.01,
+                bitmap=None):
     """
     Generate an automated analysis report.
     
@@ -673,6 +1032,12 @@ def auto_report(df, output_path='kuya_report', format='txt'):
         Path for the output report
     format : str
         Report format: 'txt' or 'html'
+    approx : bool or dict, default=False
+        Report HyperLogLog distinct counts (or a {column: HyperLogLog} dict)
+    error : float, default=0.01
+        Relative error of the approximate counts
+    bitmap : NullBitmap, optional
+        Null masks already built for df (see null_bitmap)
     
     Returns:
     --------
@@ -692,9 +1057,9 @@ def auto_report(df, output_path='kuya_report', format='txt'):
         output_path = f"{output_path}.{format}"
     
     if format == 'txt':
-        _generate_txt_report(df, output_path)
+        _generate_txt_report(df, output_path, approx, error, bitmap)
     elif format == 'html':
-        _generate_html_report(df, output_path)
+        _generate_html_report(df, output_path, approx, error, bitmap)
     else:
         raise ValueError("Format must be 'txt' or 'html'")
     
@@ -702,10 +1067,15 @@ def auto_report(df, output_path='kuya_report', format='txt'):
     return output_path
 
 
-def _generate_txt_report(df, output_path):
+@profiled
+def _generate_txt_report(df, output_path, approx=False, error=0.01, bitmap=None):
     """Generate a text report."""
     from datetime import datetime
     
+    distinct = distinct_counts(df, approx=approx, error=error)
+    missing = null_counts(df, bitmap)
+    unique_label = "Unique" if approx is False else "Unique (approx.)"
+    
     with open(output_path, 'w') as f:
         f.write("=" * 70 + "\n")
         f.write("KUYA AUTOMATED DATA ANALYSIS REPORT\n")
@@ -725,8 +1095,8 @@ def _generate_txt_report(df, output_path):
         for col in df.columns:
             f.write(f"\n{col}:\n")
             f.write(f"  Type: {df[col].dtype}\n")
-            f.write(f"  Missing: {df[col].isnull().sum()} ({df[col].isnull().sum()/len(df)*100:.1f}%)\n")
-            f.write(f"  Unique: {df[col].nunique()}\n")
+            f.write(f"  Missing: {missing[col]} ({missing[col]/len(df)*100:.1f}%)\n")
+            f.write(f"  {unique_label}: {distinct[col]}\n")
         
         # Numeric summary
         numeric_cols = df.select_dtypes(include=[np.number]).columns
@@ -735,11 +1105,23 @@ def _generate_txt_report(df, output_path):
             f.write("-" * 70 + "\n")
             f.write(df[numeric_cols].describe().to_string())
         
+        # Categorical summary: top values from one heavy-hitter pass per column
+        categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+        if len(categorical_cols) > 0:
+            f.write("\n\n4. CATEGORICAL COLUMNS (top values)\n")
+            f.write("-" * 70 + "\n")
+            top_values = sketch_columns(df, categorical_cols, kind='topk')
+            for col in categorical_cols:
+                top = top_values[col].top(3)
+                values = ", ".join(f"{value} ({count / len(df) * 100:.1f}%)"
+                                   for value, count in zip(top['value'], top['count']))
+                f.write(f"{col}: {values or 'N/A'}\n")
+        
         # Correlations
         if len(numeric_cols) >= 2:
-            f.write("\n\n4. CORRELATIONS\n")
+            f.write("\n\n5. CORRELATIONS\n")
             f.write("-" * 70 + "\n")
-            corr = df[numeric_cols].corr()
+            corr = correlation_matrix(df[numeric_cols])
             f.write(corr.to_string())
         
         f.write("\n\n" + "=" * 70 + "\n")
@@ -747,9 +1129,31 @@ def _generate_txt_report(df, output_path):
         f.write("=" * 70 + "\n")
 
 
-def _generate_html_report(df, output_path):
+def _histogram_svg(histogram, width=240, height=60):
+    """Inline SVG bar chart of a Histogram's counts, for HTML reports."""
+    if histogram.counts is None or histogram.counts.max() == 0:
+        return ""
+    counts = histogram.counts
+    bar = width / len(counts)
+    bars = "".join(
+        f'<rect x="{i * bar:.1f}" y="{height - h:.1f}" width="{max(bar - 1, 0.5):.1f}" '
+        f'height="{h:.1f}"><title>{histogram.edges[i]:.4g} – {histogram.edges[i + 1]:.4g}: '
+        f'{count:,}</title></rect>'
+        for i, (count, h) in enumerate(zip(counts, counts / counts.max() * height))
+    )
+    return (f'<svg width="{width}" height="{height}" fill="#3498db" '
+            f'xmlns="http://www.w3.org/2000/svg">{bars}</svg>')
+
+
+@profiled
+def _generate_html_report(df, output_path, approx=False, error=0.01, bitmap=None):
     """Generate an HTML report."""
     from datetime import datetime
+    from html import escape
+    
+    distinct = distinct_counts(df, approx=approx, error=error)
+    missing = null_counts(df, bitmap)
+    unique_label = "Unique" if approx is False else "Unique (approx.)"
     
     html = f"""
     <!DOCTYPE html>
@@ -796,18 +1200,18 @@ def _generate_html_report(df, output_path):
                     <th>Column</th>
                     <th>Type</th>
                     <th>Missing</th>
-                    <th>Unique</th>
+                    <th>{unique_label}</th>
                 </tr>
     """
     
     for col in df.columns:
-        missing_pct = df[col].isnull().sum() / len(df) * 100
+        missing_pct = missing[col] / len(df) * 100
         html += f"""
                 <tr>
                     <td>{col}</td>
                     <td>{df[col].dtype}</td>
-                    <td>{df[col].isnull().sum()} ({missing_pct:.1f}%)</td>
-                    <td>{df[col].nunique()}</td>
+                    <td>{missing[col]} ({missing_pct:.1f}%)</td>
+                    <td>{distinct[col]}</td>
                 </tr>
         """
     
@@ -820,9 +1224,57 @@ def _generate_html_report(df, output_path):
     numeric_cols = df.select_dtypes(include=[np.number]).columns
     if len(numeric_cols) > 0:
         html += df[numeric_cols].describe().to_html()
+        # Distributions: one np.histogram pass per column, drawn as inline SVG
+        histograms = sketch_columns(df, numeric_cols, kind='histogram')
+        html += """
+            <h2>Distributions</h2>
+            <table>
+                <tr>
+                    <th>Column</th>
+                    <th>Histogram</th>
+                    <th>Range</th>
+                </tr>
+        """
+        for col in numeric_cols:
+            histogram = histograms[col]
+            html += f"""
+                <tr>
+                    <td>{escape(str(col))}</td>
+                    <td>{_histogram_svg(histogram) or 'N/A'}</td>
+                    <td>{histogram.min:.4g} – {histogram.max:.4g}</td>
+                </tr>
+            """
+        html += """
+            </table>
+        """
     else:
         html += "<p>No numeric columns found.</p>"
     
+    categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+    if len(categorical_cols) > 0:
+        top_values = sketch_columns(df, categorical_cols, kind='topk')
+        html += """
+            <h2>Categorical Summary</h2>
+            <table>
+                <tr>
+                    <th>Column</th>
+                    <th>Top Values</th>
+                </tr>
+        """
+        for col in categorical_cols:
+            top = top_values[col].top(3)
+            values = ", ".join(f"{escape(str(value))} ({count / len(df) * 100:.1f}%)"
+                               for value, count in zip(top['value'], top['count']))
+            html += f"""
+                <tr>
+                    <td>{escape(str(col))}</td>
+                    <td>{values or 'N/A'}</td>
+                </tr>
+            """
+        html += """
+            </table>
+        """
+    
     html += """
         </div>
     </body>
@@ -5,7 +5,442 @@ Handles messy data like missing values, outliers, and column standardization.
 
 import pandas as pd
 import numpy as np
+import functools
 import re
+import warnings
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.0
+    try:
+        from pandas.core.tools.datetimes import guess_datetime_format
+    except ImportError:
+        guess_datetime_format = None
+
+from kuya.profiling import profiled
+from kuya.sketches import block_quantiles
+from kuya.groups import group_index
+
+
+# pandas >= 2 infers one format from the first value unless asked to
+# parse each value separately, as pandas 1.x always did
+_MIXED_FORMAT = 'mixed' if int(pd.__version__.split('.')[0]) >= 2 else None
+
+_SPECIAL_CHARS = re.compile(r'[^\w\s]')
+_SEPARATORS = re.compile(r'[\s_]+')
+
+
+@functools.lru_cache(maxsize=65536)
+def _standardize_text(name):
+    name = _SPECIAL_CHARS.sub('', name.lower())  # Remove special characters
+    name = _SEPARATORS.sub('_', name)            # Spaces/underscores → single underscore
+    return name.strip('_')                       # Remove leading/trailing underscores
+
+
+def _standardize_name(col):
+    """Lowercase, underscored version of a column label (cached)."""
+    return _standardize_text(str(col))
+
+
+def _shallow_select(df, columns):
+    """
+    Column subset that shares data with df instead of copying it.
+
+    Falls back to a regular (copying) selection for duplicate labels.
+    """
+    columns = list(columns)
+    if df.columns.is_unique and len(set(columns)) == len(columns):
+        return pd.DataFrame({col: df[col] for col in columns}, index=df.index, copy=False)
+    return df.loc[:, columns]
+
+
+def _category_codes(series):
+    """Integer codes (-1 = missing) and unique values of a column."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    return pd.factorize(series)
+
+
+def _normalize_labels(values, case='lower', accents=True, synonyms=None):
+    """
+    Normalize unique category labels (not rows).
+
+    Strings are trimmed, inner whitespace collapsed, accents removed and case
+    folded; empty strings become missing. Synonyms are matched and rewritten
+    after normalization. Non-string values are left alone.
+    """
+    labels = pd.Series(values, dtype=object)
+    is_text = labels.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+    text = labels[is_text].astype(str).str.strip().str.replace(r'\s+', ' ', regex=True)
+    if accents:
+        text = text.str.normalize('NFKD').str.replace(r'[\u0300-\u036f]', '', regex=True)
+    if case is not None:
+        text = getattr(text.str, case)()
+    if synonyms:
+        lookup = dict(zip(_normalize_labels(list(synonyms), case, accents),
+                          _normalize_labels(list(synonyms.values()), case, accents)))
+        text = text.map(lambda v: lookup.get(v, v))
+    labels[is_text] = text.mask(text == '')
+    return labels.to_numpy(dtype=object)
+
+
+def _invalid_fraction(converted, original):
+    """Fraction of non-null values in original that failed to convert."""
+    valid = original.notna()
+    total = int(valid.sum())
+    if total == 0:
+        return 0.0
+    return float((converted.isna() & valid).sum()) / total
+
+
+def _coerced_note(converted, original):
+    """Short note on how many values were coerced to missing, if any."""
+    coerced = int((converted.isna() & original.notna()).sum())
+    return f" ({coerced} invalid values coerced)" if coerced else ""
+
+
+def _convert_column(column, parser, max_invalid_fraction):
+    """
+    Parse a full column once, or return None if it does not convert.
+
+    With no tolerance the parser raises on the first bad value; otherwise bad
+    values are coerced and the column is rejected only if too many failed.
+    """
+    try:
+        if max_invalid_fraction <= 0:
+            return parser(column, errors='raise')
+        converted = parser(column, errors='coerce')
+    except (ValueError, TypeError, OverflowError):
+        return None
+    if _invalid_fraction(converted, column) > max_invalid_fraction:
+        return None
+    return converted
+
+
+def _to_datetime(fmt):
+    """pd.to_datetime with a fixed format (None lets pandas infer per value)."""
+    def parser(values, errors='raise'):
+        if fmt:
+            return pd.to_datetime(values, format=fmt, errors=errors)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            return pd.to_datetime(values, format=_MIXED_FORMAT, errors=errors)
+    return parser
+
+
+def _sample_datetime_format(sample, max_invalid_fraction=0.0):
+    """
+    Find a datetime format that parses the sample.
+
+    Returns the format string, None if the sample parses but no single format
+    was found, or False if the sample is not datetime-like at all.
+    """
+    strings = sample[sample.map(type) == str]
+    
+    candidates = []
+    if guess_datetime_format is not None and len(strings) > 0:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            guesses = pd.Series([guess_datetime_format(v) for v in strings.iloc[:20]],
+                                dtype=object).dropna()
+        if len(guesses) > 0:
+            candidates.extend(guesses.value_counts().index.tolist())
+    
+    for fmt in candidates:
+        try:
+            parsed = pd.to_datetime(sample, format=fmt, errors='coerce')
+        except (ValueError, TypeError):
+            continue
+        if _invalid_fraction(parsed, sample) <= max_invalid_fraction:
+            return fmt
+    
+    parsed = _to_datetime(None)(sample, errors='coerce')
+    if _invalid_fraction(parsed, sample) <= max_invalid_fraction:
+        return None
+    return False
+
+
+def _outlier_bounds(block, method='iqr', threshold=1.5, quantiles='exact', error=0.01):
+    """
+    Lower/upper outlier bounds for every column of a numeric block.
+
+    IQR bounds come from a single quantile([0.25, 0.75]) call over the block
+    (or from quantile sketches, see kuya.sketches.block_quantiles); z-score
+    bounds from one mean/std reduction (population std, like
+    scipy.stats.zscore). Returns two Series indexed by column.
+    """
+    if method == 'iqr':
+        quartiles = block_quantiles(block, [0.25, 0.75], quantiles, error)
+        q1, q3 = quartiles.iloc[0], quartiles.iloc[1]
+        iqr = q3 - q1
+        return q1 - threshold * iqr, q3 + threshold * iqr
+    elif method == 'zscore':
+        mean = block.mean()
+        std = block.std(ddof=0)
+        # Constant columns have no outliers
+        spread = (threshold * std).where(std > 0, np.inf)
+        return mean - spread, mean + spread
+    raise ValueError("method must be 'iqr' or 'zscore'")
+
+
+def _group_codes(df, by):
+    """Integer group code per row (-1 where a key is missing) and group count."""
+    index = group_index(df, by)
+    return index.codes, index.n_groups
+
+
+def _group_outlier_bounds(block, codes, n_groups, method='iqr', threshold=1.5):
+    """
+    Row-aligned lower/upper bounds computed separately for every group.
+
+    One groupby quantile (or mean/std) pass over all target columns gives a
+    (groups × columns) table that is expanded to rows through the group
+    codes. Rows without a group get NaN bounds (never outliers).
+    """
+    valid = codes >= 0
+    grouped = block[valid].groupby(codes[valid], sort=True)
+    groups = pd.RangeIndex(n_groups)
+    if method == 'iqr':
+        quartiles = grouped.quantile([0.25, 0.75])
+        q1 = quartiles.xs(0.25, level=-1).reindex(groups)
+        q3 = quartiles.xs(0.75, level=-1).reindex(groups)
+        iqr = q3 - q1
+        lower, upper = q1 - threshold * iqr, q3 + threshold * iqr
+    elif method == 'zscore':
+        mean = grouped.mean().reindex(groups)
+        std = grouped.std(ddof=0).reindex(groups)
+        spread = (threshold * std).where(std > 0, np.inf)
+        lower, upper = mean - spread, mean + spread
+    else:
+        raise ValueError("method must be 'iqr' or 'zscore' when grouping with by=")
+
+    row_lower = np.full(block.shape, np.nan)
+    row_upper = np.full(block.shape, np.nan)
+    row_lower[valid] = lower.to_numpy(dtype=float)[codes[valid]]
+    row_upper[valid] = upper.to_numpy(dtype=float)[codes[valid]]
+    return row_lower, row_upper
+
+
+def _outlier_mask(block, lower, upper):
+    """
+    Boolean (rows × columns) array of values outside [lower, upper].
+
+    Bounds are per-column Series or row-aligned (rows × columns) arrays.
+    """
+    values = block.to_numpy(dtype=float, na_value=np.nan)
+    lo = np.asarray(lower, dtype=float)
+    hi = np.asarray(upper, dtype=float)
+    with np.errstate(invalid='ignore'):
+        return (values < lo) | (values > hi)
+
+
+def _clip_block(block, lower, upper):
+    """Winsorize a numeric block to its bounds; NaN bounds leave values as is."""
+    values = block.to_numpy(dtype=float, na_value=np.nan)
+    lo = np.broadcast_to(np.asarray(lower, dtype=float), values.shape)
+    hi = np.broadcast_to(np.asarray(upper, dtype=float), values.shape)
+    with np.errstate(invalid='ignore'):
+        clipped = np.where(values < lo, lo, np.where(values > hi, hi, values))
+    return pd.DataFrame(clipped, index=block.index, columns=block.columns)
+
+
+def _batches(n_rows, batch_size):
+    """(start, stop) row ranges covering n_rows in batches."""
+    for start in range(0, n_rows, batch_size):
+        yield start, min(start + batch_size, n_rows)
+
+
+def _block_batch(block, start, stop):
+    """Rows [start, stop) of a numeric block as a float array (NaN for missing)."""
+    return block.iloc[start:stop].to_numpy(dtype=float, na_value=np.nan)
+
+
+def _location_scatter(block, batch_size):
+    """
+    Mean and covariance of the complete rows of a numeric block.
+
+    Accumulates shifted sums and cross-products batch by batch, so memory
+    stays bounded by batch_size × columns.
+    """
+    n_cols = block.shape[1]
+    shift = None
+    count = 0
+    sums = np.zeros(n_cols)
+    cross = np.zeros((n_cols, n_cols))
+    for start, stop in _batches(len(block), batch_size):
+        values = _block_batch(block, start, stop)
+        incomplete = np.isnan(values).any(axis=1)
+        if incomplete.any():
+            values = values[~incomplete]
+        if len(values) == 0:
+            continue
+        if shift is None:
+            shift = values.mean(axis=0)
+        values = values - shift
+        count += len(values)
+        sums += values.sum(axis=0)
+        cross += values.T @ values
+    if count < 2:
+        return None, None
+    mean_shifted = sums / count
+    cov = (cross - count * np.outer(mean_shifted, mean_shifted)) / (count - 1)
+    return mean_shifted + shift, cov
+
+
+def _robust_location_scatter(block, support_fraction=0.75, max_sample=100_000,
+                             n_steps=30, seed=0):
+    """
+    Robust mean and covariance with MCD-style concentration steps.
+
+    Works on a row sample: starting from the classical estimate, repeatedly
+    refit on the support_fraction of rows closest to the current fit, then
+    rescale the covariance to be consistent under normality.
+    """
+    from scipy import stats
+
+    values = block.to_numpy(dtype=float, na_value=np.nan) if len(block) <= max_sample else \
+        block.sample(n=max_sample, random_state=seed).to_numpy(dtype=float, na_value=np.nan)
+    values = values[~np.isnan(values).any(axis=1)]
+    n_rows, n_cols = values.shape
+    if n_rows <= n_cols:
+        return None, None
+
+    h = max(int(n_rows * support_fraction), n_cols + 1)
+    mean = values.mean(axis=0)
+    cov = np.cov(values, rowvar=False).reshape(n_cols, n_cols)
+    support = None
+    for _ in range(n_steps):
+        centered = values - mean
+        d2 = np.einsum('ij,ij->i', centered @ np.linalg.pinv(cov), centered)
+        new_support = np.argpartition(d2, h - 1)[:h]
+        if support is not None and np.array_equal(np.sort(new_support), np.sort(support)):
+            break
+        support = new_support
+        mean = values[support].mean(axis=0)
+        cov = np.cov(values[support], rowvar=False).reshape(n_cols, n_cols)
+
+    centered = values - mean
+    d2 = np.einsum('ij,ij->i', centered @ np.linalg.pinv(cov), centered)
+    cov = cov * np.median(d2) / stats.chi2.ppf(0.5, n_cols)
+    return mean, cov
+
+
+def _mahalanobis_distances(block, robust=False, batch_size=250_000):
+    """
+    Mahalanobis distance of every row of a numeric block.
+
+    The fit and the distances are computed batch by batch with matrix
+    products. Rows with missing values get NaN (never outliers).
+    """
+    if robust:
+        mean, cov = _robust_location_scatter(block)
+    else:
+        mean, cov = _location_scatter(block, batch_size)
+    distances = np.full(len(block), np.nan)
+    if mean is None:
+        return distances
+
+    precision = np.linalg.pinv(cov)
+    for start, stop in _batches(len(block), batch_size):
+        centered = _block_batch(block, start, stop) - mean
+        d2 = np.einsum('ij,ij->i', centered @ precision, centered)
+        distances[start:stop] = np.sqrt(np.maximum(d2, 0))
+    return distances
+
+
+def _pack_flags(mask):
+    """
+    Pack a (rows × columns) boolean mask into one compact integer per row.
+
+    Bit i is column i. Uses the smallest unsigned dtype that fits; beyond 64
+    columns each row holds the little-endian packed bytes instead.
+    """
+    n_rows, n_cols = mask.shape
+    packed = np.packbits(mask, axis=1, bitorder='little')
+    if n_cols > 64:
+        return [row.tobytes() for row in packed]
+    padded = np.zeros((n_rows, 8), dtype=np.uint8)
+    padded[:, :packed.shape[1]] = packed
+    flags = padded.view('<u8').ravel()
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if n_cols <= np.iinfo(dtype).bits:
+            return flags.astype(dtype)
+    return flags
+
+
+def _factorized_mode(codes, uniques):
+    """Most frequent of `uniques` given factorize codes (-1 = missing), or None."""
+    codes = codes[codes >= 0]
+    if len(codes) == 0:
+        return None
+    counts = np.bincount(codes)
+    tied = np.flatnonzero(counts == counts.max())
+    if len(tied) == 1:
+        return uniques[tied[0]]
+    try:
+        return pd.Series(uniques[tied]).sort_values().iloc[0]
+    except TypeError:
+        return uniques[tied[0]]
+
+
+def _column_mode(series):
+    """
+    Most frequent non-null value of a Series, or None if it is all null.
+
+    Uses a single hash factorization plus bincount instead of
+    value_counts()/mode(). Ties resolve to the smallest value, like mode()[0].
+    """
+    return _factorized_mode(*pd.factorize(series))
+
+
+def _fill_values(df, numeric_cols, other_cols, strategy='mean'):
+    """
+    Compute fill values for many columns at once.
+
+    Numeric means/medians are one reduction over the numeric block; modes
+    use _column_mode. Returns a {column: value} dict for DataFrame.fillna.
+    """
+    values = {}
+    if numeric_cols:
+        if strategy == 'mean':
+            stats = df[numeric_cols].mean()
+        elif strategy == 'median':
+            stats = df[numeric_cols].median()
+        else:
+            stats = pd.Series({col: _column_mode(df[col]) for col in numeric_cols}, dtype=object)
+        values.update(stats.dropna().to_dict())
+    for col in other_cols:
+        mode_val = _column_mode(df[col])
+        if mode_val is not None:
+            values[col] = mode_val
+    return values
+
+
+def _group_fill_values(df, by, numeric_cols, other_cols, strategy='mean'):
+    """
+    Compute row-aligned group-wise fill values from one group index.
+
+    Returns a DataFrame indexed like df for DataFrame.fillna. Rows whose group
+    has no observed value stay NaN so the caller can fall back to overall stats.
+    Group modes resolve ties to the smallest value, like _column_mode.
+    """
+    index = group_index(df, by)
+    frames = []
+    if numeric_cols and strategy in ('mean', 'median'):
+        table = index.aggregate(df[numeric_cols], [strategy]).droplevel(1, axis=1)
+        frames.append(index.expand(table))
+    elif numeric_cols:
+        other_cols = list(numeric_cols) + list(other_cols)
+
+    for col in other_cols:
+        # Most frequent value per group from one count over (group, value) pairs
+        frames.append(index.expand(index.mode(df[col])).to_frame(col))
+
+    if not frames:
+        return pd.DataFrame(index=df.index)
+    values = pd.concat(frames, axis=1)
+    values.index = df.index
+    return values
 
 
 class KuyaCleaner:
@@ -22,7 +457,8 @@ class KuyaCleaner:
         """
         self.df = df
     
-    def clean_missing(self, method='drop', value=None, columns=None):
+    @profiled
+    def clean_missing(self, method='drop', value=None, columns=None, strategy='mean', by=None):
         """
         Drop or fill missing values automatically.
         
@@ -37,6 +473,13 @@ class KuyaCleaner:
             Value to use when method='fill'
         columns : list, optional
             Specific columns to clean. If None, applies to all columns
+        strategy : str, default='mean'
+            How numeric columns are filled when method='fill' and no value is
+            given: 'mean', 'median' or 'mode'. Non-numeric columns always use mode
+        by : str or list, optional
+            Group column(s) for group-wise filling, e.g. by='region' fills each
+            region with its own mean/median/mode. Groups with no observed value
+            fall back to the overall statistic
         
         Returns:
         --------
@@ -44,37 +487,51 @@ class KuyaCleaner:
             Cleaned DataFrame
         """
         from kuya.core import KuyaDataFrame
-        df_copy = self.df.copy()
-        target_cols = columns if columns else df_copy.columns
+        target_cols = list(columns) if columns else self.df.columns.tolist()
         
         if method == 'drop':
-            df_copy = df_copy.dropna(subset=target_cols)
+            df_copy = self.df.dropna(subset=target_cols)
             print(f"✓ Dropped rows with missing values. New shape: {df_copy.shape}")
         elif method == 'fill':
-            # Only fill numeric columns with mean by default
-            numeric_cols = df_copy.select_dtypes(include=[np.number]).columns.tolist()
-            target_numeric = [col for col in target_cols if col in numeric_cols]
-            target_non_numeric = [col for col in target_cols if col not in numeric_cols]
+            if strategy not in ('mean', 'median', 'mode'):
+                raise ValueError("strategy must be 'mean', 'median', or 'mode'")
+            
+            by_cols = [] if by is None else ([by] if isinstance(by, str) else list(by))
+            target_cols = [col for col in target_cols if col not in by_cols]
             
             if value is not None:
-                df_copy[target_cols] = df_copy[target_cols].fillna(value)
+                df_copy = self.df.fillna({col: value for col in target_cols})
                 print(f"✓ Filled missing values with {value}")
             else:
-                # Fill numeric with mean
+                # Only columns that actually have gaps need a fill value
+                null_counts = self.df[target_cols].isna().sum()
+                fill_cols = null_counts.index[null_counts > 0]
+                numeric_cols = set(self.df.select_dtypes(include=[np.number]).columns)
+                target_numeric = [col for col in target_cols if col in numeric_cols]
+                target_non_numeric = [col for col in target_cols if col not in numeric_cols]
+                fill_numeric = [col for col in fill_cols if col in numeric_cols]
+                fill_non_numeric = [col for col in fill_cols if col not in numeric_cols]
+                
+                # One vectorized pass for the overall statistics, one fillna
+                fill_values = _fill_values(self.df, fill_numeric, fill_non_numeric, strategy)
+                if by_cols:
+                    group_values = _group_fill_values(self.df, by_cols, fill_numeric,
+                                                      fill_non_numeric, strategy)
+                    df_copy = self.df.fillna(group_values.fillna(fill_values))
+                else:
+                    df_copy = self.df.fillna(fill_values)
+                
+                suffix = f" by {', '.join(map(str, by_cols))}" if by_cols else ""
                 if target_numeric:
-                    for col in target_numeric:
-                        df_copy[col] = df_copy[col].fillna(df_copy[col].mean())
-                    print(f"✓ Filled {len(target_numeric)} numeric columns with mean")
-                # Fill non-numeric with mode
+                    print(f"✓ Filled {len(target_numeric)} numeric columns with {strategy}{suffix}")
                 if target_non_numeric:
-                    for col in target_non_numeric:
-                        if df_copy[col].mode().shape[0] > 0:
-                            df_copy[col] = df_copy[col].fillna(df_copy[col].mode()[0])
-                    print(f"✓ Filled {len(target_non_numeric)} non-numeric columns with mode")
+                    print(f"✓ Filled {len(target_non_numeric)} non-numeric columns with mode{suffix}")
         elif method == 'ffill':
+            df_copy = self.df.copy()
             df_copy[target_cols] = df_copy[target_cols].fillna(method='ffill')
             print("✓ Forward filled missing values")
         elif method == 'bfill':
+            df_copy = self.df.copy()
             df_copy[target_cols] = df_copy[target_cols].fillna(method='bfill')
             print("✓ Backward filled missing values")
         else:
@@ -82,10 +539,25 @@ class KuyaCleaner:
         
         return KuyaDataFrame(df_copy)
     
-    def fix_dtypes(self):
+    @profiled
+    def fix_dtypes(self, sample_size=1000, max_invalid_fraction=0.0):
         """
         Auto-convert columns to numeric, datetime, etc.
         
+        Each text column is first checked on a random sample so impossible
+        types are rejected without parsing the whole column. Datetime formats
+        are inferred from the sample and used to parse the full column once;
+        if the full column does not fit the format, pandas' own inference is
+        tried before giving up.
+        
+        Parameters:
+        -----------
+        sample_size : int, default=1000
+            Number of rows checked before converting a full column
+        max_invalid_fraction : float, default=0.0
+            Fraction of values allowed to fail conversion. Failing values are
+            coerced to NaN/NaT; with 0.0 a single bad value keeps the column as is
+        
         Returns:
         --------
         pd.DataFrame
@@ -98,22 +570,37 @@ class KuyaCleaner:
         for col in df_copy.columns:
             original_dtype = df_copy[col].dtype
             
+            if original_dtype != 'object':
+                continue
+            
+            column = df_copy[col]
+            sample = column.sample(n=min(sample_size, len(column)), random_state=0).dropna()
+            if len(sample) == 0:
+                continue
+            
             # Try to convert to numeric
-            if df_copy[col].dtype == 'object':
-                try:
-                    df_copy[col] = pd.to_numeric(df_copy[col], errors='raise')
-                    conversions.append(f"{col}: {original_dtype} → numeric")
-                    continue
-                except (ValueError, TypeError):
-                    pass
-                
-                # Try to convert to datetime
-                try:
-                    df_copy[col] = pd.to_datetime(df_copy[col], errors='raise')
-                    conversions.append(f"{col}: {original_dtype} → datetime")
+            if _invalid_fraction(pd.to_numeric(sample, errors='coerce'), sample) <= max_invalid_fraction:
+                converted = _convert_column(column, pd.to_numeric, max_invalid_fraction)
+                if converted is not None:
+                    df_copy[col] = converted
+                    conversions.append(f"{col}: {original_dtype} → numeric"
+                                       + _coerced_note(converted, column))
                     continue
-                except (ValueError, TypeError):
-                    pass
+            
+            # Try to convert to datetime, with a format inferred from the sample
+            fmt = _sample_datetime_format(sample, max_invalid_fraction)
+            if fmt is False:
+                continue
+            converted = _convert_column(column, _to_datetime(fmt), max_invalid_fraction)
+            if converted is None and fmt:
+                # Rows outside the sample may use another layout
+                fmt = None
+                converted = _convert_column(column, _to_datetime(None), max_invalid_fraction)
+            if converted is not None:
+                df_copy[col] = converted
+                conversions.append(f"{col}: {original_dtype} → datetime"
+                                   + (f" ({fmt})" if fmt else "")
+                                   + _coerced_note(converted, column))
         
         if conversions:
             print("✓ Data types fixed:")
@@ -124,90 +611,225 @@ class KuyaCleaner:
         
         return KuyaDataFrame(df_copy)
     
-    def handle_outliers(self, method='iqr', columns=None, threshold=1.5):
+    @profiled
+    def handle_outliers(self, method='iqr', columns=None, threshold=None, action='drop',
+                        flag_column='outlier_flags', quantiles='exact', error=0.01,
+                        batch_size=250_000, by=None):
         """
-        Detect and remove outliers using IQR or Z-score.
+        Detect and handle outliers using IQR, Z-score or Mahalanobis distance.
+        
+        Bounds for all target columns are computed from the full frame in one
+        vectorized pass and combined into a single row mask, so every column
+        is judged on the same data. Missing values are never outliers.
         
         Parameters:
         -----------
         method : str, default='iqr'
             'iqr' for Interquartile Range method
             'zscore' for Z-score method
+            'mahalanobis' for multivariate distance from the mean, which catches
+            unusual combinations (a normal price with an impossible quantity)
+            'robust_mahalanobis' for the same with a robust (MCD-style) mean
+            and covariance that the outliers themselves cannot distort
         columns : list, optional
             Specific numeric columns to check. If None, applies to all numeric columns
-        threshold : float, default=1.5
-            For IQR: multiplier for IQR (typically 1.5)
-            For zscore: z-score threshold (typically 3)
+        threshold : float, optional
+            For IQR: multiplier for IQR (default 1.5)
+            For zscore: z-score threshold (default 1.5, typically 3)
+            For mahalanobis: distance cutoff (default sqrt of the 99.9%
+            chi-square quantile for the number of columns)
+        action : str, default='drop'
+            'drop' to remove rows with an outlier in any target column
+            'clip' to winsorize outlying values to the bounds (IQR/zscore only)
+            'flag' to keep all rows and add a bitmask column where bit i is set
+            when target column i is an outlier (column order in
+            `df.attrs['outlier_flag_columns']`; a single bit for mahalanobis)
+        flag_column : str, default='outlier_flags'
+            Name of the bitmask column added when action='flag'
+        quantiles : str or dict, default='exact'
+            How IQR quartiles are computed: 'exact', 'approx' (mergeable
+            QuantileSketch per column), or a {column: QuantileSketch} dict
+            built over a stream or by several workers with
+            kuya.sketches.sketch_columns
+        error : float, default=0.01
+            Rank error bound for quantiles='approx'
+        batch_size : int, default=250_000
+            Rows per batch for the mahalanobis methods, bounding memory use
+        by : str or list, optional
+            Group column(s). Bounds are computed per group in one groupby pass
+            (IQR or zscore), so a value is judged against its own segment
         
         Returns:
         --------
         pd.DataFrame
-            DataFrame with outliers removed
+            DataFrame with outliers removed, clipped or flagged
         """
         from kuya.core import KuyaDataFrame
-        df_copy = self.df.copy()
-        numeric_cols = df_copy.select_dtypes(include=[np.number]).columns.tolist()
+        numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
         target_cols = columns if columns else numeric_cols
-        target_cols = [col for col in target_cols if col in numeric_cols]
+        by_cols = [] if by is None else ([by] if isinstance(by, str) else list(by))
+        target_cols = [col for col in target_cols if col in numeric_cols and col not in by_cols]
+        
+        if action not in ('drop', 'clip', 'flag'):
+            raise ValueError("action must be 'drop', 'clip', or 'flag'")
         
         if not target_cols:
             print("⚠ No numeric columns to check for outliers")
-            return KuyaDataFrame(df_copy)
+            return KuyaDataFrame(self.df.copy())
         
-        original_shape = df_copy.shape
+        by_note = f" by {', '.join(map(str, by_cols))}" if by_cols else ""
+        block = self.df[target_cols]
         
-        if method == 'iqr':
-            for col in target_cols:
-                Q1 = df_copy[col].quantile(0.25)
-                Q3 = df_copy[col].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - threshold * IQR
-                upper_bound = Q3 + threshold * IQR
-                df_copy = df_copy[(df_copy[col] >= lower_bound) & (df_copy[col] <= upper_bound)]
-        
-        elif method == 'zscore':
-            from scipy import stats
-            for col in target_cols:
-                z_scores = np.abs(stats.zscore(df_copy[col].dropna()))
-                df_copy = df_copy[z_scores < threshold]
+        if by_cols and (method not in ('iqr', 'zscore') or not isinstance(quantiles, str)
+                        or quantiles != 'exact'):
+            raise ValueError("by= is supported for method='iqr' or 'zscore' with exact quantiles")
         
+        if method in ('mahalanobis', 'robust_mahalanobis'):
+            if action == 'clip':
+                raise ValueError("action='clip' is only supported for 'iqr' and 'zscore'")
+            distances = _mahalanobis_distances(block, robust=(method == 'robust_mahalanobis'),
+                                               batch_size=batch_size)
+            if threshold is None:
+                from scipy import stats
+                threshold = np.sqrt(stats.chi2.ppf(0.999, len(target_cols)))
+            with np.errstate(invalid='ignore'):
+                outliers = (distances > threshold)[:, None]
+            flag_names = [method]
         else:
-            raise ValueError("method must be 'iqr' or 'zscore'")
+            if threshold is None:
+                threshold = 1.5
+            if by_cols:
+                codes, n_groups = _group_codes(self.df, by_cols)
+                lower, upper = _group_outlier_bounds(block, codes, n_groups, method, threshold)
+            else:
+                lower, upper = _outlier_bounds(block, method, threshold, quantiles, error)
+            
+            if action == 'clip':
+                df_copy = self.df.copy()
+                clipped = _clip_block(block, lower, upper)
+                n_clipped = int(((clipped != block) & block.notna()).to_numpy().sum())
+                df_copy[target_cols] = clipped
+                print(f"✓ Clipped {n_clipped} outlier values in {len(target_cols)} columns "
+                      f"using {method.upper()} method{by_note}")
+                return KuyaDataFrame(df_copy)
+            
+            outliers = _outlier_mask(block, lower, upper)
+            flag_names = list(target_cols)
         
-        rows_removed = original_shape[0] - df_copy.shape[0]
-        print(f"✓ Removed {rows_removed} outlier rows using {method.upper()} method")
+        if action == 'flag':
+            df_copy = self.df.copy()
+            df_copy[flag_column] = _pack_flags(outliers)
+            n_flagged = int(outliers.any(axis=1).sum())
+            result = KuyaDataFrame(df_copy)
+            result.attrs['outlier_flag_columns'] = flag_names
+            print(f"✓ Flagged {n_flagged} outlier rows in '{flag_column}' "
+                  f"using {method.upper()} method{by_note}")
+            return result
+        
+        df_copy = self.df[~outliers.any(axis=1)]
+        rows_removed = len(self.df) - len(df_copy)
+        print(f"✓ Removed {rows_removed} outlier rows using {method.upper()} method{by_note}")
         print(f"  New shape: {df_copy.shape}")
         
         return KuyaDataFrame(df_copy)
     
-    def standardize_columns(self):
+    @profiled
+    def standardize_columns(self, copy=True):
         """
         Make all column names lowercase and underscored.
         
+        Parameters:
+        -----------
+        copy : bool, default=True
+            Copy the data. With copy=False only the column labels change and
+            the result shares the data buffers with the original frame, so
+            renaming is instant and uses no extra memory, but values edited
+            in place on either frame show up in both
+        
         Returns:
         --------
         pd.DataFrame
             DataFrame with standardized column names
         """
         from kuya.core import KuyaDataFrame
-        df_copy = self.df.copy()
-        old_cols = df_copy.columns.tolist()
-        new_cols = []
+        old_cols = self.df.columns.tolist()
+        new_cols = [_standardize_name(col) for col in old_cols]
         
-        for col in old_cols:
-            # Convert to string, lowercase, replace spaces/special chars with underscore
-            new_col = str(col).lower()
-            new_col = re.sub(r'[^\w\s]', '', new_col)  # Remove special characters
-            new_col = re.sub(r'\s+', '_', new_col)      # Replace spaces with underscore
-            new_col = re.sub(r'_+', '_', new_col)       # Replace multiple underscores with single
-            new_col = new_col.strip('_')                # Remove leading/trailing underscores
-            new_cols.append(new_col)
-        
-        df_copy.columns = new_cols
+        df_renamed = self.df.copy(deep=copy)
+        df_renamed.columns = new_cols
         
         print("✓ Column names standardized:")
         for old, new in zip(old_cols, new_cols):
             if old != new:
                 print(f"  • {old} → {new}")
         
-        return KuyaDataFrame(df_copy)
+        return KuyaDataFrame(df_renamed)
+    
+    @profiled
+    def select_columns(self, columns, copy=True):
+        """
+        Select a subset of columns.
+        
+        Parameters:
+        -----------
+        columns : list
+            Column names to keep, in order
+        copy : bool, default=True
+            Copy the data. With copy=False the result shares the selected
+            columns' data buffers (no copy, no extra memory), so values edited
+            in place on either frame show up in both
+        
+        Returns:
+        --------
+        pd.DataFrame
+            DataFrame with the selected columns
+        """
+        from kuya.core import KuyaDataFrame
+        if copy:
+            return KuyaDataFrame(self.df.loc[:, list(columns)].copy())
+        return KuyaDataFrame(_shallow_select(self.df, columns))
+
+    @profiled
+    def clean_categories(self, columns=None, case='lower', accents=True, synonyms=None):
+        """
+        Normalize messy category values and return them as `category` dtype.
+        
+        Only the distinct values are normalized (trimmed, whitespace collapsed,
+        accents removed, case folded, synonyms mapped), then mapped back
+        through the integer codes, so the cost grows with cardinality rather
+        than with the number of rows.
+        
+        Parameters:
+        -----------
+        columns : list, optional
+            Columns to clean. Defaults to all text and category columns
+        case : {'lower', 'upper', 'title', None}, default='lower'
+            Case folding (None keeps the case)
+        accents : bool, default=True
+            Strip accents ('Café' → 'Cafe')
+        synonyms : dict, optional
+            Variant → canonical value, e.g. {'LA': 'Los Angeles', 'NYC': 'New York'}.
+            Both sides are normalized the same way before matching
+        
+        Returns:
+        --------
+        pd.DataFrame
+            DataFrame with the cleaned columns as categoricals
+        """
+        from kuya.core import KuyaDataFrame
+        if case not in ('lower', 'upper', 'title', None):
+            raise ValueError("case must be 'lower', 'upper', 'title' or None")
+        if columns is None:
+            columns = self.df.select_dtypes(include=['object', 'string', 'category']).columns
+        
+        df_clean = self.df.copy(deep=False)
+        print("✓ Categories normalized:")
+        for col in columns:
+            codes, uniques = _category_codes(self.df[col])
+            normalized = _normalize_labels(uniques, case, accents, synonyms)
+            remap, categories = pd.factorize(normalized, sort=True)
+            remap = np.append(remap, -1)  # code -1 (missing) stays missing
+            df_clean[col] = pd.Categorical.from_codes(remap[codes], categories)
+            print(f"  • {col}: {len(uniques)} → {len(categories)} distinct values")
+        
+        return KuyaDataFrame(df_clean)
@@ -7,6 +7,8 @@ from kuya.clean import KuyaCleaner
 from kuya.eda import KuyaEDA
 from kuya.viz import KuyaViz
 from kuya.advanced import KuyaDataQuality, KuyaTransform, KuyaInsights
+from kuya.missing import null_bitmap
+from kuya.profiling import profiled
 
 
 class KuyaDataFrame(pd.DataFrame):
@@ -16,6 +18,9 @@ class KuyaDataFrame(pd.DataFrame):
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        if args and isinstance(args[0], pd.DataFrame) and args[0].attrs:
+            # Keep metadata such as the sampling record of kuya samples
+            self.attrs = dict(args[0].attrs)
         self._cleaner = KuyaCleaner(self)
         self._eda = KuyaEDA(self)
         self._viz = KuyaViz(self)
@@ -29,38 +34,61 @@ class KuyaDataFrame(pd.DataFrame):
         self._insights = KuyaInsights(self)
     
     # Clean methods
-    def clean_missing(self, method='drop', value=None, columns=None):
+    def clean_missing(self, method='drop', value=None, columns=None, strategy='mean', by=None):
         """Drop or fill missing values automatically."""
-        return self._cleaner.clean_missing(method, value, columns)
+        return self._cleaner.clean_missing(method, value, columns, strategy, by)
     
-    def fix_dtypes(self):
+    def fix_dtypes(self, sample_size=1000, max_invalid_fraction=0.0):
         """Auto-convert columns to numeric, datetime, etc."""
-        return self._cleaner.fix_dtypes()
+        return self._cleaner.fix_dtypes(sample_size, max_invalid_fraction)
     
-    def handle_outliers(self, method='iqr', columns=None):
-        """Detect and remove outliers using IQR or Z-score."""
-        return self._cleaner.handle_outliers(method, columns)
+    def handle_outliers(self, method='iqr', columns=None, threshold=None, action='drop',
+                        flag_column='outlier_flags', quantiles='exact', error=0.01,
+                        batch_size=250_000, by=None):
+        """Detect and remove, clip or flag outliers (IQR, Z-score or Mahalanobis)."""
+        return self._cleaner.handle_outliers(method, columns, threshold, action, flag_column,
+                                             quantiles, error, batch_size, by)
     
-    def standardize_columns(self):
+    def standardize_columns(self, copy=True):
         """Make all column names lowercase and underscored."""
-        return self._cleaner.standardize_columns()
+        return self._cleaner.standardize_columns(copy)
+    
+    def select_columns(self, columns, copy=True):
+        """Select a subset of columns (copy=False shares their data)."""
+        return self._cleaner.select_columns(columns, copy)
+    
+    def clean_categories(self, columns=None, case='lower', accents=True, synonyms=None):
+        """Normalize category values (case, whitespace, accents, synonyms)."""
+        return self._cleaner.clean_categories(columns, case, accents, synonyms)
     
     # EDA methods
-    def summary(self):
+    def summary(self, sample=None, stratify=None, bitmap=None):
         """Returns full descriptive summary."""
-        return self._eda.summary()
+        return self._eda.summary(sample, stratify, bitmap)
     
     def check_missing(self):
         """Shows missing value count and percentage."""
         return self._eda.check_missing()
     
-    def unique_summary(self):
+    def missing_patterns(self, top=10, columns=None):
+        """Shows which columns go missing together."""
+        return self._eda.missing_patterns(top, columns)
+    
+    def unique_summary(self, approx=False, error=0.01, sample=None, stratify=None):
         """Shows count of unique values for each column."""
-        return self._eda.unique_summary()
+        return self._eda.unique_summary(approx, error, sample, stratify)
     
-    def correlation_report(self):
+    def correlation_report(self, method='pearson', threshold=0.7, top_k=None, float32=False,
+                           stream=None, sample=None, n_jobs=None, stratify=None):
         """Displays correlation table."""
-        return self._eda.correlation_report()
+        return self._eda.correlation_report(method, threshold, top_k, float32, stream,
+                                            sample, n_jobs, stratify)
+    
+    def association_report(self, method='cramers_v', threshold=0.5, top_k=None, columns=None,
+                           bias_correction=True, n_jobs=None):
+        """Displays the association table of categorical columns."""
+        return self._eda.association_report(method, threshold, top_k, columns,
+                                            bias_correction, n_jobs)
     
     # Visualization methods
     def quick_plot(self, kind, x, y=None, **kwargs):
@@ -80,12 +108,13 @@ class KuyaDataFrame(pd.DataFrame):
         return self._viz.pairplot(columns, **kwargs)
     
     # Advanced methods
-    def quality_report(self):
+    def quality_report(self, quantiles='exact', error=0.01, approx=False, sample=None,
+                       stratify=None, bitmap=None):
         """Generate comprehensive data quality report."""
         if self._quality is None:
             from kuya.advanced import KuyaDataQuality
             self._quality = KuyaDataQuality(self)
-        return self._quality.quality_report()
+        return self._quality.quality_report(quantiles, error, approx, sample, stratify, bitmap)
     
     def smart_encode(self, columns=None, method='auto'):
         """Intelligently encode categorical variables."""
@@ -94,33 +123,39 @@ class KuyaDataFrame(pd.DataFrame):
             self._transform = KuyaTransform(self)
         return self._transform.smart_encode(columns, method)
     
-    def normalize(self, columns=None, method='minmax'):
+    def normalize(self, columns=None, method='minmax', quantiles='exact', error=0.01):
         """Normalize numeric columns."""
         if self._transform is None:
             from kuya.advanced import KuyaTransform
             self._transform = KuyaTransform(self)
-        return self._transform.normalize(columns, method)
+        return self._transform.normalize(columns, method, quantiles, error)
     
-    def smart_analysis(self):
+    def smart_analysis(self, approx=False, error=0.01):
         """Automated intelligent analysis with AI-like insights."""
         from kuya.advanced import smart_analysis
-        return smart_analysis(self)
+        return smart_analysis(self, approx, error)
     
-    def auto_insights(self):
+    def auto_insights(self, approx=False, error=0.01, sample=None, stratify=None, bitmap=None):
         """Generate automated insights from data."""
         if self._insights is None:
             from kuya.advanced import KuyaInsights
             self._insights = KuyaInsights(self)
-        return self._insights.auto_insights()
+        return self._insights.auto_insights(approx, error, sample, stratify, bitmap)
     
     # Advanced Quality methods
-    def quality_report(self):
+    def quality_report(self, quantiles='exact', error=0.01, approx=False, sample=None,
+                       stratify=None, bitmap=None):
         """Generate comprehensive data quality report."""
-        return self._quality.quality_report()
+        return self._quality.quality_report(quantiles, error, approx, sample, stratify, bitmap)
+    
+    def detect_duplicates(self, subset=None, index=None, fuzzy=False, columns=None,
+                          threshold=0.9, num_perm=64):
+        """Detect and show exact or near-duplicate rows."""
+        return self._quality.detect_duplicates(subset, index, fuzzy, columns, threshold, num_perm)
     
-    def detect_duplicates(self, subset=None):
-        """Detect and show duplicate rows."""
-        return self._quality.detect_duplicates(subset)
+    def remove_duplicates(self, subset=None, keep='first', ignore_index=False, index=None):
+        """Remove duplicate rows, optionally across chunks with a RowFingerprintIndex."""
+        return self._quality.drop_duplicates(subset, keep, ignore_index, index)
     
     def suggest_dtypes(self):
         """Suggest optimal data types for memory optimization."""
@@ -131,23 +166,30 @@ class KuyaDataFrame(pd.DataFrame):
         """Intelligently encode categorical variables."""
         return self._transform.smart_encode(columns, method)
     
-    def normalize(self, columns=None, method='minmax'):
+    def normalize(self, columns=None, method='minmax', quantiles='exact', error=0.01):
         """Normalize numeric columns."""
-        return self._transform.normalize(columns, method)
+        return self._transform.normalize(columns, method, quantiles, error)
     
     def create_features(self):
         """Auto-generate useful features from existing columns."""
         return self._transform.create_features()
     
     # Advanced Insights methods
-    def auto_insights(self):
+    def auto_insights(self, approx=False, error=0.01, sample=None, stratify=None, bitmap=None):
         """Generate automated insights from data."""
-        return self._insights.auto_insights()
+        return self._insights.auto_insights(approx, error, sample, stratify, bitmap)
     
-    def compare_groups(self, group_col, value_col):
+    def compare_groups(self, group_col, value_col, test='anova', alpha=0.05):
         """Compare groups and find significant differences."""
-        return self._insights.compare_groups(group_col, value_col)
+        return self._insights.compare_groups(group_col, value_col, test, alpha)
+    
+    def compare_all_groups(self, group_cols=None, value_cols=None, threshold=20,
+                           max_groups=50, n_jobs=None, test='anova', alpha=0.05):
+        """Compare every categorical column's groups on every numeric column."""
+        return self._insights.compare_all_groups(group_cols, value_cols, threshold,
+                                                 max_groups, n_jobs, test, alpha)
     
+    @profiled
     def magic_analyze(self, target_col=None):
         """
         🪄 MAGIC ANALYZE - Complete automated analysis with one command!
@@ -170,18 +212,20 @@ class KuyaDataFrame(pd.DataFrame):
         print("🌟" * 35 + "\n")
         
         results = {}
+        # Null masks shared by every step below
+        bitmap = null_bitmap(self)
         
         # Step 1: Quality Assessment
         print("🔍 Step 1/5: Assessing Data Quality...")
-        results['quality'] = self.quality_report()
+        results['quality'] = self.quality_report(bitmap=bitmap)
         
         # Step 2: Basic Statistics
         print("\n📊 Step 2/5: Computing Statistics...")
-        self.summary()
+        self.summary(bitmap=bitmap)
         
         # Step 3: Generate Insights
         print("\n💡 Step 3/5: Generating Insights...")
-        results['insights'] = self.auto_insights()
+        results['insights'] = self.auto_insights(bitmap=bitmap)
         
         # Step 4: Correlations
         print("\n🔗 Step 4/5: Analyzing Relationships...")
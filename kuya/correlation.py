@@ -0,0 +1,618 @@
+"""
+Correlation Module
+Correlation matrices for wide tables and fast extraction of strong pairs.
+
+The matrix is built from a few large matrix products computed block by
+block, instead of one Python-level computation per column pair. Missing
+values are handled pairwise (each pair uses the rows where both columns are
+present) with masked products, and Spearman ranks every column once.
+Kendall's tau uses the O(n log n) merge-sort algorithm per pair, with pairs
+spread over a thread pool.
+
+Categorical columns are compared with Cramér's V or normalized mutual
+information. Each column is factorized once per call (into a group index)
+and every pair's contingency table is a bincount of combined codes, so only
+the non-empty cells are ever materialized.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from kuya.sampling import sample_rows
+from kuya.groups import group_index
+
+ASSOCIATIONS = ('cramers_v', 'mutual_info')
+
+# Largest dense contingency table (cells) before switching to sorting the codes
+_DENSE_CELLS = 1 << 22
+
+
+def _rank_block(block):
+    """Average ranks of every column, NaNs kept (ties get the mean rank)."""
+    return block.rank(method='average', na_option='keep')
+
+
+def _pairwise_products(values, observed, rows, cols):
+    """
+    Pairwise-complete correlations of columns `rows` against columns `cols`.
+
+    With M the presence mask and X the values (missing set to 0), every pair
+    statistic is a matrix product: n = MᵀM, Σx = XᵀM, Σx² = (X²)ᵀM, Σxy = XᵀX.
+    """
+    x, y = values[:, rows], values[:, cols]
+    mx, my = observed[:, rows], observed[:, cols]
+    n = mx.T @ my
+    sum_x = x.T @ my
+    sum_y = mx.T @ y
+    sum_xx = (x * x).T @ my
+    sum_yy = mx.T @ (y * y)
+    sum_xy = x.T @ y
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = sum_xy - sum_x * sum_y / n
+        var_x = sum_xx - sum_x * sum_x / n
+        var_y = sum_yy - sum_y * sum_y / n
+        return cov / np.sqrt(var_x * var_y), n
+
+
+def _kendall_pair(x, y, min_periods):
+    """Kendall tau-b and the number of complete pairs for two columns."""
+    from scipy import stats
+    complete = ~(np.isnan(x) | np.isnan(y))
+    n = int(complete.sum())
+    if n < max(min_periods, 2):
+        return np.nan, n
+    x, y = x[complete], y[complete]
+    # Tau is undefined for a constant column; skip it rather than have scipy
+    # warn (warning filters are process-wide, so not safe to swap per thread)
+    if x.min() == x.max() or y.min() == y.max():
+        return np.nan, n
+    return stats.kendalltau(x, y)[0], n
+
+
+# Variance of Fisher's z per method, as a multiple of 1 / (n - offset)
+_FISHER_VARIANCE = {'pearson': (1.0, 3), 'spearman': (1.06, 3), 'kendall': (0.437, 4)}
+
+
+def _add_intervals(result, values, method, confidence=0.95, sample_size=None):
+    """
+    Attach Fisher-z confidence intervals to a correlation matrix.
+
+    Uses the variance 1/(n-3) for Pearson, 1.06/(n-3) for Spearman and
+    0.437/(n-4) for Kendall (Fieller, Hartley & Pearson), with n the
+    complete pairs of each column pair. The bounds are stored in
+    result.attrs['ci_lower'] / ['ci_upper'].
+    """
+    from scipy import stats
+    observed = (~np.isnan(values)).astype(np.float64)
+    counts = observed.T @ observed
+    scale, offset = _FISHER_VARIANCE[method]
+    z = stats.norm.ppf(0.5 + confidence / 2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        spread = z * np.sqrt(scale / (counts - offset))
+        center = np.arctanh(np.clip(result.to_numpy(dtype=float), -0.999999, 0.999999))
+    spread[counts <= offset] = np.nan
+    result.attrs['ci_lower'] = pd.DataFrame(np.tanh(center - spread), index=result.index,
+                                            columns=result.columns)
+    result.attrs['ci_upper'] = pd.DataFrame(np.tanh(center + spread), index=result.index,
+                                            columns=result.columns)
+    result.attrs['sample_size'] = len(values) if sample_size is None else sample_size
+    result.attrs['confidence'] = confidence
+    return result
+
+
+def kendall_matrix(df, min_periods=1, sample=None, confidence=0.95, n_jobs=None, seed=0):
+    """
+    Kendall tau-b matrix in O(n log n) per column pair, pairs run in parallel.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Numeric columns
+    min_periods : int, default=1
+        Minimum number of complete pairs for a valid result
+    sample : int or float, optional
+        Estimate tau from this many randomly sampled rows (or this fraction
+        of the rows). The result's
+        attrs['ci_lower'] / attrs['ci_upper'] then hold a confidence interval
+        (Fisher z with the Fieller-Hartley-Pearson variance 0.437 / (n - 4))
+    confidence : float, default=0.95
+        Confidence level of the interval when sampling
+    n_jobs : int, optional
+        Threads used across column pairs. Defaults to the number of CPUs
+    seed : int, default=0
+        Seed for the row sample
+
+    Returns:
+    --------
+    pd.DataFrame
+        Symmetric tau-b matrix (like DataFrame.corr(method='kendall'))
+    """
+    if sample is not None:
+        df = sample_rows(df, sample, seed=seed)
+    values = df.to_numpy(dtype=float, na_value=np.nan)
+
+    n_cols = values.shape[1]
+    columns = [np.ascontiguousarray(values[:, i]) for i in range(n_cols)]
+    upper = np.triu_indices(n_cols, k=1)
+    n_jobs = n_jobs or os.cpu_count() or 1
+
+    def run(pair):
+        return _kendall_pair(columns[pair[0]], columns[pair[1]], min_periods)
+
+    pairs = list(zip(*upper))
+    if n_jobs > 1 and len(pairs) > 1:
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            results = list(pool.map(run, pairs))
+    else:
+        results = [run(pair) for pair in pairs]
+
+    tau = np.eye(n_cols)
+    counts = np.zeros((n_cols, n_cols))
+    if results:
+        tau[upper] = [r[0] for r in results]
+        counts[upper] = [r[1] for r in results]
+    tau[upper[::-1]] = tau[upper]
+    counts[upper[::-1]] = counts[upper]
+    for i, column in enumerate(columns):
+        present = np.count_nonzero(~np.isnan(column))
+        counts[i, i] = present
+        if present < max(min_periods, 1):
+            tau[i, i] = np.nan
+
+    result = pd.DataFrame(tau, index=df.columns, columns=df.columns)
+    if sample is not None:
+        _add_intervals(result, values, 'kendall', confidence)
+    return result
+
+
+def correlation_matrix(df, method='pearson', min_periods=1, float32=False, block_size=1024,
+                       sample=None, n_jobs=None, intervals=False, confidence=0.95, seed=0):
+    """
+    Correlation matrix of the numeric columns, computed in blocks.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Numeric columns
+    method : str, default='pearson'
+        'pearson', 'spearman' or 'kendall' (see kendall_matrix)
+    min_periods : int, default=1
+        Minimum number of complete pairs for a valid result
+    float32 : bool, default=False
+        Compute in single precision (half the memory, ~7 significant digits)
+    block_size : int, default=1024
+        Columns per block; each block product touches block_size² cells
+    sample : int or float, optional
+        Estimate from a random sample of this many rows (or this fraction of
+        the rows). Implies intervals=True
+    n_jobs : int, optional
+        Kendall only: threads across column pairs
+    intervals : bool, default=False
+        Attach Fisher-z confidence intervals in attrs['ci_lower'] /
+        attrs['ci_upper'], e.g. when df is itself a sample
+    confidence : float, default=0.95
+        Confidence level of the intervals
+    seed : int, default=0
+        Seed for the row sample
+
+    Returns:
+    --------
+    pd.DataFrame
+        Symmetric correlation matrix (like DataFrame.corr)
+
+    Notes:
+    ------
+    With missing values, Spearman ranks each column once over all its
+    values, while pandas re-ranks every pair over the rows both columns
+    share, so results can differ slightly.
+    """
+    if method not in ('pearson', 'spearman', 'kendall'):
+        raise ValueError("method must be 'pearson', 'spearman' or 'kendall'")
+    if sample is not None:
+        df = sample_rows(df, sample, seed=seed)
+        intervals = True
+    if method == 'kendall':
+        result = kendall_matrix(df, min_periods=min_periods, n_jobs=n_jobs)
+    else:
+        result = _product_correlation(df, method, min_periods, float32, block_size)
+    if intervals:
+        _add_intervals(result, df.to_numpy(dtype=float, na_value=np.nan), method, confidence)
+    return result
+
+
+def _product_correlation(df, method, min_periods, float32, block_size):
+    """Pearson or Spearman matrix from blocked matrix products."""
+    columns = df.columns
+    if method == 'spearman':
+        df = _rank_block(df)
+    dtype = np.float32 if float32 else np.float64
+    values = df.to_numpy(dtype=dtype, na_value=np.nan)
+    n_cols = values.shape[1]
+    result = np.empty((n_cols, n_cols), dtype=dtype)
+
+    observed = ~np.isnan(values)
+    complete = observed.all()
+    # Centering by the column means changes nothing mathematically but keeps
+    # the sums of products well conditioned
+    with np.errstate(invalid='ignore'):
+        means = np.nanmean(values, axis=0) if len(values) else np.zeros(n_cols, dtype=dtype)
+    values = values - np.nan_to_num(means).astype(dtype)
+
+    if complete:
+        scale = np.sqrt((values * values).sum(axis=0))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            values = values / scale
+        for start in range(0, n_cols, block_size):
+            rows = slice(start, start + block_size)
+            result[rows, start:] = values[:, rows].T @ values[:, start:]
+        counts = None
+    else:
+        values[~observed] = 0
+        mask = observed.astype(dtype)
+        counts = np.empty((n_cols, n_cols), dtype=dtype)
+        for start in range(0, n_cols, block_size):
+            rows = slice(start, start + block_size)
+            for col_start in range(start, n_cols, block_size):
+                cols = slice(col_start, col_start + block_size)
+                r, n = _pairwise_products(values, mask, rows, cols)
+                result[rows, cols] = r
+                counts[rows, cols] = n
+
+    upper = np.triu_indices(n_cols, k=1)
+    result[upper[::-1]] = result[upper]
+    if counts is not None:
+        counts[upper[::-1]] = counts[upper]
+        result[counts < max(min_periods, 2)] = np.nan
+    elif len(values) < max(min_periods, 2):
+        result[:] = np.nan
+    np.clip(result, -1, 1, out=result)
+    valid_diagonal = ~np.isnan(np.diagonal(result))
+    result[np.diag_indices(n_cols)] = np.where(valid_diagonal, 1.0, np.nan)
+    return pd.DataFrame(result, index=columns, columns=columns)
+
+
+def strong_pairs(corr, threshold=0.7, top_k=None):
+    """
+    Strongest column pairs of a correlation matrix, without Python loops.
+
+    Parameters:
+    -----------
+    corr : pd.DataFrame
+        Square correlation matrix
+    threshold : float, optional
+        Keep pairs with |r| > threshold (None = no threshold)
+    top_k : int, optional
+        Keep at most the k strongest pairs
+
+    Returns:
+    --------
+    pd.DataFrame
+        Columns 'col1', 'col2', 'corr', sorted by |corr| descending
+    """
+    values = corr.to_numpy()
+    i, j = np.triu_indices(len(values), k=1)
+    r = values[i, j]
+    strength = np.abs(r)
+    keep = ~np.isnan(strength)
+    if threshold is not None:
+        keep &= strength > threshold
+    i, j, r, strength = i[keep], j[keep], r[keep], strength[keep]
+
+    if top_k is not None and top_k < len(r):
+        best = np.argpartition(-strength, top_k - 1)[:top_k]
+        i, j, r, strength = i[best], j[best], r[best], strength[best]
+    order = np.argsort(-strength, kind='stable')
+
+    columns = corr.columns
+    return pd.DataFrame({
+        'col1': columns[i[order]],
+        'col2': columns[j[order]],
+        'corr': r[order],
+    })
+
+
+class CovarianceAccumulator:
+    """
+    Mergeable streaming covariance / Pearson correlation.
+
+    Keeps the count, means and co-moment matrix of the numeric columns and
+    updates them chunk by chunk with the parallel (Chan) merge, so chunks or
+    workers give the same matrix as DataFrame.corr() on all rows at once.
+    While every chunk is complete the state is one mean vector and one p×p
+    co-moment matrix; once missing values appear it switches to
+    pairwise-complete statistics (counts and means per column pair).
+
+    Example:
+    --------
+    >>> acc = CovarianceAccumulator()
+    >>> for chunk in pd.read_csv('big.csv', chunksize=1_000_000):
+    ...     acc.update(chunk.select_dtypes('number'))
+    >>> acc.correlation()
+    """
+
+    def __init__(self, columns=None):
+        """
+        Initialize an empty accumulator.
+
+        Parameters:
+        -----------
+        columns : list, optional
+            Column labels. Taken from the first chunk passed to update()
+        """
+        self.columns = None if columns is None else list(columns)
+        self.n_rows = 0
+        self._n = None        # scalar, or p×p pairwise counts
+        self._mean = None     # vector, or p×p mean of column i where j is present
+        self._cxx = None      # vector, or p×p sum of squares of column i where j is present
+        self._cxy = None      # p×p co-moments
+
+    def __repr__(self):
+        n_cols = 0 if self.columns is None else len(self.columns)
+        return f"CovarianceAccumulator(columns={n_cols}, rows={self.n_rows})"
+
+    @property
+    def pairwise(self):
+        """True once missing values forced pairwise-complete statistics."""
+        return self._cxy is not None and np.ndim(self._n) == 2
+
+    @staticmethod
+    def _chunk_stats(values):
+        """(n, mean, cxx, cxy) of one chunk, vector form if it has no missing values."""
+        observed = ~np.isnan(values)
+        if observed.all():
+            mean = values.mean(axis=0) if len(values) else np.zeros(values.shape[1])
+            centered = values - mean
+            return len(values), mean, (centered * centered).sum(axis=0), centered.T @ centered
+
+        with np.errstate(invalid='ignore'):
+            shift = np.nan_to_num(np.nanmean(values, axis=0))
+        x = np.where(observed, values - shift, 0.0)
+        mask = observed.astype(float)
+        n = mask.T @ mask
+        sum_x = x.T @ mask                # column i over rows where j is present
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_x = np.where(n > 0, sum_x / n, 0.0)
+        cxx = (x * x).T @ mask - sum_x * mean_x
+        cxy = x.T @ x - sum_x * mean_x.T
+        return n, mean_x + shift[:, None], cxx, cxy
+
+    @staticmethod
+    def _as_pairwise(n, mean, cxx, p):
+        """Expand vector-form statistics to per-pair matrices."""
+        if np.ndim(n) == 2:
+            return n, mean, cxx
+        return (np.full((p, p), float(n)),
+                np.repeat(mean[:, None], p, axis=1),
+                np.repeat(cxx[:, None], p, axis=1))
+
+    def _combine(self, n_b, mean_b, cxx_b, cxy_b):
+        if self._cxy is None:
+            self._n, self._mean, self._cxx, self._cxy = n_b, mean_b, cxx_b, cxy_b
+            return
+        p = len(self.columns)
+        n_a, mean_a, cxx_a = self._n, self._mean, self._cxx
+        if np.ndim(n_a) == 2 or np.ndim(n_b) == 2:
+            n_a, mean_a, cxx_a = self._as_pairwise(n_a, mean_a, cxx_a, p)
+            n_b, mean_b, cxx_b = self._as_pairwise(n_b, mean_b, cxx_b, p)
+
+        n = n_a + n_b
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(n > 0, n_a * n_b / np.where(n > 0, n, 1), 0.0)
+            share = np.where(n > 0, n_b / np.where(n > 0, n, 1), 0.0)
+        delta = mean_b - mean_a
+        if np.ndim(delta) == 2:
+            self._cxy = self._cxy + cxy_b + delta * delta.T * weight
+        else:
+            self._cxy = self._cxy + cxy_b + np.outer(delta, delta) * weight
+        self._cxx = cxx_a + cxx_b + delta * delta * weight
+        self._mean = mean_a + delta * share
+        self._n = n
+
+    def update(self, block):
+        """
+        Add a chunk of rows.
+
+        Parameters:
+        -----------
+        block : pd.DataFrame or 2-D array
+            Numeric columns, same order as previous chunks
+
+        Returns:
+        --------
+        CovarianceAccumulator
+            self, for chaining
+        """
+        if isinstance(block, pd.DataFrame):
+            if self.columns is None:
+                self.columns = list(block.columns)
+            values = block.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            values = np.asarray(block, dtype=float)
+            if self.columns is None:
+                self.columns = list(range(values.shape[1]))
+        if values.shape[1] != len(self.columns):
+            raise ValueError(f"Expected {len(self.columns)} columns, got {values.shape[1]}")
+        if len(values) == 0:
+            return self
+
+        self._combine(*self._chunk_stats(values))
+        self.n_rows += len(values)
+        return self
+
+    def merge(self, other):
+        """
+        Merge another accumulator over the same columns (e.g. from another worker).
+
+        Parameters:
+        -----------
+        other : CovarianceAccumulator
+
+        Returns:
+        --------
+        CovarianceAccumulator
+            self, for chaining
+        """
+        if other._cxy is None:
+            return self
+        if self.columns is None:
+            self.columns = other.columns
+        elif list(other.columns) != list(self.columns):
+            raise ValueError("Cannot merge accumulators over different columns")
+        self._combine(other._n, other._mean, other._cxx, other._cxy)
+        self.n_rows += other.n_rows
+        return self
+
+    def covariance(self, ddof=1):
+        """
+        Covariance matrix (pairwise-complete once missing values were seen).
+
+        Returns:
+        --------
+        pd.DataFrame
+        """
+        if self._cxy is None:
+            return pd.DataFrame(index=self.columns, columns=self.columns, dtype=float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = self._cxy / (self._n - ddof)
+        cov = np.where(np.asarray(self._n - ddof) > 0, cov, np.nan)
+        return pd.DataFrame(cov, index=self.columns, columns=self.columns)
+
+    def correlation(self, min_periods=1):
+        """
+        Pearson correlation matrix (like DataFrame.corr()).
+
+        Parameters:
+        -----------
+        min_periods : int, default=1
+            Minimum number of complete pairs for a valid result
+
+        Returns:
+        --------
+        pd.DataFrame
+        """
+        if self._cxy is None:
+            return pd.DataFrame(index=self.columns, columns=self.columns, dtype=float)
+        if np.ndim(self._cxx) == 2:
+            scale = self._cxx * self._cxx.T
+        else:
+            scale = np.outer(self._cxx, self._cxx)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = np.clip(self._cxy / np.sqrt(scale), -1, 1)
+        corr[np.broadcast_to(self._n, corr.shape) < max(min_periods, 2)] = np.nan
+        corr[np.diag_indices(len(corr))] = np.where(np.isnan(np.diagonal(corr)), np.nan, 1.0)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+
+def _contingency(a, n_a, b, n_b):
+    """
+    Non-empty cells of the contingency table of two code arrays (-1 = missing).
+
+    Returns the row and column code of every non-empty cell, its count, the
+    row and column totals and the number of rows where both are present.
+    """
+    valid = (a >= 0) & (b >= 0)
+    a, b = a[valid], b[valid]
+    combined = a * n_b + b
+    if n_a * n_b <= max(len(combined), _DENSE_CELLS):
+        cells = np.bincount(combined, minlength=n_a * n_b)
+        nonzero = np.flatnonzero(cells)
+        counts = cells[nonzero]
+    else:
+        # High-cardinality pairs: count only the combinations that occur
+        nonzero, counts = np.unique(combined, return_counts=True)
+    rows, cols = np.divmod(nonzero, n_b)
+    return (rows, cols, counts.astype(float),
+            np.bincount(a, minlength=n_a).astype(float),
+            np.bincount(b, minlength=n_b).astype(float), len(combined))
+
+
+def _association_pair(a, n_a, b, n_b, method, bias_correction):
+    """Cramér's V or normalized mutual information of two factorized columns."""
+    rows, cols, counts, row_totals, col_totals, n = _contingency(a, n_a, b, n_b)
+    r, c = np.count_nonzero(row_totals), np.count_nonzero(col_totals)
+    if n < 2 or min(r, c) < 2:
+        return np.nan
+    expected = row_totals[rows] * col_totals[cols]
+    if method == 'cramers_v':
+        # chi2 / n = sum(n_ij^2 / (r_i c_j)) - 1 over the non-empty cells
+        phi2 = max((counts ** 2 / expected).sum() - 1, 0.0)
+        if bias_correction:
+            # Bergsma (2013): removes the upward bias of many categories
+            phi2 = max(phi2 - (r - 1) * (c - 1) / (n - 1), 0.0)
+            r = r - (r - 1) ** 2 / (n - 1)
+            c = c - (c - 1) ** 2 / (n - 1)
+        denominator = min(r, c) - 1
+        return float(np.sqrt(phi2 / denominator)) if denominator > 0 else np.nan
+    p = counts / n
+    mutual = (p * np.log(counts * n / expected)).sum()
+    entropies = [-(q * np.log(q)).sum() for q in
+                 (row_totals[row_totals > 0] / n, col_totals[col_totals > 0] / n)]
+    mean_entropy = (entropies[0] + entropies[1]) / 2
+    return float(np.clip(mutual / mean_entropy, 0, 1)) if mean_entropy > 0 else np.nan
+
+
+def association_matrix(df, columns=None, method='cramers_v', bias_correction=False,
+                       n_jobs=None):
+    """
+    Association matrix of categorical columns, pairs run in parallel.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+    columns : list, optional
+        Columns to compare. Defaults to object and category columns
+    method : str, default='cramers_v'
+        'cramers_v' (chi-squared based, 0 = independent, 1 = one column
+        determines the other) or 'mutual_info' (mutual information divided
+        by the mean of the two entropies)
+    bias_correction : bool, default=False
+        Cramér's V only: apply Bergsma's correction, which keeps
+        high-cardinality columns from looking associated by chance
+    n_jobs : int, optional
+        Threads used across column pairs. Defaults to the number of CPUs
+
+    Returns:
+    --------
+    pd.DataFrame
+        Symmetric matrix in [0, 1]; each pair uses the rows where both
+        columns are present
+
+    Example:
+    --------
+    >>> association_matrix(df, ['city', 'country', 'plan'])
+    >>> association_matrix(df, method='mutual_info', n_jobs=8)
+    """
+    if method not in ASSOCIATIONS:
+        raise ValueError(f"method must be one of {ASSOCIATIONS}")
+    if columns is None:
+        columns = df.select_dtypes(include=['object', 'category']).columns
+    columns = list(columns)
+    indexes = [group_index(df, col) for col in columns]
+    codes = [(index.codes, index.n_groups) for index in indexes]
+
+    n_cols = len(columns)
+    upper = np.triu_indices(n_cols, k=1)
+    n_jobs = n_jobs or os.cpu_count() or 1
+
+    def run(pair):
+        (a, n_a), (b, n_b) = codes[pair[0]], codes[pair[1]]
+        return _association_pair(a, n_a, b, n_b, method, bias_correction)
+
+    pairs = list(zip(*upper))
+    if n_jobs > 1 and len(pairs) > 1:
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            results = list(pool.map(run, pairs))
+    else:
+        results = [run(pair) for pair in pairs]
+
+    matrix = np.full((n_cols, n_cols), np.nan)
+    if results:
+        matrix[upper] = results
+        matrix[upper[::-1]] = matrix[upper]
+    for i, (_, n_groups) in enumerate(codes):
+        if n_groups >= 2:
+            matrix[i, i] = 1.0
+    return pd.DataFrame(matrix, index=columns, columns=columns)
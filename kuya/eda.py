@@ -6,6 +6,14 @@ Get instant insights and summaries from your dataset.
 import pandas as pd
 import numpy as np
 
+from kuya.profiling import profiled
+from kuya.sketches import MomentAccumulator, block_quantiles, distinct_counts, sketch_columns
+from kuya.correlation import (CovarianceAccumulator, association_matrix, correlation_matrix,
+                              strong_pairs)
+from kuya.missing import null_bitmap, null_counts
+from kuya.sampling import (sample_rows, reservoir_sample, sample_info, describe_sample, proportion_interval,
+                           mean_interval, median_interval, distinct_estimate)
+
 
 class KuyaEDA:
     """Exploratory Data Analysis utilities for Kuya."""
@@ -21,22 +29,49 @@ class KuyaEDA:
         """
         self.df = df
     
-    def summary(self):
+    @profiled
+    def summary(self, sample=None, stratify=None, bitmap=None):
         """
         Returns full descriptive summary (like pandas_profiling lite).
         
+        Numeric statistics (count, mean, std, min, quartiles, max, skew,
+        kurtosis) come from one set of NumPy reductions over the numeric
+        block rather than per-column describe() calls.
+        
+        Parameters:
+        -----------
+        sample : int or float, optional
+            Summarize a random sample of this many rows (or this fraction of
+            the rows). Missing counts, means, medians and distinct counts are
+            then reported as estimates with 95% confidence intervals. Frames
+            returned by sample_rows() / reservoir_sample() are treated the same
+        stratify : str, optional
+            Column whose groups keep their share of the sampled rows
+        bitmap : NullBitmap, optional
+            Null masks already built for this frame (see null_bitmap), e.g.
+            shared by the steps of one analysis
+        
         Returns:
         --------
         dict
             Dictionary containing various summaries
         """
+        if sample is not None:
+            return KuyaEDA(sample_rows(self.df, sample, stratify)).summary()
+        info = sample_info(self.df)
+        rows = len(self.df) if info is None else info['population']
+        scale = rows / max(len(self.df), 1)
+        
         print("=" * 60)
         print("📊 KUYA DATA SUMMARY")
         print("=" * 60)
+        if info is not None:
+            print(describe_sample(info))
         
         # Basic info
-        print(f"\n📁 Dataset Shape: {self.df.shape[0]} rows × {self.df.shape[1]} columns")
-        print(f"💾 Memory Usage: {self.df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+        print(f"\n📁 Dataset Shape: {rows} rows × {self.df.shape[1]} columns")
+        memory = self.df.memory_usage(deep=True).sum() / 1024**2 * scale
+        print(f"💾 Memory Usage: {memory:.2f} MB" + (" (est.)" if info is not None else ""))
         
         # Data types
         print("\n📋 Column Types:")
@@ -45,7 +80,7 @@ class KuyaEDA:
             print(f"  • {dtype}: {count} columns")
         
         # Missing values summary
-        missing = self.df.isnull().sum()
+        missing = null_counts(self.df, bitmap)
         if missing.sum() > 0:
             print("\n⚠️  Missing Values:")
             missing_pct = (missing / len(self.df)) * 100
@@ -53,37 +88,67 @@ class KuyaEDA:
                 'Missing Count': missing[missing > 0],
                 'Percentage': missing_pct[missing > 0]
             })
+            if info is not None:
+                _, lower, upper = proportion_interval(missing_df['Missing Count'], len(self.df), rows)
+                missing_df['Missing Count'] = (missing_df['Missing Count'] * scale).round().astype(int)
+                missing_df['95% CI (%)'] = [f"{lo * 100:.2f} – {hi * 100:.2f}"
+                                           for lo, hi in zip(lower, upper)]
+                missing = (missing * scale).round().astype(int)
             print(missing_df.to_string())
         else:
             print("\n✓ No missing values detected")
         
-        # Numeric summary
+        # Numeric summary: one pass of NumPy reductions over the whole block
         numeric_cols = self.df.select_dtypes(include=[np.number]).columns
+        numeric_summary = None
+        estimates = None
         if len(numeric_cols) > 0:
+            block = self.df[numeric_cols]
+            numeric_summary = MomentAccumulator().update(block).describe(
+                block_quantiles(block, [0.25, 0.5, 0.75])
+            )
             print(f"\n🔢 Numeric Columns Summary ({len(numeric_cols)} columns):")
-            print(self.df[numeric_cols].describe().round(2).to_string())
+            print(numeric_summary.round(2).to_string())
+            if info is not None:
+                estimates = pd.concat([mean_interval(block, rows), median_interval(block)], axis=1)
+                print("\n🎯 Estimated mean and median (95% CI):")
+                print(estimates.round(3).to_string())
         
         # Categorical summary
         categorical_cols = self.df.select_dtypes(include=['object', 'category']).columns
         if len(categorical_cols) > 0:
             print(f"\n📝 Categorical Columns Summary ({len(categorical_cols)} columns):")
-            for col in categorical_cols[:5]:  # Show first 5
-                unique_count = self.df[col].nunique()
-                most_common = self.df[col].mode()[0] if len(self.df[col].mode()) > 0 else 'N/A'
-                print(f"  • {col}: {unique_count} unique values, most common: '{most_common}'")
+            shown = categorical_cols[:5]  # Show first 5
+            top_values = sketch_columns(self.df, shown, kind='topk')
+            nunique = distinct_counts(self.df, shown)
+            for col in shown:
+                most_common = top_values[col].mode()
+                most_common = 'N/A' if most_common is None else most_common
+                if info is None:
+                    unique_text = f"{nunique[col]} unique values"
+                else:
+                    estimate, lower, upper = distinct_estimate(
+                        self.df[col].value_counts(), len(self.df), rows)
+                    unique_text = f"~{estimate} unique values (bounds {lower}–{upper})"
+                print(f"  • {col}: {unique_text}, most common: '{most_common}'")
             if len(categorical_cols) > 5:
                 print(f"  ... and {len(categorical_cols) - 5} more categorical columns")
         
         print("\n" + "=" * 60)
         
-        return {
-            'shape': self.df.shape,
+        result = {
+            'shape': (rows, self.df.shape[1]),
             'dtypes': self.df.dtypes,
             'missing': missing,
-            'numeric_summary': self.df[numeric_cols].describe() if len(numeric_cols) > 0 else None,
+            'numeric_summary': numeric_summary,
             'categorical_cols': categorical_cols.tolist()
         }
+        if info is not None:
+            result['sample'] = info
+            result['estimates'] = estimates
+        return result
     
+    @profiled
     def check_missing(self):
         """
         Shows missing value count and percentage.
@@ -115,34 +180,126 @@ class KuyaEDA:
         
         return missing_df
     
-    def unique_summary(self):
+    @profiled
+    def missing_patterns(self, top=10, columns=None):
+        """
+        Shows which columns go missing together.
+        
+        Both tables come from bit-packed null masks built once: the
+        co-missingness matrix is a product of the masks and the patterns
+        are counted from packed per-row keys.
+        
+        Parameters:
+        -----------
+        top : int, default=10
+            Number of most frequent null patterns to report
+        columns : list, optional
+            Columns to analyze. Defaults to the columns with missing values
+        
+        Returns:
+        --------
+        dict
+            'co_missing': rows where both columns are null (diagonal holds
+            each column's null count), 'patterns': most frequent combinations
+            of null columns with row counts and percentages
+        """
+        bitmap = null_bitmap(self.df)
+        co_missing = bitmap.co_missing(columns)
+        patterns = bitmap.patterns(columns, top=top)
+        
+        if co_missing.empty:
+            print("✓ No missing values found!")
+            return {'co_missing': co_missing, 'patterns': patterns}
+        
+        print(f"🧩 Missing Value Patterns ({co_missing.shape[0]} columns with nulls):")
+        if co_missing.shape[0] <= 20:
+            print("\nCo-missingness (rows where both are null):")
+            print(co_missing.to_string())
+        
+        # Pairs that are null together most often, relative to the rarer column
+        counts = np.diag(co_missing.to_numpy())
+        rows, cols = np.triu_indices(len(counts), k=1)
+        together = co_missing.to_numpy()[rows, cols]
+        overlap = together / np.maximum(np.minimum(counts[rows], counts[cols]), 1)
+        order = np.argsort(-overlap, kind='stable')
+        strong = [i for i in order if overlap[i] >= 0.5][:5]
+        if strong:
+            print("\n🔗 Columns often missing together:")
+            for i in strong:
+                col1, col2 = co_missing.index[rows[i]], co_missing.index[cols[i]]
+                print(f"  • {col1} & {col2}: {together[i]:,} rows ({overlap[i]:.0%} of the rarer)")
+        
+        print(f"\n📋 Top {len(patterns)} null patterns:")
+        print(patterns.to_string(index=False))
+        
+        return {'co_missing': co_missing, 'patterns': patterns}
+    
+    @profiled
+    def unique_summary(self, approx=False, error=0.01, sample=None, stratify=None):
         """
         Shows count of unique values for each column.
         
+        Parameters:
+        -----------
+        approx : bool or dict, default=False
+            Estimate distinct counts with HyperLogLog sketches (a few KB per
+            column) instead of exact hash sets. A {column: HyperLogLog} dict
+            built over a stream is also accepted
+        error : float, default=0.01
+            Relative error of the approximate counts
+        sample : int or float, optional
+            Count a random sample of this many rows (or this fraction of the
+            rows) and estimate the full-data counts from it (GEE estimator,
+            with lower and upper bounds)
+        stratify : str, optional
+            Column whose groups keep their share of the sampled rows
+        
         Returns:
         --------
         pd.DataFrame
             DataFrame with unique value counts
         """
+        if sample is not None:
+            return KuyaEDA(sample_rows(self.df, sample, stratify)).unique_summary(approx, error)
+        info = sample_info(self.df)
+        rows = len(self.df) if info is None else info['population']
+        if info is None:
+            counts = distinct_counts(self.df, approx=approx, error=error)
+        else:
+            bounds = {col: distinct_estimate(self.df[col].value_counts(), len(self.df), rows)
+                      for col in self.df.columns}
+            counts = {col: bound[0] for col, bound in bounds.items()}
         unique_counts = []
         
         for col in self.df.columns:
-            nunique = self.df[col].nunique()
-            nunique_pct = (nunique / len(self.df)) * 100
-            unique_counts.append({
+            nunique = counts[col]
+            nunique_pct = (nunique / rows) * 100
+            record = {
                 'Column': col,
                 'Unique Values': nunique,
                 'Unique %': round(nunique_pct, 2),
                 'Data Type': str(self.df[col].dtype)
-            })
+            }
+            if info is not None:
+                record['Lower Bound'], record['Upper Bound'] = bounds[col][1:]
+            unique_counts.append(record)
         
         unique_df = pd.DataFrame(unique_counts)
         
-        print("🔍 Unique Values Summary:")
+        if info is not None:
+            print(describe_sample(info))
+        print("🔍 Unique Values Summary:" + (f" (approximate, ±{error:.0%})" if approx is not False else "")
+              + (" (estimated)" if info is not None else ""))
         print(unique_df.to_string(index=False))
         
         # Highlight potential ID columns or constants
-        potential_ids = unique_df[unique_df['Unique %'] > 95]['Column'].tolist()
+        if info is None:
+            potential_ids = unique_df[unique_df['Unique %'] > 95]['Column'].tolist()
+        else:
+            # In a sample, an ID column shows every sampled value exactly once
+            non_null = self.df.count()
+            potential_ids = [col for col in self.df.columns
+                             if non_null[col] > 1 and bounds[col][1] == non_null[col]]
         constants = unique_df[unique_df['Unique Values'] == 1]['Column'].tolist()
         
         if potential_ids:
@@ -152,7 +309,9 @@ class KuyaEDA:
         
         return unique_df
     
-    def correlation_report(self, method='pearson'):
+    @profiled
+    def correlation_report(self, method='pearson', threshold=0.7, top_k=None, float32=False,
+                           stream=None, sample=None, n_jobs=None, stratify=None):
         """
         Displays correlation table with heatmap.
         
@@ -160,38 +319,143 @@ class KuyaEDA:
         -----------
         method : str, default='pearson'
             Correlation method: 'pearson', 'spearman', or 'kendall'
+        threshold : float, default=0.7
+            Pairs with |r| above this are reported as strong
+        top_k : int, optional
+            Report at most the k strongest pairs
+        float32 : bool, default=False
+            Compute the matrix in single precision (halves memory on wide data)
+        stream : iterable of pd.DataFrame or CovarianceAccumulator, optional
+            Compute a Pearson matrix over chunks (e.g. pd.read_csv(...,
+            chunksize=...)) instead of this DataFrame, one chunk in memory at
+            a time. A CovarianceAccumulator merged across workers also works
+        sample : int or float, optional
+            Estimate the correlations from a random sample of this many rows
+            (or this fraction of the rows) and report 95% confidence
+            intervals for the strong pairs. With stream=, the chunks are
+            reservoir-sampled (any method), never loading the full stream
+        n_jobs : int, optional
+            Kendall only: threads used across column pairs (default: all CPUs)
+        stratify : str, optional
+            Column whose groups keep their share of the sampled rows
         
         Returns:
         --------
         pd.DataFrame
             Correlation matrix
         """
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
+        if sample is not None:
+            if isinstance(stream, CovarianceAccumulator):
+                raise ValueError("sample= needs raw chunks, not a CovarianceAccumulator")
+            sampled = sample_rows(self.df, sample, stratify) if stream is None else \
+                reservoir_sample(stream, sample, stratify)
+            return KuyaEDA(sampled).correlation_report(method, threshold, top_k, float32,
+                                                       n_jobs=n_jobs)
+        info = sample_info(self.df)
+        
+        if stream is not None:
+            if method != 'pearson':
+                raise ValueError("stream= only supports method='pearson'")
+            accumulator = stream
+            if not isinstance(stream, CovarianceAccumulator):
+                accumulator = CovarianceAccumulator()
+                for chunk in stream:
+                    if accumulator.columns is None:
+                        numeric = chunk.select_dtypes(include=[np.number]).columns
+                        accumulator.columns = list(numeric)
+                    block = chunk[accumulator.columns]
+                    if len(block.select_dtypes(include=[np.number]).columns) < block.shape[1]:
+                        # A later chunk may read a numeric column as text
+                        block = block.apply(pd.to_numeric, errors='coerce')
+                    accumulator.update(block)
+            numeric_cols = accumulator.columns or []
+        else:
+            numeric_cols = self.df.select_dtypes(include=[np.number]).columns
         
         if len(numeric_cols) < 2:
             print("⚠️  Need at least 2 numeric columns for correlation analysis")
             return pd.DataFrame()
         
-        corr_matrix = self.df[numeric_cols].corr(method=method)
+        if stream is not None:
+            corr_matrix = accumulator.correlation()
+            print(f"📦 Streamed {accumulator.n_rows:,} rows")
+        else:
+            corr_matrix = correlation_matrix(self.df[numeric_cols], method=method, float32=float32,
+                                             n_jobs=n_jobs, intervals=info is not None)
         
+        if info is not None:
+            print(describe_sample(info))
         print(f"🔗 Correlation Matrix ({method.capitalize()} method):")
-        print(corr_matrix.round(3).to_string())
+        if len(numeric_cols) <= 50:
+            print(corr_matrix.round(3).to_string())
+        else:
+            print(f"  ({len(numeric_cols)} columns - too wide to print, see the returned matrix)")
         
         # Find strong correlations (excluding diagonal)
-        print("\n🔥 Strong Correlations (|r| > 0.7):")
-        strong_corrs = []
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i+1, len(corr_matrix.columns)):
-                col1 = corr_matrix.columns[i]
-                col2 = corr_matrix.columns[j]
-                corr_val = corr_matrix.iloc[i, j]
-                if abs(corr_val) > 0.7:
-                    strong_corrs.append(f"  • {col1} ↔ {col2}: {corr_val:.3f}")
-        
-        if strong_corrs:
-            for corr in strong_corrs:
-                print(corr)
+        print(f"\n🔥 Strong Correlations (|r| > {threshold}):")
+        pairs = strong_pairs(corr_matrix, threshold, top_k)
+        
+        if len(pairs):
+            lower, upper = corr_matrix.attrs.get('ci_lower'), corr_matrix.attrs.get('ci_upper')
+            for col1, col2, corr_val in pairs.itertuples(index=False):
+                if lower is None:
+                    print(f"  • {col1} ↔ {col2}: {corr_val:.3f}")
+                else:
+                    print(f"  • {col1} ↔ {col2}: {corr_val:.3f} "
+                          f"[{lower.loc[col1, col2]:.3f}, {upper.loc[col1, col2]:.3f}]")
         else:
             print("  No strong correlations found")
         
         return corr_matrix
+    
+    @profiled
+    def association_report(self, method='cramers_v', threshold=0.5, top_k=None, columns=None,
+                           bias_correction=True, n_jobs=None):
+        """
+        Displays the association table of categorical columns.
+        
+        Parameters:
+        -----------
+        method : str, default='cramers_v'
+            'cramers_v' or 'mutual_info' (normalized mutual information)
+        threshold : float, default=0.5
+            Pairs with an association above this are reported as strong
+        top_k : int, optional
+            Report at most the k strongest pairs
+        columns : list, optional
+            Columns to compare. Defaults to object and category columns
+        bias_correction : bool, default=True
+            Cramér's V only: correct for the number of categories, so
+            identifier-like columns don't look associated with everything
+        n_jobs : int, optional
+            Threads used across column pairs (default: all CPUs)
+        
+        Returns:
+        --------
+        pd.DataFrame
+            Association matrix (0 = independent, 1 = fully associated)
+        """
+        if columns is None:
+            columns = self.df.select_dtypes(include=['object', 'category']).columns
+        if len(columns) < 2:
+            print("⚠️  Need at least 2 categorical columns for association analysis")
+            return pd.DataFrame()
+        
+        matrix = association_matrix(self.df, columns, method=method,
+                                    bias_correction=bias_correction, n_jobs=n_jobs)
+        name = "Cramér's V" if method == 'cramers_v' else "normalized mutual information"
+        print(f"🧩 Association Matrix ({name}):")
+        if len(columns) <= 50:
+            print(matrix.round(3).to_string())
+        else:
+            print(f"  ({len(columns)} columns - too wide to print, see the returned matrix)")
+        
+        print(f"\n🔥 Strong Associations (> {threshold}):")
+        pairs = strong_pairs(matrix, threshold, top_k)
+        if len(pairs):
+            for col1, col2, value in pairs.itertuples(index=False):
+                print(f"  • {col1} ↔ {col2}: {value:.3f}")
+        else:
+            print("  No strong associations found")
+        
+        return matrix
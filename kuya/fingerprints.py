@@ -0,0 +1,436 @@
+"""
+Fingerprints Module
+64-bit row fingerprints for finding duplicate rows.
+
+Rows are hashed once per call with pd.util.hash_pandas_object. The hashes
+can be collected in a RowFingerprintIndex, which grows batch by batch and
+spills to disk by hash partition, so duplicates are found across chunks and
+files larger than memory.
+
+Near-duplicates (casing, spacing, typos) are found with MinHash signatures
+over character n-grams and locality-sensitive hashing, which only compares
+rows that share a signature band.
+"""
+
+import os
+import shutil
+import tempfile
+import weakref
+
+import numpy as np
+import pandas as pd
+
+
+def _subset_columns(df, subset=None):
+    """Columns to hash: all of them, or the given label / list of labels."""
+    if subset is None:
+        return list(df.columns)
+    if not pd.api.types.is_list_like(subset):
+        subset = [subset]
+    missing = [col for col in subset if col not in df.columns]
+    if missing:
+        raise KeyError(f"Columns not found: {missing}")
+    return list(subset)
+
+
+def row_hashes(df, subset=None):
+    """
+    One 64-bit hash per row (the index is not hashed).
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+    subset : list, optional
+        Columns to hash. Defaults to all columns
+
+    Returns:
+    --------
+    np.ndarray
+        uint64 array of length len(df)
+    """
+    columns = _subset_columns(df, subset)
+    if not columns:
+        return np.zeros(len(df), dtype=np.uint64)
+    frame = df if columns == list(df.columns) else df[columns]
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+class RowFingerprintIndex:
+    """
+    Set of row fingerprints seen so far, updated batch by batch.
+
+    Hashes are kept in memory as a sorted array until `max_memory_rows`
+    distinct rows have been seen, then moved to one file per hash partition
+    so only the partitions a batch touches are loaded.
+
+    Example:
+    --------
+    >>> index = RowFingerprintIndex(subset=['email'])
+    >>> for path in ['jan.csv', 'feb.csv']:
+    ...     for chunk in pd.read_csv(path, chunksize=1_000_000):
+    ...         unique_rows = index.deduplicate(chunk)
+    """
+
+    def __init__(self, subset=None, max_memory_rows=10_000_000, spill_dir=None,
+                 partitions=64):
+        """
+        Initialize an empty index.
+
+        Parameters:
+        -----------
+        subset : list, optional
+            Columns that identify a row. Defaults to all columns
+        max_memory_rows : int, default=10_000_000
+            Distinct rows kept in memory (8 bytes each) before spilling to disk
+        spill_dir : str, optional
+            Directory for partition files. Defaults to a temporary directory
+            that is removed when the index is closed or garbage collected
+        partitions : int, default=64
+            Number of hash partitions on disk (rounded up to a power of two)
+        """
+        self.subset = subset
+        self.max_memory_rows = max_memory_rows
+        self.partitions = 1 << max(0, int(partitions - 1).bit_length())
+        self.n_rows = 0
+        self.n_duplicates = 0
+        self._seen = np.empty(0, dtype=np.uint64)
+        self._spill_dir = spill_dir
+        self._spilled = False
+        self._cleanup = None
+
+    def __len__(self):
+        """Number of distinct rows seen."""
+        return self.n_rows - self.n_duplicates
+
+    def __repr__(self):
+        where = f"spilled to {self._spill_dir}" if self._spilled else "in memory"
+        return f"RowFingerprintIndex(rows={self.n_rows}, distinct={len(self)}, {where})"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    @property
+    def spilled(self):
+        """True once the hashes live on disk."""
+        return self._spilled
+
+    def _partition_path(self, part):
+        return os.path.join(self._spill_dir, f"part-{part:05d}.npy")
+
+    def _partition_of(self, hashes):
+        shift = np.uint64(64 - (self.partitions.bit_length() - 1))
+        if self.partitions == 1:
+            return np.zeros(len(hashes), dtype=np.int64)
+        return (hashes >> shift).astype(np.int64)
+
+    def _load(self, part):
+        path = self._partition_path(part)
+        if os.path.exists(path):
+            return np.load(path)
+        return np.empty(0, dtype=np.uint64)
+
+    def _spill(self):
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix='kuya_fingerprints_')
+            self._cleanup = weakref.finalize(self, shutil.rmtree, self._spill_dir, True)
+        else:
+            os.makedirs(self._spill_dir, exist_ok=True)
+        self._spilled = True
+        self._store(self._seen)
+        self._seen = np.empty(0, dtype=np.uint64)
+
+    def _store(self, hashes):
+        """Merge sorted, distinct new hashes into their partition files."""
+        parts = self._partition_of(hashes)
+        bounds = np.searchsorted(parts, np.arange(self.partitions + 1))
+        for part in np.flatnonzero(np.diff(bounds)):
+            merged = np.union1d(self._load(part), hashes[bounds[part]:bounds[part + 1]])
+            np.save(self._partition_path(part), merged)
+
+    @staticmethod
+    def _isin_sorted(hashes, seen):
+        if len(seen) == 0:
+            return np.zeros(len(hashes), dtype=bool)
+        pos = np.minimum(np.searchsorted(seen, hashes), len(seen) - 1)
+        return seen[pos] == hashes
+
+    def contains(self, hashes):
+        """
+        Which hashes have been seen before (does not modify the index).
+
+        Parameters:
+        -----------
+        hashes : np.ndarray
+            uint64 row hashes, e.g. from row_hashes()
+
+        Returns:
+        --------
+        np.ndarray of bool
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if not self._spilled:
+            return self._isin_sorted(hashes, self._seen)
+
+        found = np.zeros(len(hashes), dtype=bool)
+        parts = self._partition_of(hashes)
+        for part in np.unique(parts):
+            rows = np.flatnonzero(parts == part)
+            found[rows] = self._isin_sorted(hashes[rows], self._load(part))
+        return found
+
+    def update_hashes(self, hashes):
+        """
+        Add a batch of row hashes.
+
+        Parameters:
+        -----------
+        hashes : np.ndarray
+            uint64 row hashes in row order
+
+        Returns:
+        --------
+        np.ndarray of bool
+            True where the row repeats an earlier row (in this or a previous batch)
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        repeated = pd.Index(hashes).duplicated(keep='first') | self.contains(hashes)
+        new = np.unique(hashes[~repeated])
+
+        if self._spilled:
+            self._store(new)
+        else:
+            self._seen = np.union1d(self._seen, new)
+            if len(self._seen) > self.max_memory_rows:
+                self._spill()
+
+        self.n_rows += len(hashes)
+        self.n_duplicates += int(repeated.sum())
+        return repeated
+
+    def update(self, df):
+        """
+        Add a batch of rows.
+
+        Parameters:
+        -----------
+        df : pd.DataFrame
+            The next chunk
+
+        Returns:
+        --------
+        np.ndarray of bool
+            True where the row duplicates an earlier row (keep='first' semantics
+            across all batches)
+        """
+        return self.update_hashes(row_hashes(df, self.subset))
+
+    def deduplicate(self, df):
+        """
+        Add a batch and return only its rows not seen before.
+
+        Parameters:
+        -----------
+        df : pd.DataFrame
+
+        Returns:
+        --------
+        pd.DataFrame
+        """
+        return df[~self.update(df)]
+
+    def close(self):
+        """Remove spilled partition files created by this index."""
+        if self._cleanup is not None:
+            self._cleanup()
+            self._cleanup = None
+        self._seen = np.empty(0, dtype=np.uint64)
+        self._spilled = False
+
+
+# Near-duplicate rows (MinHash + LSH)
+
+
+def _row_text(df, columns):
+    """One normalized string per row: lowercase, punctuation and extra spaces removed."""
+    parts = [df[col].astype('string').fillna('') for col in columns]
+    text = parts[0]
+    for part in parts[1:]:
+        text = text + ' ' + part
+    return (text.str.lower()
+                .str.replace(r'[\W_]+', ' ', regex=True)
+                .str.strip()
+                .astype(object))
+
+
+def _shingle_hashes(strings, ngram):
+    """
+    Character n-gram hashes of each string, as (hashes, starts).
+
+    Strings are padded with a space on both sides so short values still get a
+    shingle; `starts` holds each string's first position in `hashes`.
+    """
+    padded = [f" {s} " for s in strings]
+    lengths = np.fromiter(map(len, padded), dtype=np.int64, count=len(padded))
+    codes = np.frombuffer(''.join(padded).encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+
+    counts = np.maximum(lengths - ngram + 1, 0)
+    offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    positions = np.repeat(offsets - starts, counts) + np.arange(counts.sum())
+
+    hashes = np.zeros(len(positions), dtype=np.uint64)
+    for k in range(ngram):
+        hashes = hashes * np.uint64(0x1F_FFFF + 1) + codes[positions + k]
+    # splitmix64 finalizer so nearby code points land far apart
+    hashes ^= hashes >> np.uint64(30)
+    hashes *= np.uint64(0xBF58476D1CE4E5B9)
+    hashes ^= hashes >> np.uint64(27)
+    hashes *= np.uint64(0x94D049BB133111EB)
+    hashes ^= hashes >> np.uint64(31)
+    return hashes, starts, counts
+
+
+def minhash_signatures(strings, num_perm=64, ngram=3, seed=0, chunk_size=100_000):
+    """
+    MinHash signature of each string's character n-grams.
+
+    Parameters:
+    -----------
+    strings : list of str
+    num_perm : int, default=64
+        Signature length; the Jaccard estimate has standard error ~1/sqrt(num_perm)
+    ngram : int, default=3
+        Shingle length in characters
+    seed : int, default=0
+    chunk_size : int, default=100_000
+        Strings hashed per step (bounds memory)
+
+    Returns:
+    --------
+    np.ndarray
+        uint32 array of shape (len(strings), num_perm)
+    """
+    rng = np.random.default_rng(seed)
+    mult = rng.integers(1, 2**63, num_perm, dtype=np.uint64) | np.uint64(1)
+    add = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+
+    signatures = np.full((len(strings), num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+    for begin in range(0, len(strings), chunk_size):
+        hashes, starts, counts = _shingle_hashes(strings[begin:begin + chunk_size], ngram)
+        rows = np.flatnonzero(counts) + begin
+        if len(rows) == 0:
+            continue
+        starts = starts[counts > 0]
+        for k in range(num_perm):
+            permuted = ((hashes * mult[k] + add[k]) >> np.uint64(32)).astype(np.uint32)
+            signatures[rows, k] = np.minimum.reduceat(permuted, starts)
+    return signatures
+
+
+def _lsh_bands(threshold, num_perm, recall=0.95):
+    """
+    Bands × rows split for LSH: the longest bands (fewest candidate pairs)
+    that still make rows at exactly `threshold` similarity collide in at
+    least one band with probability `recall`.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands >= recall:
+            best = (bands, rows)
+    return best
+
+
+def _candidate_pairs(signatures, bands, rows):
+    """Pairs of rows sharing at least one LSH band bucket (each joined to its bucket's first row)."""
+    n = len(signatures)
+    pairs = []
+    powers = np.uint64(1_000_003) ** np.arange(rows, dtype=np.uint64)
+    for band in range(bands):
+        block = signatures[:, band * rows:(band + 1) * rows].astype(np.uint64)
+        keys = block @ powers if rows > 1 else block[:, 0]
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        new_bucket = np.concatenate([[True], sorted_keys[1:] != sorted_keys[:-1]])
+        anchors = order[np.flatnonzero(new_bucket)][np.cumsum(new_bucket) - 1]
+        linked = anchors != order
+        pairs.append(anchors[linked].astype(np.int64) * n + order[linked])
+    if not pairs:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    pairs = pd.unique(np.concatenate(pairs))
+    return pairs // n, pairs % n
+
+
+def near_duplicate_groups(df, columns=None, threshold=0.9, num_perm=64, ngram=3, seed=0):
+    """
+    Group rows whose text is nearly identical (estimated Jaccard similarity
+    of character n-grams >= threshold), without comparing every pair.
+
+    Values are lowercased and stripped of punctuation and extra whitespace
+    first, so rows differing only in casing or spacing always match and
+    small typos usually do. Rows whose columns are all empty are ignored.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+    columns : list, optional
+        Columns whose text is compared. Defaults to all columns
+    threshold : float, default=0.9
+        Minimum estimated Jaccard similarity
+    num_perm : int, default=64
+        MinHash signature length
+    ngram : int, default=3
+        Shingle length in characters
+    seed : int, default=0
+
+    Returns:
+    --------
+    np.ndarray
+        Group label per row (0, 1, ... in order of first appearance), -1 for
+        rows without a near duplicate
+    """
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+
+    if not 0 < threshold <= 1:
+        raise ValueError("threshold must be in (0, 1]")
+    columns = _subset_columns(df, columns)
+    labels = np.full(len(df), -1, dtype=np.int64)
+    if len(df) == 0 or not columns:
+        return labels
+
+    # Identical normalized rows are handled once
+    codes, uniques = pd.factorize(_row_text(df, columns))
+    n = len(uniques)
+    signatures = minhash_signatures(list(uniques), num_perm, ngram, seed)
+
+    left, right = _candidate_pairs(signatures, *_lsh_bands(threshold, num_perm))
+    keep = np.zeros(len(left), dtype=bool)
+    for begin in range(0, len(left), 1_000_000):
+        sl = slice(begin, begin + 1_000_000)
+        similarity = (signatures[left[sl]] == signatures[right[sl]]).mean(axis=1)
+        keep[sl] = similarity >= threshold
+    left, right = left[keep], right[keep]
+
+    graph = coo_matrix((np.ones(len(left), dtype=np.int8), (left, right)), shape=(n, n))
+    _, components = connected_components(graph, directed=False)
+
+    row_components = components[codes]
+    valid = (codes >= 0) & (uniques.to_numpy(dtype=object)[np.maximum(codes, 0)] != '')
+    sizes = np.bincount(row_components[valid], minlength=n)
+    grouped = valid & (sizes[row_components] > 1)
+
+    # Relabel groups by first appearance
+    first_label, relabeled = np.unique(row_components[grouped], return_inverse=True)
+    first_seen = np.full(len(first_label), len(df))
+    np.minimum.at(first_seen, relabeled, np.flatnonzero(grouped))
+    rank = np.empty(len(first_label), dtype=np.int64)
+    rank[np.argsort(first_seen, kind='stable')] = np.arange(len(first_label))
+    labels[grouped] = rank[relabeled]
+    return labels
@@ -0,0 +1,442 @@
+"""
+Groups Module
+Group indexers and significance tests for group comparisons.
+
+A group column is factorized once per call into integer codes, with the
+rows sorted by group. Every statistic of every value column in that call
+(comparisons, tests, group-wise cleaning, plot aggregations) then reuses
+the codes and aggregates with reduceat instead of hashing the keys again.
+The index is never kept between calls, since the frame may be edited in
+place.
+
+One-way ANOVA only needs each group's count, mean and variance, and
+Kruskal-Wallis only needs each group's rank sum. Both tests therefore run
+for many value columns at once from a single aggregation, without scanning
+the raw data per test.
+"""
+
+import numpy as np
+import pandas as pd
+
+TESTS = ('anova', 'kruskal')
+
+AGGREGATES = ('count', 'sum', 'mean', 'var', 'std', 'min', 'max', 'median')
+
+
+def _sorted_factorize(values):
+    """pd.factorize with sorted uniques, or in order of appearance if unorderable."""
+    try:
+        return pd.factorize(values, sort=True)
+    except TypeError:
+        return pd.factorize(values)
+
+
+class GroupIndex:
+    """
+    Integer group codes of a frame's rows and their sorted group boundaries.
+
+    Example:
+    --------
+    >>> index = group_index(df, 'region')
+    >>> index.sizes()                                  # rows per region
+    >>> index.aggregate(df[['sales', 'qty']], ['mean', 'median'])
+    >>> index.expand(index.aggregate(df[['sales']], ['mean']))   # row-aligned
+    """
+
+    def __init__(self, codes, keys):
+        """
+        Wrap factorized group keys.
+
+        Parameters:
+        -----------
+        codes : np.ndarray
+            int64 group code of every row, -1 where a key is missing
+        keys : pd.Index
+            Group keys in sorted order; group g is keys[g]
+        """
+        self.codes = codes
+        self.keys = keys
+        self._order = None
+        self._starts = None
+
+    @classmethod
+    def from_frame(cls, df, by):
+        """
+        Factorize the group columns of df.
+
+        Groups are numbered in sorted key order, like groupby(sort=True);
+        only observed key combinations become groups.
+        """
+        by = _group_columns(by)
+        factorized = [_sorted_factorize(df[col]) for col in by]
+        if len(by) == 1:
+            codes, uniques = factorized[0]
+            keys = pd.Index(uniques, name=by[0])
+            return cls(codes.astype(np.int64), keys)
+        sizes = [max(len(uniques), 1) for _, uniques in factorized]
+        combined = np.zeros(len(df), dtype=np.int64)
+        missing = np.zeros(len(df), dtype=bool)
+        for codes, _ in factorized:
+            missing |= codes < 0
+        if np.prod(sizes, dtype=float) < 2 ** 62:
+            # Mixed-radix number of the key tuple; sorts like the tuples
+            for (codes, _), size in zip(factorized, sizes):
+                combined = combined * size + codes
+        else:
+            combined = pd.MultiIndex.from_arrays(
+                [codes for codes, _ in factorized]).factorize(sort=True)[0]
+        present, inverse = np.unique(combined[~missing], return_inverse=True)
+        codes = np.full(len(df), -1, dtype=np.int64)
+        codes[~missing] = inverse.ravel()
+        first = np.zeros(len(present), dtype=np.int64)
+        first[inverse.ravel()[::-1]] = np.flatnonzero(~missing)[::-1]
+        keys = pd.MultiIndex.from_arrays(
+            [uniques.take(level_codes[first]) for level_codes, uniques in factorized], names=by)
+        return cls(codes, keys)
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def n_groups(self):
+        return len(self.keys)
+
+    def sizes(self):
+        """Rows in each group, as an int64 array."""
+        return np.diff(self.starts())
+
+    def order(self):
+        """Row positions sorted by group (stable), rows without a group left out."""
+        if self._order is None:
+            order = np.argsort(self.codes, kind='stable')
+            self._order = order[np.count_nonzero(self.codes < 0):]
+        return self._order
+
+    def starts(self):
+        """Boundaries of each group in order(): group g is order()[starts[g]:starts[g + 1]]."""
+        if self._starts is None:
+            counts = np.bincount(self.codes[self.codes >= 0], minlength=self.n_groups)
+            self._starts = np.r_[0, np.cumsum(counts)].astype(np.int64)
+        return self._starts
+
+    def aggregate(self, block, stats=('count', 'mean')):
+        """
+        Per-group statistics of numeric columns, NaN values skipped.
+
+        Parameters:
+        -----------
+        block : pd.DataFrame
+            Numeric columns aligned with the indexed frame
+        stats : list, default=('count', 'mean')
+            Any of 'count', 'sum', 'mean', 'var', 'std' (ddof=1), 'min',
+            'max' and 'median'
+
+        Returns:
+        --------
+        pd.DataFrame
+            Indexed by group key with (column, statistic) columns, like
+            groupby(by)[columns].agg(stats)
+        """
+        unknown = [stat for stat in stats if stat not in AGGREGATES]
+        if unknown:
+            raise ValueError(f"Unsupported statistics {unknown}; choose from {AGGREGATES}")
+        values = block.to_numpy(dtype=float, na_value=np.nan)[self.order()]
+        starts = self.starts()[:-1]
+        results = {}
+        if self.n_groups and len(values):
+            present = ~np.isnan(values)
+            filled = np.where(present, values, 0.0)
+            count = np.add.reduceat(present, starts, axis=0).astype(np.int64)
+            total = np.add.reduceat(filled, starts, axis=0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                mean = np.where(count > 0, total / count, np.nan)
+                if 'var' in stats or 'std' in stats:
+                    # Deviations from the group mean keep the variance stable
+                    deviation = np.where(present, values - np.repeat(mean, self.sizes(), axis=0), 0.0)
+                    spread = np.add.reduceat(deviation ** 2, starts, axis=0)
+                    var = np.where(count > 1, spread / (count - 1), np.nan)
+            results.update(count=count, sum=total, mean=mean)
+            if 'var' in stats or 'std' in stats:
+                results.update(var=var, std=np.sqrt(var))
+            if 'min' in stats:
+                low = np.minimum.reduceat(np.where(present, values, np.inf), starts, axis=0)
+                results['min'] = np.where(count > 0, low, np.nan)
+            if 'max' in stats:
+                high = np.maximum.reduceat(np.where(present, values, -np.inf), starts, axis=0)
+                results['max'] = np.where(count > 0, high, np.nan)
+            if 'median' in stats:
+                results['median'] = self._medians(values, count)
+        else:
+            empty = np.full((self.n_groups, values.shape[1]), np.nan)
+            results = {stat: empty for stat in AGGREGATES}
+            results['count'] = np.zeros(empty.shape, dtype=np.int64)
+
+        columns = pd.MultiIndex.from_product([block.columns, list(stats)])
+        frame = pd.DataFrame({
+            (col, stat): results[stat][:, pos]
+            for pos, col in enumerate(block.columns) for stat in stats
+        }, index=self.keys, columns=columns)
+        return frame
+
+    def _medians(self, values, count):
+        """Group medians of group-sorted values (one sort per column)."""
+        group = np.repeat(np.arange(self.n_groups), self.sizes())
+        starts = self.starts()[:-1]
+        medians = np.full(count.shape, np.nan)
+        for pos in range(values.shape[1]):
+            # NaN sorts last, so each group's values come first in its slice
+            column = values[np.lexsort((values[:, pos], group)), pos]
+            n = count[:, pos]
+            has = n > 0
+            lower = column[(starts + (n - 1) // 2)[has]]
+            upper = column[(starts + n // 2)[has]]
+            medians[has, pos] = (lower + upper) / 2
+        return medians
+
+    def mode(self, series):
+        """
+        Most frequent non-null value of series in every group.
+
+        Ties resolve to the smallest value, like Series.mode()[0]. Groups
+        with no value get NaN.
+
+        Returns:
+        --------
+        pd.Series
+            Indexed by group key
+        """
+        value_codes, uniques = _sorted_factorize(series)
+        valid = (self.codes >= 0) & (value_codes >= 0)
+        pairs = self.codes[valid] * max(len(uniques), 1) + value_codes[valid]
+        pairs, counts = np.unique(pairs, return_counts=True)
+        groups, values = np.divmod(pairs, max(len(uniques), 1))
+        order = np.lexsort((values, -counts, groups))
+        first = order[np.r_[True, groups[order][1:] != groups[order][:-1]]] if len(order) else order
+        modes = pd.Series(uniques.take(values[first]), index=groups[first])
+        modes = modes.reindex(pd.RangeIndex(self.n_groups))
+        modes.index = self.keys
+        modes.name = series.name
+        return modes
+
+    def expand(self, table):
+        """
+        Row-aligned copy of a per-group table (rows without a group get NaN).
+
+        Parameters:
+        -----------
+        table : pd.DataFrame or pd.Series
+            Indexed by group in the order of `keys`
+
+        Returns:
+        --------
+        Same type as table, one row per row of the indexed frame
+        """
+        expanded = table.reset_index(drop=True).reindex(self.codes)
+        return expanded.reset_index(drop=True)
+
+
+def _group_columns(by):
+    return list(by) if pd.api.types.is_list_like(by) else [by]
+
+
+def group_index(df, by):
+    """
+    Group indexer of df for the given group column(s).
+
+    Build it once per operation and pass it to the steps that aggregate by
+    the same columns; it describes the frame as it was when built.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+    by : str or list
+        Group column(s)
+
+    Returns:
+    --------
+    GroupIndex
+    """
+    return GroupIndex.from_frame(df, by)
+
+
+def _check_test(test):
+    if test not in TESTS:
+        raise ValueError(f"test must be one of {TESTS}")
+
+
+def anova_table(counts, means, variances):
+    """
+    One-way ANOVA F-test for each column from per-group aggregates.
+
+    Parameters:
+    -----------
+    counts, means, variances : pd.DataFrame
+        Non-null count, mean and sample variance (ddof=1) of every value
+        column (columns) in every group (rows), as from groupby().agg()
+
+    Returns:
+    --------
+    pd.DataFrame
+        Indexed by value column: 'statistic' (F), 'p_value', 'df_between',
+        'df_within' and 'effect_size' (eta squared)
+    """
+    from scipy import stats
+
+    n = counts.to_numpy(dtype=float)
+    means = means.to_numpy(dtype=float)
+    # Single-row groups have no variance but add nothing within the group
+    spread = np.nan_to_num(variances.to_numpy(dtype=float)) * np.maximum(n - 1, 0)
+    present = n > 0
+    means = np.where(present, means, 0.0)
+
+    total = n.sum(axis=0)
+    k = present.sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        grand = (n * means).sum(axis=0) / total
+        between = (n * (means - grand) ** 2).sum(axis=0)
+        within = spread.sum(axis=0)
+        df_between = k - 1
+        df_within = total - k
+        f_stat = (between / df_between) / (within / df_within)
+        effect = between / (between + within)
+    valid = (df_between > 0) & (df_within > 0)
+    f_stat = np.where(valid, f_stat, np.nan)
+    return pd.DataFrame({
+        'statistic': f_stat,
+        'p_value': stats.f.sf(f_stat, df_between, df_within),
+        'df_between': df_between,
+        'df_within': df_within.astype(np.int64),
+        'effect_size': np.where(valid, effect, np.nan),
+    }, index=counts.columns)
+
+
+def kruskal_table(counts, rank_sums, tie_correction):
+    """
+    Kruskal-Wallis H-test for each column from per-group rank sums.
+
+    Parameters:
+    -----------
+    counts, rank_sums : pd.DataFrame
+        Non-null count and sum of ranks (ranked over all groups together)
+        of every value column (columns) in every group (rows)
+    tie_correction : array-like
+        1 - sum(t**3 - t) / (N**3 - N) per column, t being the sizes of the
+        groups of tied values
+
+    Returns:
+    --------
+    pd.DataFrame
+        Indexed by value column: 'statistic' (H), 'p_value', 'df' and
+        'effect_size' (epsilon squared)
+    """
+    from scipy import stats
+
+    n = counts.to_numpy(dtype=float)
+    rank_sums = rank_sums.to_numpy(dtype=float)
+    total = n.sum(axis=0)
+    k = (n > 0).sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        spread = np.where(n > 0, rank_sums ** 2 / n, 0.0).sum(axis=0)
+        h_stat = 12 / (total * (total + 1)) * spread - 3 * (total + 1)
+        h_stat = h_stat / np.asarray(tie_correction, dtype=float)
+        effect = h_stat / (total - 1)
+    dof = k - 1
+    valid = (dof > 0) & np.isfinite(h_stat)
+    h_stat = np.where(valid, h_stat, np.nan)
+    return pd.DataFrame({
+        'statistic': h_stat,
+        'p_value': stats.chi2.sf(h_stat, dof),
+        'df': dof,
+        'effect_size': np.where(valid, effect, np.nan),
+    }, index=counts.columns)
+
+
+def _tie_correction(ranks):
+    """Kruskal-Wallis tie correction of each column of a rank frame."""
+    corrections = []
+    for col in ranks.columns:
+        values = ranks[col].to_numpy(dtype=float)
+        values = values[~np.isnan(values)]
+        # Tied values share one average rank, so equal ranks mark ties
+        _, ties = np.unique(values, return_counts=True)
+        ties = ties.astype(float)
+        n = float(len(values))
+        corrections.append(1 - (ties ** 3 - ties).sum() / (n ** 3 - n) if n > 1 else np.nan)
+    return np.array(corrections)
+
+
+def group_tests(df, group_col, value_cols=None, test='anova', aggregates=None, index=None):
+    """
+    Test whether the groups of group_col differ on each value column.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+    group_col : str
+        Column to group by (rows where it is null are left out)
+    value_cols : list, optional
+        Numeric columns to test. Defaults to every numeric column
+    test : str, default='anova'
+        'anova' (one-way F-test on the means) or 'kruskal' (Kruskal-Wallis
+        H-test on the ranks, robust to outliers and skew)
+    aggregates : pd.DataFrame, optional
+        Per-group 'count', 'mean' and 'var' (or 'std') of the value columns
+        already computed, as from GroupIndex.aggregate or groupby().agg();
+        the ANOVA is then taken from it without touching the data
+    index : GroupIndex, optional
+        group_index(df, group_col) already built for this call
+
+    Returns:
+    --------
+    pd.DataFrame
+        One row per value column: 'statistic', 'p_value', degrees of
+        freedom and 'effect_size'
+
+    Example:
+    --------
+    >>> group_tests(df, 'region', ['sales', 'margin'])
+    >>> group_tests(df, 'region', test='kruskal')
+    """
+    _check_test(test)
+    if value_cols is None:
+        value_cols = df.select_dtypes(include=[np.number]).columns.drop(group_col, errors='ignore')
+    value_cols = list(value_cols)
+    if index is None and (test == 'kruskal' or aggregates is None):
+        index = group_index(df, group_col)
+
+    if test == 'anova':
+        if aggregates is None:
+            aggregates = index.aggregate(df[value_cols], ['count', 'mean', 'var'])
+        counts = aggregates.xs('count', axis=1, level=1)[value_cols]
+        means = aggregates.xs('mean', axis=1, level=1)[value_cols]
+        if 'var' in aggregates.columns.get_level_values(1):
+            variances = aggregates.xs('var', axis=1, level=1)[value_cols]
+        else:
+            variances = aggregates.xs('std', axis=1, level=1)[value_cols] ** 2
+        return anova_table(counts, means, variances)
+
+    return _kruskal(index, df[value_cols])
+
+
+def _ranked(block):
+    """Ranks of every column (ties averaged) and their tie corrections."""
+    ranks = block.rank()
+    return ranks, _tie_correction(ranks)
+
+
+def _kruskal(index, block, ranked=None):
+    """
+    Kruskal-Wallis table for block grouped by a GroupIndex.
+
+    ranked is _ranked(block), shared between group columns; it is only
+    reused when no group label is missing, since otherwise the ranks must
+    be taken over the grouped rows alone.
+    """
+    missing = index.codes < 0
+    if missing.any():
+        block, ranked = block[~missing], None
+        index = GroupIndex(index.codes[~missing], index.keys)
+    ranks, correction = ranked if ranked is not None else _ranked(block)
+    sums = index.aggregate(ranks, ['count', 'sum'])
+    return kruskal_table(sums.xs('count', axis=1, level=1), sums.xs('sum', axis=1, level=1),
+                         correction)
@@ -6,8 +6,12 @@ Smart file loading and saving with automatic format detection.
 import pandas as pd
 import os
 
+from kuya.profiling import profiled
+from kuya.sampling import sample_rows, reservoir_sample
 
-def load(path, **kwargs):
+
+@profiled
+def load(path, sample=None, stratify=None, chunksize=1_000_000, **kwargs):
     """
     Auto-detects and reads CSV, Excel, JSON, or Parquet files.
     
@@ -15,6 +19,15 @@ def load(path, **kwargs):
     -----------
     path : str
         File path to load
+    sample : int or float, optional
+        Keep only a random sample of this many rows (or this fraction of the
+        rows). Delimited text files are read in chunks and reservoir-sampled,
+        so the full file is never in memory. The EDA reports recognise the
+        sample and show estimates with confidence intervals
+    stratify : str, optional
+        Column whose groups keep their share of the sampled rows
+    chunksize : int, default=1_000_000
+        Rows read at a time when sampling a delimited text file
     **kwargs : additional arguments passed to the appropriate pandas reader
     
     Returns:
@@ -32,6 +45,21 @@ def load(path, **kwargs):
     print(f"📂 Loading file: {os.path.basename(path)}")
     
     try:
+        if sample is not None and ext in ['.csv', '.tsv', '.txt']:
+            if ext == '.tsv':
+                kwargs.setdefault('sep', '\t')
+            elif ext == '.txt':
+                with open(path, 'r') as f:
+                    if '\t' in f.readline():
+                        kwargs.setdefault('sep', '\t')
+            df = reservoir_sample(pd.read_csv(path, chunksize=chunksize, **kwargs),
+                                  sample, stratify)
+            info = df.attrs['kuya_sample']
+            print(f"✓ Sampled {info['rows']:,} of {info['population']:,} rows × {df.shape[1]} columns")
+            memory_mb = df.memory_usage(deep=True).sum() / 1024**2
+            print(f"💾 Memory usage: {memory_mb:.2f} MB")
+            return df
+        
         if ext == '.csv':
             df = pd.read_csv(path, **kwargs)
             print(f"✓ Loaded CSV file: {df.shape[0]} rows × {df.shape[1]} columns")
@@ -65,6 +93,10 @@ def load(path, **kwargs):
         else:
             raise ValueError(f"❌ Unsupported file format: {ext}")
         
+        if sample is not None:
+            df = sample_rows(df, sample, stratify)
+            print(f"✓ Sampled {len(df):,} rows")
+        
         # Quick data info
         memory_mb = df.memory_usage(deep=True).sum() / 1024**2
         print(f"💾 Memory usage: {memory_mb:.2f} MB")
@@ -76,6 +108,7 @@ def load(path, **kwargs):
         raise
 
 
+@profiled
 def save(df, path, index=False, **kwargs):
     """
     Saves DataFrame in the appropriate format based on file extension.
@@ -0,0 +1,303 @@
+"""
+Missing Values Module
+Bit-packed null masks shared by every missing-value check.
+
+A top-level analysis computes the null masks once and stores them with
+np.packbits (one bit per row, 8x smaller than a boolean frame). Counts, row
+masks and co-missingness are then answered from the bits with popcounts and
+matrix products instead of calling isnull() on the whole frame again. Steps
+run on their own that only need counts use one vectorized isnull().sum().
+"""
+
+import numpy as np
+import pandas as pd
+
+# Bits set in each byte value, used where np.bitwise_count is unavailable
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(bits, axis=None):
+    """Number of set bits in a uint8 array (summed over axis)."""
+    if hasattr(np, 'bitwise_count'):
+        counts = np.bitwise_count(bits)
+    else:
+        counts = _POPCOUNT[bits]
+    return counts.sum(axis=axis, dtype=np.int64)
+
+
+class NullBitmap:
+    """
+    Bit-packed null masks of a DataFrame, one row of bits per column.
+
+    Example:
+    --------
+    >>> bitmap = null_bitmap(df)
+    >>> bitmap.counts()             # nulls per column
+    >>> bitmap.co_missing()         # rows where both columns are null
+    >>> bitmap.patterns(top=5)      # most frequent combinations of nulls
+    """
+
+    def __init__(self, bits, columns, n_rows):
+        """
+        Wrap packed masks.
+
+        Parameters:
+        -----------
+        bits : np.ndarray
+            uint8 array of shape (len(columns), ceil(n_rows / 8)) from
+            np.packbits, padding bits set to zero
+        columns : list
+            Column labels, one per row of `bits`
+        n_rows : int
+            Number of rows the masks cover
+        """
+        self.bits = bits
+        self.columns = list(columns)
+        self.n_rows = n_rows
+        self._counts = None
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        Pack the null mask of every column of df.
+
+        One isna() over the whole frame, packed along the rows in a single
+        np.packbits call.
+        """
+        nulls = df.isna().to_numpy(dtype=bool)
+        # One contiguous row of bits per column; packing along a contiguous
+        # axis is several times faster than packing across a strided one
+        bits = np.packbits(np.ascontiguousarray(nulls.T), axis=1)
+        return cls(bits, df.columns, len(df))
+
+    def __len__(self):
+        return self.n_rows
+
+    @property
+    def nbytes(self):
+        """Memory held by the packed masks."""
+        return self.bits.nbytes
+
+    def counts(self):
+        """
+        Null count of each column.
+
+        Returns:
+        --------
+        pd.Series
+            int64 counts indexed by column
+        """
+        if self._counts is None:
+            self._counts = pd.Series(_popcount(self.bits, axis=1), index=self.columns)
+        return self._counts.copy()
+
+    def missing_columns(self):
+        """Columns with at least one null, in frame order."""
+        counts = self.counts()
+        return counts.index[counts.to_numpy() > 0].tolist()
+
+    def total(self):
+        """Number of null cells in the frame."""
+        return int(self.counts().sum())
+
+    def column(self, col):
+        """Boolean null mask of one column."""
+        pos = self.columns.index(col)
+        return np.unpackbits(self.bits[pos], count=self.n_rows).astype(bool)
+
+    def row_mask(self, columns=None, how='any'):
+        """
+        Rows with a null in any (or all) of the given columns.
+
+        Parameters:
+        -----------
+        columns : list, optional
+            Columns to combine. Defaults to all columns
+        how : str, default='any'
+            'any' or 'all'
+
+        Returns:
+        --------
+        np.ndarray
+            Boolean mask of length n_rows
+        """
+        if how not in ('any', 'all'):
+            raise ValueError("how must be 'any' or 'all'")
+        positions = self._positions(columns)
+        if not positions:
+            return np.zeros(self.n_rows, dtype=bool)
+        reduce = np.bitwise_or if how == 'any' else np.bitwise_and
+        combined = reduce.reduce(self.bits[positions], axis=0)
+        return np.unpackbits(combined, count=self.n_rows).astype(bool)
+
+    def co_missing(self, columns=None, block_bytes=None):
+        """
+        Co-missingness matrix: rows where both columns are null.
+
+        Computed as the product of the unpacked masks with themselves, one
+        block of rows at a time. The diagonal holds each column's null count.
+
+        Parameters:
+        -----------
+        columns : list, optional
+            Columns to include. Defaults to the columns with nulls
+        block_bytes : int, optional
+            Packed bytes per column unpacked at once (8 rows per byte).
+            Defaults to about 16M unpacked cells per block
+
+        Returns:
+        --------
+        pd.DataFrame
+            int64 matrix indexed by column on both axes
+        """
+        if columns is None:
+            columns = self.missing_columns()
+        positions = self._positions(columns)
+        matrix = np.zeros((len(positions), len(positions)))
+        bits = self.bits[positions]
+        block_bytes = block_bytes or self._block_bytes(len(positions))
+        for start in range(0, bits.shape[1], block_bytes):
+            block = np.unpackbits(bits[:, start:start + block_bytes], axis=1).astype(np.float32)
+            # Counts per block stay far below 2**24, so float32 sums are exact
+            matrix += block @ block.T
+        return pd.DataFrame(matrix.astype(np.int64), index=list(columns), columns=list(columns))
+
+    def patterns(self, columns=None, top=10, block_bytes=None):
+        """
+        Most frequent combinations of null columns across rows.
+
+        Parameters:
+        -----------
+        columns : list, optional
+            Columns to include. Defaults to the columns with nulls
+        top : int, default=10
+            Number of patterns to return (None for all)
+        block_bytes : int, optional
+            Packed bytes per column unpacked at once (8 rows per byte).
+            Defaults to about 16M unpacked cells per block
+
+        Returns:
+        --------
+        pd.DataFrame
+            One row per pattern: 'Missing Columns', 'Rows' and '%', most
+            frequent first. Complete rows appear as '(none)'
+        """
+        if columns is None:
+            columns = self.missing_columns()
+        columns = list(columns)
+        positions = self._positions(columns)
+        if not positions:
+            keys = np.zeros(1 if self.n_rows else 0, dtype='V1')
+            counts = np.full(len(keys), self.n_rows, dtype=np.int64)
+        else:
+            keys, counts = self._pattern_counts(self.bits[positions],
+                                                block_bytes or self._block_bytes(len(positions)))
+        # Keys come back sorted, so ties keep a stable order
+        order = np.argsort(-counts, kind='stable')
+        if top is not None:
+            order = order[:top]
+        ordered = [(self._key_bytes(keys[i], len(columns)), int(counts[i])) for i in order]
+        records = []
+        for key, count in ordered:
+            flags = np.unpackbits(np.frombuffer(key, dtype=np.uint8), count=len(columns))
+            names = [col for col, flag in zip(columns, flags) if flag]
+            records.append({
+                'Missing Columns': ', '.join(map(str, names)) if names else '(none)',
+                'Rows': count,
+                '%': round(count / max(self.n_rows, 1) * 100, 2),
+            })
+        return pd.DataFrame(records, columns=['Missing Columns', 'Rows', '%'])
+
+    def _pattern_counts(self, bits, block_bytes):
+        """Distinct packed null patterns and their row counts."""
+        all_keys, all_counts = [], []
+        for start in range(0, bits.shape[1], block_bytes):
+            rows = min(self.n_rows - start * 8, 8 * block_bytes)
+            block = np.unpackbits(bits[:, start:start + block_bytes], axis=1, count=rows)
+            # One packed key per row; rows with the same nulls share a key
+            keys = np.packbits(block.T, axis=1)
+            width = keys.shape[1]
+            if width <= 8:
+                # Up to 64 columns: count integer keys instead of sorting bytes
+                padded = np.zeros((rows, 8), dtype=np.uint8)
+                padded[:, :width] = keys
+                keys = padded.view('<u8').ravel()
+                if width <= 2:
+                    counts = np.bincount(keys)
+                    keys = np.flatnonzero(counts).astype('<u8')
+                    counts = counts[keys]
+                else:
+                    keys, counts = np.unique(keys, return_counts=True)
+            else:
+                keys = np.ascontiguousarray(keys).view(f'V{width}').ravel()
+                keys, counts = np.unique(keys, return_counts=True)
+            all_keys.append(keys)
+            all_counts.append(counts)
+        keys = np.concatenate(all_keys)
+        if len(all_keys) > 1:
+            keys, inverse = np.unique(keys, return_inverse=True)
+            counts = np.bincount(inverse.ravel(), weights=np.concatenate(all_counts),
+                                 minlength=len(keys))
+        else:
+            counts = all_counts[0]
+        return keys, counts.astype(np.int64)
+
+    @staticmethod
+    def _key_bytes(key, n_columns):
+        """Packed pattern bytes of one key from _pattern_counts."""
+        return np.asarray(key).tobytes()[:(n_columns + 7) // 8]
+
+    @staticmethod
+    def _block_bytes(n_columns):
+        """Packed bytes per block so an unpacked block holds ~16M cells."""
+        return max(1, (1 << 21) // max(n_columns, 1))
+
+    def _positions(self, columns):
+        if columns is None:
+            return list(range(len(self.columns)))
+        if not pd.api.types.is_list_like(columns):
+            columns = [columns]
+        lookup = {col: pos for pos, col in enumerate(self.columns)}
+        missing = [col for col in columns if col not in lookup]
+        if missing:
+            raise KeyError(f"Columns not found: {missing}")
+        return [lookup[col] for col in columns]
+
+
+def null_bitmap(df):
+    """
+    Packed null masks of df.
+
+    Build it once per analysis and pass it to the steps that need it; it is
+    not kept between calls, since the frame may be edited in place.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+
+    Returns:
+    --------
+    NullBitmap
+    """
+    return NullBitmap.from_frame(df)
+
+
+def null_counts(df, bitmap=None):
+    """
+    Null count of each column of df.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+    bitmap : NullBitmap, optional
+        Masks already built for df in this call. Ignored if they do not
+        cover df (e.g. df is a sample of the frame they were built from)
+
+    Returns:
+    --------
+    pd.Series
+        int64 counts indexed by column
+    """
+    if bitmap is not None and bitmap.n_rows == len(df) and bitmap.columns == list(df.columns):
+        return bitmap.counts()
+    return df.isnull().sum()
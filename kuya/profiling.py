@@ -0,0 +1,294 @@
+"""
+Profiling Module
+Find out which step of your Kuya workflow is slow or memory hungry.
+
+Usage:
+    with ky.profile() as p:
+        df_clean = ky.quick_clean(df)
+    p.report()
+    p.to_chrome_trace('trace.json')
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import pandas as pd
+
+
+_state = threading.local()
+
+
+def _active_profiler():
+    """Return the profiler collecting on this thread, if any."""
+    return getattr(_state, 'profiler', None)
+
+
+def _row_count(obj):
+    """Row count for DataFrame/Series-like objects, None otherwise."""
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return len(obj)
+    return None
+
+
+class _Span:
+    """A single timed call recorded by KuyaProfiler."""
+
+    __slots__ = ('name', 'depth', 'parent', 'start', 'cpu_start', 'mem_start',
+                 'child_peak', 'wall_time', 'cpu_time', 'peak_memory',
+                 'rows_in', 'rows_out', 'ts')
+
+    def __init__(self, name, depth, parent, rows_in, ts):
+        self.name = name
+        self.depth = depth
+        self.parent = parent
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.ts = ts
+        self.child_peak = 0
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.peak_memory = 0
+
+
+class KuyaProfiler:
+    """
+    Records wall time, CPU time, rows in/out and peak memory per Kuya call.
+
+    Use through ``kuya.profile()`` rather than directly.
+    """
+
+    def __init__(self, memory=True):
+        """
+        Initialize the profiler.
+
+        Parameters:
+        -----------
+        memory : bool, default=True
+            Track peak memory with tracemalloc (adds some overhead)
+        """
+        self.memory = memory
+        self.spans = []
+        self._stack = []
+        self._origin = None
+        self._started_tracemalloc = False
+        self._previous = None
+
+    # Context management
+    def __enter__(self):
+        self._previous = _active_profiler()
+        _state.profiler = self
+        self._origin = time.perf_counter()
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _state.profiler = self._previous
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        return False
+
+    def _enter(self, name, rows_in=None):
+        parent = self._stack[-1] if self._stack else None
+        now = time.perf_counter()
+        span = _Span(name, len(self._stack), parent, rows_in, now - self._origin)
+        if self.memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if parent is not None:
+                parent.child_peak = max(parent.child_peak, peak)
+            span.mem_start = current
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+        else:
+            span.mem_start = None
+        span.cpu_start = time.process_time()
+        span.start = now
+        self._stack.append(span)
+        self.spans.append(span)
+        return span
+
+    def _exit(self, span, rows_out=None):
+        span.wall_time = time.perf_counter() - span.start
+        span.cpu_time = time.process_time() - span.cpu_start
+        span.rows_out = rows_out
+        if span.mem_start is not None and tracemalloc.is_tracing():
+            peak = max(tracemalloc.get_traced_memory()[1], span.child_peak)
+            span.peak_memory = max(peak - span.mem_start, 0)
+            if span.parent is not None:
+                span.parent.child_peak = max(span.parent.child_peak, peak)
+        self._stack.pop()
+
+    # Exports
+    def to_frame(self):
+        """
+        Return the recorded trace as a table.
+
+        Returns:
+        --------
+        pd.DataFrame
+            One row per call, in call order
+        """
+        return pd.DataFrame([{
+            'step': '  ' * span.depth + span.name,
+            'depth': span.depth,
+            'wall_s': span.wall_time,
+            'cpu_s': span.cpu_time,
+            'rows_in': span.rows_in,
+            'rows_out': span.rows_out,
+            'peak_mb': span.peak_memory / 1024**2,
+        } for span in self.spans], columns=['step', 'depth', 'wall_s', 'cpu_s',
+                                             'rows_in', 'rows_out', 'peak_mb'])
+
+    def to_chrome_trace(self, path=None):
+        """
+        Export the trace in Chrome trace-event format.
+
+        Open the file in chrome://tracing or https://ui.perfetto.dev.
+
+        Parameters:
+        -----------
+        path : str, optional
+            File to write the JSON to. If None, only returns the dict
+
+        Returns:
+        --------
+        dict
+            Trace-event document
+        """
+        pid = os.getpid()
+        events = []
+        for span in self.spans:
+            events.append({
+                'name': span.name,
+                'cat': 'kuya',
+                'ph': 'X',
+                'ts': span.ts * 1e6,
+                'dur': span.wall_time * 1e6,
+                'pid': pid,
+                'tid': 0,
+                'args': {
+                    'cpu_ms': round(span.cpu_time * 1e3, 3),
+                    'rows_in': span.rows_in,
+                    'rows_out': span.rows_out,
+                    'peak_memory_bytes': span.peak_memory,
+                },
+            })
+        trace = {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+        if path is not None:
+            with open(path, 'w') as f:
+                json.dump(trace, f)
+            print(f"✓ Chrome trace saved to: {path}")
+
+        return trace
+
+    def report(self):
+        """
+        Print the recorded trace as a table.
+
+        Returns:
+        --------
+        pd.DataFrame
+            Same table as to_frame()
+        """
+        table = self.to_frame()
+        print("=" * 70)
+        print("⏱️  KUYA PROFILE")
+        print("=" * 70)
+        if len(table) == 0:
+            print("No Kuya calls recorded")
+        else:
+            width = max(table['step'].str.len().max(), 4)
+            print(f"{'Step':<{width}} {'Wall s':>9} {'CPU s':>9} "
+                  f"{'Rows in':>10} {'Rows out':>10} {'Peak MB':>9}")
+            print("-" * (width + 52))
+            for span in self.spans:
+                label = '  ' * span.depth + span.name
+                rows_in = '' if span.rows_in is None else f"{span.rows_in:,}"
+                rows_out = '' if span.rows_out is None else f"{span.rows_out:,}"
+                print(f"{label:<{width}} {span.wall_time:>9.4f} {span.cpu_time:>9.4f} "
+                      f"{rows_in:>10} {rows_out:>10} {span.peak_memory / 1024**2:>9.2f}")
+        print("=" * 70)
+        return table
+
+
+def profile(memory=True):
+    """
+    Profile every Kuya call made inside a ``with`` block.
+
+    Parameters:
+    -----------
+    memory : bool, default=True
+        Track peak memory with tracemalloc (adds some overhead)
+
+    Returns:
+    --------
+    KuyaProfiler
+        Context manager collecting the trace
+
+    Example:
+    --------
+    >>> with ky.profile() as p:
+    ...     ky.quick_clean(df)
+    >>> p.report()
+    """
+    return KuyaProfiler(memory=memory)
+
+
+def profiled(func):
+    """Decorator recording a Kuya public method or function call."""
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = _active_profiler()
+        if profiler is None:
+            return func(*args, **kwargs)
+
+        rows_in = None
+        if args:
+            target = args[0]
+            if not isinstance(target, (pd.DataFrame, pd.Series)):
+                target = getattr(target, 'df', None)
+            rows_in = _row_count(target)
+
+        span = profiler._enter(name, rows_in)
+        result = None
+        try:
+            result = func(*args, **kwargs)
+            return result
+        finally:
+            profiler._exit(span, _row_count(result))
+
+    return wrapper
+
+
+@contextmanager
+def step(name, df=None):
+    """
+    Record an inline step of a larger Kuya workflow.
+
+    Parameters:
+    -----------
+    name : str
+        Step name shown in the trace
+    df : pd.DataFrame, optional
+        Input frame, used for the rows_in column
+    """
+    profiler = _active_profiler()
+    if profiler is None:
+        yield
+        return
+
+    span = profiler._enter(name, _row_count(df))
+    try:
+        yield
+    finally:
+        profiler._exit(span)
@@ -0,0 +1,351 @@
+"""
+Sampling Module
+Row samples for fast exploratory runs, with error estimates.
+
+Rows are drawn by giving each one a random key and keeping the smallest
+keys (a reservoir sample), so a sample can be drawn from a frame or from a
+stream of chunks without holding the whole stream. Stratified samples keep
+the same share of every group as in the full data.
+
+A sample remembers the population it was drawn from (in `df.attrs`), which
+lets the EDA reports show estimated totals and confidence intervals.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+SAMPLE_ATTR = 'kuya_sample'
+
+
+def _z_value(confidence):
+    """Two-sided normal critical value, e.g. 1.96 for 0.95."""
+    from scipy import stats
+    return float(stats.norm.ppf(0.5 + confidence / 2))
+
+
+def _check_sample(sample):
+    """Validate a sample size (int rows) or fraction (0 < float < 1)."""
+    if isinstance(sample, (bool, np.bool_)):
+        raise TypeError("sample must be a row count or a fraction")
+    if isinstance(sample, (int, np.integer)):
+        if sample < 1:
+            raise ValueError("sample must be at least 1 row")
+        return int(sample)
+    sample = float(sample)
+    if not 0 < sample <= 1:
+        raise ValueError("A fractional sample must be in (0, 1]")
+    return sample
+
+
+def _allocate(target, stratum_sizes):
+    """
+    Rows per stratum for a proportional stratified sample.
+
+    target is a row count (split by largest remainder) or a fraction.
+    stratum_sizes is an array indexed by stratum code. Every non-empty
+    stratum gets at least one row.
+    """
+    sizes = np.asarray(stratum_sizes, dtype=float)
+    total = sizes.sum()
+    if isinstance(target, int):
+        exact = sizes * min(target, total) / max(total, 1)
+        allocation = np.floor(exact)
+        leftover = int(min(target, total) - allocation.sum())
+        if leftover > 0:
+            order = np.argsort(-(exact - allocation), kind='stable')
+            allocation[order[:leftover]] += 1
+    else:
+        allocation = np.round(sizes * target)
+    return np.clip(np.maximum(allocation, 1), 0, sizes).astype(np.int64)
+
+
+def _stratum_ranks(keys, codes):
+    """1-based rank of each key within its stratum code."""
+    # Keys are in [0, 1), so code + key sorts by stratum, then by key
+    order = np.argsort(codes + keys)
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    sizes = np.diff(np.r_[starts, len(codes)])
+    ranks = np.empty(len(keys), dtype=np.int64)
+    ranks[order] = np.arange(len(keys)) - np.repeat(starts, sizes) + 1
+    return ranks
+
+
+class _Reservoir:
+    """Keeps the rows with the smallest random keys, chunk by chunk."""
+
+    def __init__(self, sample, stratify=None, seed=0):
+        self.sample = _check_sample(sample)
+        self.stratify = stratify
+        self.rng = np.random.default_rng(seed)
+        self.frame = None
+        self.keys = np.empty(0)
+        self.positions = np.empty(0, dtype=np.int64)
+        self.codes = np.empty(0, dtype=np.int64)
+        self.population = 0
+        # Stratum labels seen so far; code 0 is the missing stratum, code
+        # i + 1 is labels[i]. Sizes are counted per code across chunks
+        self.labels = pd.Index([], dtype=object)
+        self.stratum_sizes = np.zeros(1, dtype=np.int64)
+
+    def _stratum_codes(self, strata):
+        """Stable stratum code of each row (missing values share code 0)."""
+        codes, uniques = pd.factorize(strata)
+        found = self.labels.get_indexer(uniques)
+        if (found < 0).any():
+            self.labels = self.labels.append(pd.Index(uniques[found < 0], dtype=object))
+            found = self.labels.get_indexer(uniques)
+        return np.where(codes >= 0, found[codes] + 1, 0).astype(np.int64)
+
+    def _retain(self, keys, codes):
+        """Mask of rows that may still end up in the sample."""
+        if self.stratify is None:
+            if isinstance(self.sample, float):
+                return keys < self.sample
+            keep = np.zeros(len(keys), dtype=bool)
+            if self.sample >= len(keys):
+                keep[:] = True
+            else:
+                keep[np.argpartition(keys, self.sample - 1)[:self.sample]] = True
+            return keep
+        ranks = _stratum_ranks(keys, codes)
+        if isinstance(self.sample, float):
+            # Oversample a little so each stratum can be trimmed to its exact share
+            cap = min(1.0, 1.5 * self.sample + 1e-3)
+            return (keys < cap) | (ranks <= 1)
+        return ranks <= self.sample
+
+    def update(self, chunk):
+        keys = self.rng.random(len(chunk))
+        positions = np.arange(self.population, self.population + len(chunk))
+        self.population += len(chunk)
+        codes = np.zeros(len(chunk), dtype=np.int64)
+        if self.stratify is not None:
+            codes = self._stratum_codes(chunk[self.stratify])
+            sizes = np.bincount(codes, minlength=len(self.labels) + 1)
+            sizes[:len(self.stratum_sizes)] += self.stratum_sizes
+            self.stratum_sizes = sizes
+        elif isinstance(self.sample, int) and len(self.keys) >= self.sample:
+            # Only rows beating the current largest kept key can enter
+            chunk_keep = keys < self.keys.max()
+            chunk, keys, positions = chunk[chunk_keep], keys[chunk_keep], positions[chunk_keep]
+            codes = codes[chunk_keep]
+        frame = chunk if self.frame is None else pd.concat([self.frame, chunk])
+        keys = np.concatenate([self.keys, keys])
+        positions = np.concatenate([self.positions, positions])
+        codes = np.concatenate([self.codes, codes])
+        keep = self._retain(keys, codes)
+        self.frame, self.keys = frame[keep], keys[keep]
+        self.positions, self.codes = positions[keep], codes[keep]
+
+    def result(self):
+        frame, keys, positions = self.frame, self.keys, self.positions
+        if frame is None:
+            raise ValueError("No rows to sample")
+        method = 'bernoulli' if isinstance(self.sample, float) else 'reservoir'
+        if self.stratify is not None:
+            method = 'stratified'
+            allocation = _allocate(self.sample, self.stratum_sizes)
+            ranks = _stratum_ranks(keys, self.codes)
+            keep = ranks <= allocation[self.codes]
+            frame, positions = frame[keep], positions[keep]
+        frame = frame.iloc[np.argsort(positions, kind='stable')]
+        frame.attrs = dict(frame.attrs)
+        frame.attrs[SAMPLE_ATTR] = {
+            'rows': len(frame),
+            'population': self.population,
+            'method': method,
+            'stratify': self.stratify,
+        }
+        return frame
+
+
+def sample_rows(df, sample, stratify=None, seed=0):
+    """
+    Random sample of a DataFrame's rows.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+    sample : int or float
+        Number of rows, or a fraction of the rows (0 < sample <= 1)
+    stratify : str, optional
+        Column whose groups keep their share of the rows. Every group gets
+        at least one row; missing values form a group of their own
+    seed : int, default=0
+        Random seed
+
+    Returns:
+    --------
+    pd.DataFrame
+        The sampled rows in their original order. attrs['kuya_sample']
+        records the sample and population sizes
+    """
+    reservoir = _Reservoir(sample, stratify, seed)
+    reservoir.update(df)
+    return reservoir.result()
+
+
+def reservoir_sample(chunks, sample, stratify=None, seed=0):
+    """
+    Random sample of a stream of DataFrame chunks.
+
+    Only the sample (plus one chunk) is held in memory, so this works on
+    files far larger than memory.
+
+    Parameters:
+    -----------
+    chunks : iterable of pd.DataFrame
+        e.g. pd.read_csv(path, chunksize=1_000_000)
+    sample : int or float
+        Number of rows (reservoir sample), or a fraction of the rows
+        (each row kept with that probability)
+    stratify : str, optional
+        Column whose groups keep their share of the rows
+    seed : int, default=0
+        Random seed
+
+    Returns:
+    --------
+    pd.DataFrame
+        The sampled rows in stream order, with attrs['kuya_sample']
+
+    Example:
+    --------
+    >>> chunks = pd.read_csv('events.csv', chunksize=1_000_000)
+    >>> sample = reservoir_sample(chunks, 100_000, stratify='country')
+    >>> KuyaDataFrame(sample).summary()     # estimates with 95% intervals
+    """
+    reservoir = _Reservoir(sample, stratify, seed)
+    for chunk in chunks:
+        reservoir.update(chunk)
+    return reservoir.result()
+
+
+def sample_info(df):
+    """
+    Sampling record of df, or None when df is not a Kuya sample.
+
+    Frames derived from a sample (filtered, sliced) inherit its attrs, so
+    the record only counts while the row count still matches.
+    """
+    info = df.attrs.get(SAMPLE_ATTR)
+    if not info or info.get('rows') != len(df):
+        return None
+    return info
+
+
+def describe_sample(info):
+    """One-line description of a sample for report headers."""
+    how = f"{info['method']} sample" + (f" by '{info['stratify']}'" if info.get('stratify') else '')
+    return f"🎲 Estimated from {info['rows']:,} of {info['population']:,} rows ({how}, 95% CI)"
+
+
+def _finite_population(n, population):
+    """Finite population correction for the standard error."""
+    if population <= 1 or n >= population:
+        return 0.0 if n >= population else 1.0
+    return math.sqrt((population - n) / (population - 1))
+
+
+def proportion_interval(successes, n, population, confidence=0.95):
+    """
+    Estimated share and confidence interval (Wilson score, with the finite
+    population correction). Arrays are accepted.
+
+    Returns:
+    --------
+    tuple of np.ndarray
+        (estimate, lower, upper), as fractions
+    """
+    successes = np.asarray(successes, dtype=float)
+    n = np.asarray(n, dtype=float)
+    z = _z_value(confidence) * _finite_population(float(np.max(n, initial=0)), population)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        p = successes / n
+        denominator = 1 + z ** 2 / n
+        center = (p + z ** 2 / (2 * n)) / denominator
+        margin = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denominator
+    return p, np.clip(center - margin, 0, 1), np.clip(center + margin, 0, 1)
+
+
+def mean_interval(block, population, confidence=0.95):
+    """
+    Mean of each numeric column with a normal-approximation interval.
+
+    Returns:
+    --------
+    pd.DataFrame
+        'mean', 'mean_ci_lower', 'mean_ci_upper' per column
+    """
+    counts = block.count()
+    means = block.mean()
+    stderr = block.std() / np.sqrt(counts)
+    z = _z_value(confidence) * _finite_population(len(block), population)
+    return pd.DataFrame({
+        'mean': means,
+        'mean_ci_lower': means - z * stderr,
+        'mean_ci_upper': means + z * stderr,
+    })
+
+
+def median_interval(block, confidence=0.95):
+    """
+    Median of each numeric column with a distribution-free interval from
+    order statistics (binomial ranks around n / 2).
+
+    Returns:
+    --------
+    pd.DataFrame
+        'median', 'median_ci_lower', 'median_ci_upper' per column
+    """
+    z = _z_value(confidence)
+    rows = {}
+    for col in block.columns:
+        values = np.sort(block[col].to_numpy(dtype=float, na_value=np.nan))
+        values = values[~np.isnan(values)]
+        n = len(values)
+        if n == 0:
+            rows[col] = (np.nan, np.nan, np.nan)
+            continue
+        spread = z * math.sqrt(n) / 2
+        lower = int(np.clip(math.floor(n / 2 - spread), 0, n - 1))
+        upper = int(np.clip(math.ceil(n / 2 + spread), 0, n - 1))
+        rows[col] = (float(np.median(values)), values[lower], values[upper])
+    return pd.DataFrame.from_dict(rows, orient='index',
+                                  columns=['median', 'median_ci_lower', 'median_ci_upper'])
+
+
+def distinct_estimate(sample_counts, n, population):
+    """
+    Distinct values in the population from the value counts of a sample.
+
+    Uses the Guaranteed-Error Estimator (Charikar et al., 2000): values seen
+    once in the sample stand for sqrt(N / n) values each. The bounds are the
+    distinct values seen (lower) and the estimate if every singleton stood
+    for N / n values (upper).
+
+    Parameters:
+    -----------
+    sample_counts : pd.Series
+        value_counts() of the sampled column
+    n : int
+        Sampled rows
+    population : int
+        Rows in the full data
+
+    Returns:
+    --------
+    tuple of int
+        (estimate, lower, upper)
+    """
+    seen = len(sample_counts)
+    if n >= population or seen == 0:
+        return seen, seen, seen
+    singletons = int((sample_counts.to_numpy() == 1).sum())
+    scale = population / n
+    estimate = math.sqrt(scale) * singletons + (seen - singletons)
+    upper = min(scale * singletons + (seen - singletons), population)
+    return int(round(min(estimate, upper))), seen, int(round(upper))
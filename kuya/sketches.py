@@ -0,0 +1,1056 @@
+"""
+Sketches Module
+Small, mergeable summaries of large columns (quantiles, distinct counts,
+top values, histograms, moments).
+
+Sketches can be updated chunk by chunk and merged across workers, so
+statistics that normally need the whole column in memory also work on
+streamed or partitioned data.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+
+def _as_float_array(values):
+    """Non-null float values of a Series/array-like as a 1-D NumPy array."""
+    if isinstance(values, (pd.Series, pd.Index)):
+        values = values.to_numpy(dtype=float, na_value=np.nan)
+    else:
+        values = np.asarray(values, dtype=float).ravel()
+    return values[~np.isnan(values)]
+
+
+class QuantileSketch:
+    """
+    Mergeable streaming quantile sketch (KLL).
+
+    Keeps a few thousand values regardless of how many are added. Any
+    quantile is answered within roughly `error` normalized rank error.
+
+    Example:
+    --------
+    >>> sketch = QuantileSketch(error=0.01)
+    >>> for chunk in pd.read_csv('big.csv', chunksize=1_000_000):
+    ...     sketch.update(chunk['amount'])
+    >>> sketch.quantile([0.25, 0.5, 0.75])
+    """
+
+    _DECAY = 2 / 3
+
+    def __init__(self, error=0.01, seed=0):
+        """
+        Initialize an empty sketch.
+
+        Parameters:
+        -----------
+        error : float, default=0.01
+            Target normalized rank error (0.01 = quantiles within ±1% rank)
+        seed : int, optional
+            Seed for the random compaction offsets (default 0, reproducible)
+        """
+        if not 0 < error < 1:
+            raise ValueError("error must be between 0 and 1")
+        self.error = error
+        self.k = max(8, int(math.ceil(3.0 / error)))
+        self.n = 0
+        self.min = np.nan
+        self.max = np.nan
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        return self.n
+
+    def __repr__(self):
+        return f"QuantileSketch(n={self.n}, error={self.error}, retained={self.retained})"
+
+    @property
+    def retained(self):
+        """Number of values currently stored."""
+        return sum(len(level) for level in self._levels)
+
+    def _capacity(self, level):
+        depth = len(self._levels) - level - 1
+        return max(2, int(math.ceil(self.k * self._DECAY ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                items = np.sort(items)
+                odd = len(items) % 2
+                offset = self._rng.integers(2)
+                promoted = items[odd + offset::2]
+                self._levels[level] = items[:odd]
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+            level += 1
+
+    def update(self, values):
+        """
+        Add a batch of values (NaNs are ignored).
+
+        Parameters:
+        -----------
+        values : array-like or pd.Series
+
+        Returns:
+        --------
+        QuantileSketch
+            self, for chaining
+        """
+        values = _as_float_array(values)
+        if len(values) == 0:
+            return self
+        self.n += len(values)
+        self.min = np.nanmin([self.min, values.min()])
+        self.max = np.nanmax([self.max, values.max()])
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Merge another sketch (e.g. from another chunk or worker) into this one.
+
+        Parameters:
+        -----------
+        other : QuantileSketch
+
+        Returns:
+        --------
+        QuantileSketch
+            self, for chaining
+        """
+        if other.n == 0:
+            return self
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self.n += other.n
+        self.min = np.nanmin([self.min, other.min])
+        self.max = np.nanmax([self.max, other.max])
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """
+        Approximate quantile(s).
+
+        Parameters:
+        -----------
+        q : float or list of float
+            Quantile(s) between 0 and 1
+
+        Returns:
+        --------
+        float or np.ndarray
+            NaN if the sketch is empty
+        """
+        scalar = np.isscalar(q)
+        qs = np.atleast_1d(np.asarray(q, dtype=float))
+        if self.n == 0:
+            result = np.full(len(qs), np.nan)
+            return result[0] if scalar else result
+
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h)
+                                  for h, level in enumerate(self._levels)])
+        order = np.argsort(items, kind='stable')
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+        ranks = qs * cumulative[-1]
+        idx = np.minimum(np.searchsorted(cumulative, ranks, side='left'), len(items) - 1)
+        result = items[idx]
+        result = np.where(qs <= 0, self.min, np.where(qs >= 1, self.max, result))
+        return float(result[0]) if scalar else result
+
+    @classmethod
+    def from_values(cls, values, error=0.01, chunk_size=1_000_000, seed=0):
+        """
+        Build a sketch from a column, feeding it in chunks.
+
+        Parameters:
+        -----------
+        values : array-like or pd.Series
+        error : float, default=0.01
+        chunk_size : int, default=1_000_000
+        seed : int, default=0
+
+        Returns:
+        --------
+        QuantileSketch
+        """
+        sketch = cls(error=error, seed=seed)
+        for start in range(0, len(values), chunk_size):
+            sketch.update(values[start:start + chunk_size])
+        return sketch
+
+
+def _hash_values(values):
+    """64-bit hashes of the non-null values of a Series/array-like."""
+    if not isinstance(values, pd.Series):
+        values = pd.Series(np.asarray(values).ravel())
+    values = values.dropna()
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_integer_dtype(values):
+        # Hash integers exactly: through float, IDs above 2**53 would merge
+        if pd.api.types.is_unsigned_integer_dtype(values):
+            return pd.util.hash_array(values.to_numpy(dtype=np.uint64).view(np.int64))
+        return pd.util.hash_array(values.to_numpy(dtype=np.int64))
+    if pd.api.types.is_float_dtype(values):
+        # Integral floats hash as int64, so 1 and 1.0 count once whatever
+        # dtype a chunk is read with
+        floats = values.to_numpy(dtype=float)
+        integral = (floats == np.floor(floats)) & (np.abs(floats) < 2.0 ** 63)
+        hashes = pd.util.hash_array(floats)
+        if integral.any():
+            hashes[integral] = pd.util.hash_array(floats[integral].astype(np.int64))
+        return hashes
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+class HyperLogLog:
+    """
+    Mergeable approximate distinct counter (HyperLogLog).
+
+    Uses 2**p one-byte registers (16 KB for the default 1% error) no matter
+    how many values are added.
+
+    Example:
+    --------
+    >>> hll = HyperLogLog(error=0.01)
+    >>> for chunk in pd.read_csv('big.csv', chunksize=1_000_000):
+    ...     hll.update(chunk['customer_id'])
+    >>> hll.count()
+    """
+
+    def __init__(self, error=0.01):
+        """
+        Initialize an empty sketch.
+
+        Parameters:
+        -----------
+        error : float, default=0.01
+            Target relative standard error (1.04 / sqrt(2**p)); p is capped at 4..18
+        """
+        if not 0 < error < 1:
+            raise ValueError("error must be between 0 and 1")
+        self.error = error
+        self.p = int(min(18, max(4, math.ceil(2 * math.log2(1.04 / error)))))
+        self.registers = np.zeros(1 << self.p, dtype=np.uint8)
+
+    def __repr__(self):
+        return f"HyperLogLog(p={self.p}, estimate={self.count()})"
+
+    def update(self, values):
+        """
+        Add a batch of values (nulls are ignored).
+
+        Parameters:
+        -----------
+        values : array-like or pd.Series
+
+        Returns:
+        --------
+        HyperLogLog
+            self, for chaining
+        """
+        return self.update_hashes(_hash_values(values))
+
+    def update_hashes(self, hashes):
+        """Add precomputed 64-bit hashes (e.g. row fingerprints)."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if len(hashes) == 0:
+            return self
+        width = 64 - self.p
+        buckets = (hashes >> np.uint64(width)).astype(np.int64)
+        rest = hashes & np.uint64((1 << width) - 1)
+        # Rank = position of the leftmost 1-bit in the remaining bits
+        exponent = np.frexp(rest.astype(float))[1]
+        ranks = np.where(rest == 0, width + 1, width - exponent + 1).astype(np.uint8)
+        np.maximum.at(self.registers, buckets, ranks)
+        return self
+
+    def merge(self, other):
+        """
+        Merge another sketch with the same error into this one.
+
+        Parameters:
+        -----------
+        other : HyperLogLog
+
+        Returns:
+        --------
+        HyperLogLog
+            self, for chaining
+        """
+        if other.p != self.p:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        """
+        Estimated number of distinct values.
+
+        Returns:
+        --------
+        int
+        """
+        m = len(self.registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(float)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)  # linear counting for small sets
+        return int(round(estimate))
+
+
+class TopKSketch:
+    """
+    Mergeable heavy-hitter sketch (Space-Saving) for the most frequent values.
+
+    Keeps counters for the k most frequent values seen so far. Reported
+    counts never underestimate and overestimate by at most `floor`, the
+    largest count a value outside the sketch can have (roughly rows / k,
+    and 0 while fewer than k distinct values have been seen).
+
+    Example:
+    --------
+    >>> sketch = TopKSketch(k=100)
+    >>> for chunk in pd.read_csv('big.csv', chunksize=1_000_000):
+    ...     sketch.update(chunk['country'])
+    >>> sketch.top(5)
+    """
+
+    def __init__(self, k=100):
+        """
+        Initialize an empty sketch.
+
+        Parameters:
+        -----------
+        k : int, default=100
+            Number of counters kept
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = int(k)
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+        self.floor = 0
+        self.total = 0
+
+    def __repr__(self):
+        return f"TopKSketch(k={self.k}, total={self.total}, floor={self.floor})"
+
+    def _absorb(self, counts, errors, floor, total):
+        """Add another summary's counters (union, then keep the k largest)."""
+        union = self.counts.index.union(counts.index, sort=False)
+        merged = (self.counts.reindex(union, fill_value=self.floor)
+                  + counts.reindex(union, fill_value=floor))
+        merged_errors = (self.errors.reindex(union, fill_value=self.floor)
+                         + errors.reindex(union, fill_value=floor))
+        # Values in neither summary have at most floor_a + floor_b
+        new_floor = self.floor + floor
+        if len(merged) > self.k:
+            order = np.argsort(-merged.to_numpy(), kind='stable')
+            new_floor = max(new_floor, int(merged.iloc[order[self.k]]))
+            merged, merged_errors = merged.iloc[order[:self.k]], merged_errors.iloc[order[:self.k]]
+        self.counts = merged.astype(np.int64)
+        self.errors = merged_errors.astype(np.int64)
+        self.floor = int(new_floor)
+        self.total += int(total)
+        return self
+
+    def update(self, values):
+        """
+        Add a batch of values (nulls are ignored).
+
+        The batch is counted exactly in one hashing pass (value_counts) and
+        its top k merged into the sketch.
+
+        Parameters:
+        -----------
+        values : array-like or pd.Series
+
+        Returns:
+        --------
+        TopKSketch
+            self, for chaining
+        """
+        if not isinstance(values, pd.Series):
+            values = pd.Series(np.asarray(values).ravel())
+        counts = values.value_counts()
+        counts = counts[counts.to_numpy() > 0]  # unused categories
+        total = int(counts.sum())
+        floor = 0
+        if len(counts) > self.k:
+            floor = int(counts.iloc[self.k])
+            counts = counts.iloc[:self.k]
+        counts = counts.astype(np.int64)
+        return self._absorb(counts, pd.Series(0, index=counts.index, dtype=np.int64), floor, total)
+
+    def merge(self, other):
+        """
+        Merge another sketch into this one.
+
+        Parameters:
+        -----------
+        other : TopKSketch
+
+        Returns:
+        --------
+        TopKSketch
+            self, for chaining
+        """
+        return self._absorb(other.counts, other.errors, other.floor, other.total)
+
+    @property
+    def exact(self):
+        """True while every count is exact (fewer than k distinct values per batch)."""
+        return self.floor == 0
+
+    def top(self, n=10):
+        """
+        Most frequent values, most frequent first.
+
+        Ties are ordered by value (like Series.mode) when the values can be
+        compared.
+
+        Parameters:
+        -----------
+        n : int, default=10
+
+        Returns:
+        --------
+        pd.DataFrame
+            'value', 'count' (upper bound), 'lower' (lower bound) and
+            'share' (count / non-null values seen)
+        """
+        counts = self.counts
+        try:
+            counts = counts.sort_index()
+        except TypeError:
+            pass  # mixed types keep insertion order among ties
+        counts = counts.sort_values(ascending=False, kind='stable').iloc[:n]
+        errors = self.errors.reindex(counts.index)
+        return pd.DataFrame({
+            'value': counts.index,
+            'count': counts.to_numpy(),
+            'lower': (counts - errors).to_numpy(),
+            'share': counts.to_numpy() / max(self.total, 1),
+        })
+
+    def mode(self):
+        """Most frequent value, or None if no values were added."""
+        top = self.top(1)
+        return top['value'].iloc[0] if len(top) else None
+
+
+def distinct_counts(df, columns=None, approx=False, error=0.01):
+    """
+    Number of distinct non-null values per column, exact or approximate.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+    columns : list, optional
+        Defaults to all columns
+    approx : bool or dict, default=False
+        False uses nunique(), True builds a HyperLogLog per column, or pass a
+        {column: HyperLogLog} dict built over a stream (columns without a
+        sketch are sketched from df)
+    error : float, default=0.01
+        Relative error for sketches built here
+
+    Returns:
+    --------
+    pd.Series
+        Distinct counts indexed by column (counts sketched from df never
+        exceed the column's non-null count)
+    """
+    columns = list(df.columns) if columns is None else list(columns)
+    if approx is False:
+        return pd.Series({col: df[col].nunique() for col in columns}, index=columns, dtype=int)
+
+    sketches = approx if isinstance(approx, dict) else {}
+    counts = {}
+    for col in columns:
+        sketch = sketches.get(col)
+        if sketch is None:
+            sketch = HyperLogLog(error=error).update(df[col])
+            counts[col] = min(sketch.count(), int(df[col].count()))
+        else:
+            # A streamed sketch has seen more rows than df holds
+            counts[col] = sketch.count()
+    return pd.Series(counts, index=columns, dtype=int)
+
+
+def sketch_columns(df, columns=None, error=0.01, sketches=None, kind='quantile'):
+    """
+    Build or update one QuantileSketch, HyperLogLog, TopKSketch or Histogram
+    per column.
+
+    Call repeatedly with each chunk of a stream, passing the previous result
+    as `sketches`, or build per worker and combine with the sketches' merge().
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        A chunk of data
+    columns : list, optional
+        Columns to sketch. Defaults to all numeric columns for quantiles and
+        all columns otherwise
+    error : float, default=0.01
+        Target error for new sketches (rank error for quantiles, relative
+        error for distinct counts, and top-value counts within error × rows
+        via k = 1 / error counters)
+    sketches : dict, optional
+        Existing {column: sketch} to update in place
+    kind : {'quantile', 'distinct', 'topk', 'histogram'}, default='quantile'
+        QuantileSketch for quantiles, HyperLogLog for distinct counts,
+        TopKSketch for the most frequent values, Histogram (30 bins) for
+        distributions
+
+    Returns:
+    --------
+    dict
+        {column: sketch}
+    """
+    if kind not in ('quantile', 'distinct', 'topk', 'histogram'):
+        raise ValueError("kind must be 'quantile', 'distinct', 'topk' or 'histogram'")
+    if columns is None:
+        if kind in ('quantile', 'histogram'):
+            columns = df.select_dtypes(include=[np.number]).columns.tolist()
+        else:
+            columns = list(df.columns)
+    sketches = {} if sketches is None else sketches
+    for col in columns:
+        if col not in sketches:
+            if kind == 'quantile':
+                sketches[col] = QuantileSketch(error=error)
+            elif kind == 'distinct':
+                sketches[col] = HyperLogLog(error=error)
+            elif kind == 'histogram':
+                sketches[col] = Histogram()
+            else:
+                sketches[col] = TopKSketch(k=math.ceil(1 / error))
+        sketches[col].update(df[col])
+    return sketches
+
+
+def block_quantiles(block, q, quantiles='exact', error=0.01):
+    """
+    Quantiles of every column in a numeric block, exact or from sketches.
+
+    Parameters:
+    -----------
+    block : pd.DataFrame
+        Numeric columns
+    q : list of float
+        Quantiles to compute
+    quantiles : str or dict, default='exact'
+        'exact' uses DataFrame.quantile, 'approx' builds a QuantileSketch per
+        column, or pass a {column: QuantileSketch} dict built from a stream
+        (columns without a sketch are sketched from the block)
+    error : float, default=0.01
+        Rank error for sketches built here
+
+    Returns:
+    --------
+    pd.DataFrame
+        Indexed by q, one column per block column (like DataFrame.quantile)
+    """
+    if isinstance(quantiles, str):
+        if quantiles == 'exact':
+            return block.quantile(q)
+        if quantiles != 'approx':
+            raise ValueError("quantiles must be 'exact', 'approx', or a dict of QuantileSketch")
+        quantiles = {}
+
+    result = {}
+    for col in block.columns:
+        sketch = quantiles.get(col)
+        if sketch is None:
+            sketch = QuantileSketch.from_values(block[col], error=error)
+        result[col] = sketch.quantile(q)
+    return pd.DataFrame(result, index=pd.Index(q), columns=block.columns)
+
+
+class Histogram:
+    """
+    Mergeable fixed-width histogram of a numeric column.
+
+    Counts come from np.histogram, one pass per chunk. The bin edges are
+    fixed by `range` or taken from the first chunk; when later values fall
+    outside, neighbouring bins are merged in pairs (doubling the width) until
+    they fit, so counts stay exact and the number of bins stays constant.
+    Explicit unequal edges are kept until a value falls outside them; the
+    bins then become equal-width over the wider range, with the counts
+    spread by overlap.
+
+    Example:
+    --------
+    >>> hist = Histogram(bins=50)
+    >>> for chunk in pd.read_csv('big.csv', chunksize=1_000_000):
+    ...     hist.update(chunk['amount'])
+    >>> df.plot_histogram('amount', histogram=hist)
+    """
+
+    def __init__(self, bins=30, range=None):
+        """
+        Initialize an empty histogram.
+
+        Parameters:
+        -----------
+        bins : int, str or array-like, default=30
+            Number of bins, a NumPy binning rule used on the first chunk
+            ('auto', 'fd', 'sturges', ...) or explicit bin edges
+        range : tuple, optional
+            (min, max) of the bins. Histograms built over chunks or workers
+            with the same bins and range merge exactly
+        """
+        self.bins = bins
+        self.range = range
+        self.edges = None
+        self.counts = None
+        self.n = 0
+        self.sum = 0.0
+        self.min = np.nan
+        self.max = np.nan
+        if not isinstance(bins, (int, np.integer, str)):
+            self.edges = np.asarray(bins, dtype=float)
+        elif isinstance(bins, (int, np.integer)) and range is not None:
+            self.edges = np.linspace(range[0], range[1], int(bins) + 1)
+        if self.edges is not None:
+            self.counts = np.zeros(len(self.edges) - 1, dtype=np.int64)
+
+    def __repr__(self):
+        n_bins = 0 if self.counts is None else len(self.counts)
+        return f"Histogram(bins={n_bins}, n={self.n})"
+
+    @property
+    def _uniform(self):
+        widths = np.diff(self.edges)
+        return np.allclose(widths, widths[0], rtol=1e-9, atol=0)
+
+    def _init_edges(self, values):
+        if isinstance(self.bins, str):
+            edges = np.histogram_bin_edges(values, bins=self.bins)
+        else:
+            low, high = float(values.min()), float(values.max())
+            if low == high:
+                low, high = low - 0.5, high + 0.5
+            edges = np.linspace(low, high, int(self.bins) + 1)
+        self.edges = edges
+        self.counts = np.zeros(len(edges) - 1, dtype=np.int64)
+
+    def _spread(self, edges, counts):
+        """
+        Add counts binned on other edges, spreading each bin over the bins
+        it overlaps (values assumed uniform within a bin). The total count
+        is preserved.
+        """
+        left = np.maximum(edges[:-1, None], self.edges[None, :-1])
+        right = np.minimum(edges[1:, None], self.edges[None, 1:])
+        widths = np.diff(edges)[:, None]
+        overlap = np.clip(right - left, 0, None) / np.where(widths > 0, widths, 1)
+        spread = (counts[:, None] * overlap).sum(axis=0)
+        # Round while preserving the total count
+        rounded = np.floor(spread).astype(np.int64)
+        remainder = int(counts.sum() - rounded.sum())
+        order = np.argsort(-(spread - rounded), kind='stable')
+        rounded[order[:remainder]] += 1
+        self.counts += rounded
+
+    def _grow(self, low, high):
+        """Double the bin width until [low, high] fits, keeping the bin count."""
+        n_bins = len(self.counts)
+        if (low < self.edges[0] or high > self.edges[-1]) and not self._uniform:
+            # Pairing unequal bins would misplace counts: switch to equal-width
+            # bins over the combined range and spread the counts by overlap
+            edges, counts = self.edges, self.counts
+            self.edges = np.linspace(min(low, edges[0]), max(high, edges[-1]), n_bins + 1)
+            self.counts = np.zeros(n_bins, dtype=np.int64)
+            self._spread(edges, counts)
+            return
+        while low < self.edges[0] or high > self.edges[-1]:
+            width = (self.edges[-1] - self.edges[0]) / n_bins * 2
+            counts = self.counts
+            if high > self.edges[-1]:
+                # Keep the left edge, extend to the right
+                if n_bins % 2:
+                    counts = np.append(counts, 0)
+                merged = counts.reshape(-1, 2).sum(axis=1)
+                self.counts = np.concatenate([merged, np.zeros(n_bins - len(merged), np.int64)])
+                self.edges = np.linspace(self.edges[0], self.edges[0] + width * n_bins, n_bins + 1)
+            else:
+                # Keep the right edge, extend to the left
+                if n_bins % 2:
+                    counts = np.insert(counts, 0, 0)
+                merged = counts.reshape(-1, 2).sum(axis=1)
+                self.counts = np.concatenate([np.zeros(n_bins - len(merged), np.int64), merged])
+                self.edges = np.linspace(self.edges[-1] - width * n_bins, self.edges[-1], n_bins + 1)
+
+    def update(self, values):
+        """
+        Add a batch of values (nulls and infinities are ignored).
+
+        Parameters:
+        -----------
+        values : array-like or pd.Series
+
+        Returns:
+        --------
+        Histogram
+            self, for chaining
+        """
+        if isinstance(values, (pd.Series, pd.Index)):
+            values = values.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            values = np.asarray(values, dtype=float).ravel()
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            return self
+        if self.edges is None:
+            self._init_edges(values)
+        low, high = float(values.min()), float(values.max())
+        self._grow(low, high)
+        if self._uniform:
+            # Equal-width bins take NumPy's fast path (no binary search)
+            counts, _ = np.histogram(values, bins=len(self.counts),
+                                     range=(self.edges[0], self.edges[-1]))
+        else:
+            counts, _ = np.histogram(values, bins=self.edges)
+        self.counts += counts
+        self.n += len(values)
+        self.sum += float(values.sum())
+        self.min = np.fmin(self.min, low)
+        self.max = np.fmax(self.max, high)
+        return self
+
+    def merge(self, other):
+        """
+        Merge another histogram into this one.
+
+        Identical edges add exactly. Otherwise this histogram grows to cover
+        the other's range and each of the other's bins is spread over the
+        bins it overlaps, assuming values are uniform within a bin.
+
+        Parameters:
+        -----------
+        other : Histogram
+
+        Returns:
+        --------
+        Histogram
+            self, for chaining
+        """
+        if other.n == 0:
+            return self
+        if self.edges is None:
+            self.edges, self.counts = other.edges.copy(), other.counts.copy()
+        elif len(self.edges) == len(other.edges) and np.allclose(self.edges, other.edges):
+            self.counts += other.counts
+        else:
+            # Cover the other's bins, not just its values, so no count is cut off
+            self._grow(other.edges[0], other.edges[-1])
+            self._spread(other.edges, other.counts)
+        self.n += other.n
+        self.sum += other.sum
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        return self
+
+    @property
+    def mean(self):
+        """Exact mean of the values added."""
+        return self.sum / self.n if self.n else np.nan
+
+    def quantile(self, q):
+        """
+        Approximate quantile(s), interpolated linearly within bins.
+
+        Parameters:
+        -----------
+        q : float or list of float
+
+        Returns:
+        --------
+        float or np.ndarray
+        """
+        scalar = np.isscalar(q)
+        q = np.atleast_1d(np.asarray(q, dtype=float))
+        if self.n == 0:
+            result = np.full(len(q), np.nan)
+        else:
+            cumulative = np.concatenate([[0], np.cumsum(self.counts)]) / self.n
+            result = np.interp(q, cumulative, self.edges)
+            result = np.clip(result, self.min, self.max)
+        return float(result[0]) if scalar else result
+
+    def to_frame(self):
+        """Bins as a DataFrame with 'left', 'right' and 'count'."""
+        if self.edges is None:
+            return pd.DataFrame(columns=['left', 'right', 'count'])
+        return pd.DataFrame({'left': self.edges[:-1], 'right': self.edges[1:],
+                             'count': self.counts})
+
+
+class MomentAccumulator:
+    """
+    Mergeable per-column count, mean, variance, skewness, kurtosis, min and max.
+
+    Central moments are accumulated with the parallel (Chan/Pébay) update,
+    so chunks or workers can be summarized separately and merged exactly.
+    Each update is a handful of NumPy reductions over a contiguous float
+    block, whatever the number of columns.
+
+    Example:
+    --------
+    >>> acc = MomentAccumulator()
+    >>> for chunk in pd.read_csv('big.csv', chunksize=1_000_000):
+    ...     acc.update(chunk.select_dtypes('number'))
+    >>> acc.describe()
+    """
+
+    def __init__(self, columns=None, sketch_quantiles=False, error=0.01, histogram_bins=None):
+        """
+        Initialize an empty accumulator.
+
+        Parameters:
+        -----------
+        columns : list, optional
+            Column labels. Taken from the first DataFrame passed to update()
+        sketch_quantiles : bool, default=False
+            Also keep a QuantileSketch per column so describe() can report
+            approximate quartiles for streamed data
+        error : float, default=0.01
+            Rank error of the quantile sketches
+        histogram_bins : int or str, optional
+            Also keep a Histogram per column with these bins (see
+            histogram())
+        """
+        self.columns = None if columns is None else list(columns)
+        self.sketch_quantiles = sketch_quantiles
+        self.error = error
+        self.histogram_bins = histogram_bins
+        self.sketches = None
+        self.histograms = None
+        self._stats = None
+
+    def __repr__(self):
+        n_cols = 0 if self.columns is None else len(self.columns)
+        return f"MomentAccumulator(columns={n_cols}, rows={self.n_rows})"
+
+    @property
+    def n_rows(self):
+        """Rows seen so far (including rows with missing values)."""
+        return 0 if self._stats is None else self._stats['rows']
+
+    @staticmethod
+    def _block_stats(values):
+        """Moments of one float block (NaNs ignored), as a dict of per-column arrays."""
+        missing = np.isnan(values)
+        has_missing = missing.any()
+        count = (len(values) - missing.sum(axis=0)).astype(float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            total = np.nansum(values, axis=0) if has_missing else values.sum(axis=0)
+            mean = np.where(count > 0, total / count, 0.0)
+            centered = values - mean
+            if has_missing:
+                centered[missing] = 0.0
+            squared = centered * centered
+        return {
+            'rows': len(values),
+            'n': count,
+            'mean': mean,
+            'm2': squared.sum(axis=0),
+            'm3': np.einsum('ij,ij->j', squared, centered),
+            'm4': np.einsum('ij,ij->j', squared, squared),
+            # fmin/fmax skip NaNs; all-missing columns stay NaN
+            'min': np.fmin.reduce(values, axis=0) if len(values) else np.full(values.shape[1], np.nan),
+            'max': np.fmax.reduce(values, axis=0) if len(values) else np.full(values.shape[1], np.nan),
+        }
+
+    @staticmethod
+    def _combine(a, b):
+        """Parallel merge of two moment dicts."""
+        na, nb = a['n'], b['n']
+        n = na + nb
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = b['mean'] - a['mean']
+            ratio = np.where(n > 0, na * nb / n, 0.0)
+            safe_n = np.where(n > 0, n, 1.0)
+            mean = a['mean'] + delta * nb / safe_n
+            m2 = a['m2'] + b['m2'] + delta ** 2 * ratio
+            m3 = (a['m3'] + b['m3']
+                  + delta ** 3 * ratio * (na - nb) / safe_n
+                  + 3 * delta * (na * b['m2'] - nb * a['m2']) / safe_n)
+            m4 = (a['m4'] + b['m4']
+                  + delta ** 4 * ratio * (na * na - na * nb + nb * nb) / safe_n ** 2
+                  + 6 * delta ** 2 * (na * na * b['m2'] + nb * nb * a['m2']) / safe_n ** 2
+                  + 4 * delta * (na * b['m3'] - nb * a['m3']) / safe_n)
+        return {
+            'rows': a['rows'] + b['rows'],
+            'n': n, 'mean': mean, 'm2': m2, 'm3': m3, 'm4': m4,
+            'min': np.fmin(a['min'], b['min']),
+            'max': np.fmax(a['max'], b['max']),
+        }
+
+    def update(self, block, batch_size=None):
+        """
+        Add a chunk of rows.
+
+        Parameters:
+        -----------
+        block : pd.DataFrame or 2-D array
+            Numeric columns, same order as previous chunks
+        batch_size : int, optional
+            Rows reduced at a time (bounds temporary memory). Defaults to about
+            4 million cells per batch
+
+        Returns:
+        --------
+        MomentAccumulator
+            self, for chaining
+        """
+        if isinstance(block, pd.DataFrame):
+            if self.columns is None:
+                self.columns = list(block.columns)
+            values = block.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            values = np.asarray(block, dtype=float)
+            if values.ndim == 1:
+                values = values[:, None]
+            if self.columns is None:
+                self.columns = list(range(values.shape[1]))
+        if values.shape[1] != len(self.columns):
+            raise ValueError(f"Expected {len(self.columns)} columns, got {values.shape[1]}")
+
+        if batch_size is None:
+            batch_size = max(1, 4_000_000 // max(values.shape[1], 1))
+        for start in range(0, max(len(values), 1), batch_size):
+            stats = self._block_stats(values[start:start + batch_size])
+            self._stats = stats if self._stats is None else self._combine(self._stats, stats)
+
+        if self.sketch_quantiles:
+            if self.sketches is None:
+                self.sketches = [QuantileSketch(error=self.error) for _ in self.columns]
+            for i, sketch in enumerate(self.sketches):
+                sketch.update(values[:, i])
+        if self.histogram_bins is not None:
+            if self.histograms is None:
+                self.histograms = [Histogram(self.histogram_bins) for _ in self.columns]
+            for i, histogram in enumerate(self.histograms):
+                histogram.update(values[:, i])
+        return self
+
+    def merge(self, other):
+        """
+        Merge another accumulator over the same columns (e.g. from another worker).
+
+        Parameters:
+        -----------
+        other : MomentAccumulator
+
+        Returns:
+        --------
+        MomentAccumulator
+            self, for chaining
+        """
+        if other._stats is None:
+            return self
+        if self._stats is None:
+            self.columns = other.columns
+            self._stats = dict(other._stats)
+        else:
+            if list(other.columns) != list(self.columns):
+                raise ValueError("Cannot merge accumulators over different columns")
+            self._stats = self._combine(self._stats, other._stats)
+
+        if other.sketches is not None:
+            if self.sketches is None:
+                self.sketches = [QuantileSketch(error=self.error) for _ in self.columns]
+            for mine, theirs in zip(self.sketches, other.sketches):
+                mine.merge(theirs)
+        if other.histograms is not None:
+            if self.histograms is None:
+                self.histograms = [Histogram(other.histogram_bins) for _ in self.columns]
+            for mine, theirs in zip(self.histograms, other.histograms):
+                mine.merge(theirs)
+        return self
+
+    def histogram(self, column):
+        """
+        Histogram of one column (requires histogram_bins).
+
+        Parameters:
+        -----------
+        column : label
+
+        Returns:
+        --------
+        Histogram
+        """
+        if self.histograms is None:
+            raise ValueError("Create the accumulator with histogram_bins= to keep histograms")
+        return self.histograms[self.columns.index(column)]
+
+    def describe(self, quartiles=None):
+        """
+        Summary table in the layout of DataFrame.describe(), plus skew and kurtosis.
+
+        Std, skewness and (excess) kurtosis use the same sample corrections as
+        pandas' std(), skew() and kurt().
+
+        Parameters:
+        -----------
+        quartiles : pd.DataFrame, optional
+            Exact quartiles indexed by [0.25, 0.5, 0.75] (e.g. from
+            block_quantiles). Defaults to the quantile sketches, if kept
+
+        Returns:
+        --------
+        pd.DataFrame
+            Rows count, mean, std, min, 25%, 50%, 75%, max, skew, kurt
+        """
+        if self._stats is None:
+            return pd.DataFrame(columns=self.columns or [])
+
+        s = self._stats
+        n = s['n']
+        with np.errstate(invalid='ignore', divide='ignore'):
+            variance = s['m2'] / (n - 1)
+            g1 = np.sqrt(n) * s['m3'] / s['m2'] ** 1.5
+            skew = np.sqrt(n * (n - 1)) / (n - 2) * g1
+            g2 = n * s['m4'] / s['m2'] ** 2 - 3
+            kurt = ((n + 1) * g2 + 6) * (n - 1) / ((n - 2) * (n - 3))
+        # pandas reports 0 for constant columns
+        constant = s['m2'] <= 1e-14 * np.maximum(np.abs(s['mean']), 1) ** 2 * n
+        skew = np.where(n < 3, np.nan, np.where(constant, 0.0, skew))
+        kurt = np.where(n < 4, np.nan, np.where(constant, 0.0, kurt))
+
+        rows = {
+            'count': n,
+            'mean': np.where(n > 0, s['mean'], np.nan),
+            'std': np.where(n > 1, np.sqrt(np.maximum(variance, 0)), np.nan),
+            'min': np.where(n > 0, s['min'], np.nan),
+        }
+        if quartiles is None and self.sketches is not None:
+            quartiles = np.column_stack([sketch.quantile([0.25, 0.5, 0.75])
+                                         for sketch in self.sketches])
+        if quartiles is not None:
+            quartiles = np.asarray(quartiles, dtype=float)
+            for label, values in zip(['25%', '50%', '75%'], quartiles):
+                rows[label] = values
+        rows['max'] = np.where(n > 0, s['max'], np.nan)
+        rows['skew'] = skew
+        rows['kurt'] = kurt
+        return pd.DataFrame(rows, index=self.columns).T
@@ -8,6 +8,12 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from kuya.profiling import profiled
+from kuya.correlation import ASSOCIATIONS, association_matrix, correlation_matrix
+from kuya.sketches import Histogram
+from kuya.groups import group_index
+from kuya.sampling import sample_rows
+
 
 class KuyaViz:
     """Visualization utilities for Kuya."""
@@ -26,6 +32,7 @@ class KuyaViz:
         sns.set_style("whitegrid")
         plt.rcParams['figure.figsize'] = (10, 6)
     
+    @profiled
     def quick_plot(self, kind, x, y=None, title=None, **kwargs):
         """
         Simple wrapper for matplotlib/seaborn plots.
@@ -84,11 +91,14 @@ class KuyaViz:
                 sns.violinplot(data=self.df[x], **kwargs)
         
         elif kind == 'pie':
+            # Group sums and sizes come from one group index of x
+            index = group_index(self.df, x)
             if y:
                 # Aggregate data
-                data = self.df.groupby(x)[y].sum()
+                data = index.aggregate(self.df[[y]], ['sum'])[(y, 'sum')]
             else:
-                data = self.df[x].value_counts()
+                data = pd.Series(index.sizes(), index=index.keys)
+                data = data.sort_values(ascending=False, kind='stable')
             plt.pie(data.values, labels=data.index, autopct='%1.1f%%', **kwargs)
             plt.axis('equal')
         
@@ -106,31 +116,61 @@ class KuyaViz:
         
         return plt.gcf()
     
-    def plot_histogram(self, column, bins=30, title=None, **kwargs):
+    @profiled
+    def plot_histogram(self, column, bins=30, title=None, histogram=None, **kwargs):
         """
         Plots histogram for a single column.
         
+        Numeric bars are drawn from precomputed bin counts (a Histogram), so
+        only one NumPy pass over the column is needed, and a Histogram built
+        over a stream plots instantly without the data. Dates and other
+        non-numeric columns are binned by matplotlib.
+        
         Parameters:
         -----------
         column : str
             Column name to plot
-        bins : int, default=30
-            Number of histogram bins
+        bins : int, str or array-like, default=30
+            Number of histogram bins, a NumPy binning rule or bin edges
         title : str, optional
             Plot title
-        **kwargs : additional arguments passed to plt.hist
+        histogram : Histogram, optional
+            Precomputed counts (e.g. merged over chunks). The column is not
+            read; mean and median come from the histogram
+        **kwargs : additional arguments passed to plt.hist (histtype,
+            cumulative, density, ...). weights is not accepted, since the
+            counts are already binned
         
         Returns:
         --------
         matplotlib figure
         """
+        if 'weights' in kwargs:
+            raise ValueError("plot_histogram does not take weights; build a Histogram instead")
         plt.figure(figsize=kwargs.pop('figsize', (10, 6)))
-        
-        data = self.df[column].dropna()
-        
-        plt.hist(data, bins=bins, edgecolor='black', alpha=0.7, **kwargs)
+        density = kwargs.get('density', False)
+        
+        data = None if histogram is not None else self.df[column]
+        if data is not None and not pd.api.types.is_numeric_dtype(data):
+            # Dates and other non-numeric columns: let matplotlib bin the values
+            data = data.dropna()
+            plt.hist(data, bins=bins, edgecolor='black', alpha=0.7, **kwargs)
+            mean_val, median_val = data.mean(), data.median()
+        else:
+            if histogram is None:
+                histogram = Histogram(bins).update(data)
+                median_val = data.median()
+            else:
+                median_val = histogram.quantile(0.5)
+            mean_val = histogram.mean
+            
+            counts = histogram.counts if histogram.counts is not None else np.zeros(0)
+            edges = histogram.edges if histogram.edges is not None else np.zeros(1)
+            # One weighted point per bin redraws the precomputed counts
+            plt.hist(edges[:-1], bins=edges, weights=counts, edgecolor='black', alpha=0.7,
+                     **kwargs)
         plt.xlabel(column, fontsize=12)
-        plt.ylabel('Frequency', fontsize=12)
+        plt.ylabel('Density' if density else 'Frequency', fontsize=12)
         
         if title:
             plt.title(title, fontsize=14, fontweight='bold')
@@ -138,8 +178,6 @@ class KuyaViz:
             plt.title(f"Distribution of {column}", fontsize=14, fontweight='bold')
         
         # Add statistics
-        mean_val = data.mean()
-        median_val = data.median()
         plt.axvline(mean_val, color='red', linestyle='--', linewidth=2, label=f'Mean: {mean_val:.2f}')
         plt.axvline(median_val, color='green', linestyle='--', linewidth=2, label=f'Median: {median_val:.2f}')
         plt.legend()
@@ -149,31 +187,51 @@ class KuyaViz:
         
         return plt.gcf()
     
-    def corr_heatmap(self, method='pearson', annot=True, cmap='coolwarm', **kwargs):
+    @profiled
+    def corr_heatmap(self, method='pearson', annot=True, cmap='coolwarm', sample=None,
+                     n_jobs=None, **kwargs):
         """
         Plots correlation heatmap.
         
         Parameters:
         -----------
         method : str, default='pearson'
-            Correlation method: 'pearson', 'spearman', or 'kendall'
+            Correlation method: 'pearson', 'spearman', or 'kendall'.
+            'cramers_v' or 'mutual_info' plot the association of the
+            categorical columns instead
         annot : bool, default=True
             Whether to annotate cells with values
         cmap : str, default='coolwarm'
             Color map
+        sample : int or float, optional
+            Estimate the correlations from a random sample of this many rows
+            (or this fraction of the rows)
+        n_jobs : int, optional
+            Kendall and association methods: threads used across column pairs
         **kwargs : additional arguments passed to sns.heatmap
         
         Returns:
         --------
         matplotlib figure
         """
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
-        
-        if len(numeric_cols) < 2:
-            print("⚠️  Need at least 2 numeric columns for correlation heatmap")
-            return None
-        
-        corr_matrix = self.df[numeric_cols].corr(method=method)
+        categorical = method in ASSOCIATIONS
+        if categorical:
+            columns = self.df.select_dtypes(include=['object', 'category']).columns
+            if len(columns) < 2:
+                print("⚠️  Need at least 2 categorical columns for association heatmap")
+                return None
+            frame = self.df if sample is None else sample_rows(self.df, sample)
+            corr_matrix = association_matrix(frame, columns, method=method,
+                                             bias_correction=True, n_jobs=n_jobs)
+        else:
+            numeric_cols = self.df.select_dtypes(include=[np.number]).columns
+            
+            if len(numeric_cols) < 2:
+                print("⚠️  Need at least 2 numeric columns for correlation heatmap")
+                return None
+            
+            corr_matrix = correlation_matrix(self.df[numeric_cols], method=method,
+                                             sample=sample, n_jobs=n_jobs)
         
         plt.figure(figsize=kwargs.pop('figsize', (12, 8)))
         
@@ -181,7 +239,7 @@ class KuyaViz:
             corr_matrix, 
             annot=annot, 
             cmap=cmap, 
-            center=0,
+            center=None if categorical else 0,
             square=True,
             linewidths=1,
             cbar_kws={"shrink": 0.8},
@@ -189,13 +247,15 @@ class KuyaViz:
             **kwargs
         )
         
-        plt.title(f"Correlation Heatmap ({method.capitalize()})", 
+        title = "Association" if categorical else "Correlation"
+        plt.title(f"{title} Heatmap ({method.replace('_', ' ').title()})", 
                  fontsize=14, fontweight='bold', pad=20)
         plt.tight_layout()
         plt.show()
         
         return plt.gcf()
     
+    @profiled
     def pairplot(self, columns=None, hue=None, **kwargs):
         """
         Visualizes pairwise relations between features.
@@ -50,6 +50,547 @@ try:
 except Exception as e:
     print(f"✗ auto_report() failed: {e}")
 
+print("\n4. Testing duplicates after an in-place edit...")
+try:
+    df_dup = KuyaDataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+    assert len(df_dup.remove_duplicates()) == 3
+    df_dup.loc[1, :] = df_dup.loc[0, :].values
+    assert len(df_dup.remove_duplicates()) == 2
+    assert len(df_dup.drop_duplicates()) == 2
+    assert len(df_dup.detect_duplicates()) == 2
+    assert df_dup.quality_report()['duplicates'] == 1
+    print("✓ Duplicate checks see in-place edits!")
+except Exception as e:
+    print(f"✗ Duplicate checks failed: {e!r}")
+
+print("\n5. Testing group comparisons after an in-place edit...")
+try:
+    df_groups = KuyaDataFrame({'region': ['a', 'a', 'b', 'b'], 'sales': [1.0, 2.0, 3.0, 4.0]})
+    df_groups.compare_groups('region', 'sales')
+    df_groups.loc[0, 'region'] = 'c'
+    stats = df_groups.compare_groups('region', 'sales')
+    expected = df_groups.groupby('region')['sales'].count()
+    assert stats['count'].to_dict() == expected.to_dict(), stats
+    print("✓ compare_groups() sees in-place edits!")
+except Exception as e:
+    print(f"✗ Group comparison failed: {e!r}")
+
+print("\n6. Testing approximate distinct counts...")
+try:
+    from kuya.sketches import HyperLogLog, distinct_counts
+    big_ids = pd.Series(np.int64(1_600_000_000_000_000_000) + np.arange(100_000))
+    hll = HyperLogLog(error=0.01).update(big_ids)
+    assert abs(hll.count() - 100_000) < 3_000, hll.count()
+    mixed = HyperLogLog().update(pd.Series([1, 2, 3])).merge(
+        HyperLogLog().update(pd.Series([1.0, 2.0, 3.5])))
+    assert mixed.count() == 4, mixed.count()
+    streamed = distinct_counts(pd.DataFrame({'id': big_ids[:10]}), approx={'id': hll})
+    assert streamed['id'] == hll.count(), streamed
+    print("✓ HyperLogLog counts large integer IDs and streamed sketches!")
+except Exception as e:
+    print(f"✗ Distinct counts failed: {e!r}")
+
+print("\n7. Testing mergeable histograms...")
+try:
+    import matplotlib
+    matplotlib.use('Agg')
+    from kuya.sketches import Histogram
+    uneven = Histogram([0, 1, 10, 100]).update([0.5, 5, 50, 150])
+    expected, _ = np.histogram([0.5, 5, 50, 150], bins=uneven.edges)
+    assert uneven.counts.tolist() == expected.tolist(), (uneven.edges, uneven.counts)
+    rng = np.random.default_rng(0)
+    narrow = Histogram(10).update(rng.random(1000))
+    wide = Histogram(10, range=(0, 100)).update(rng.random(1000))
+    narrow.merge(wide)
+    assert narrow.counts.sum() == narrow.n == 2000, narrow.counts.sum()
+    values = rng.normal(size=4000)
+    single = Histogram(20, range=(-5, 5)).update(values)
+    chunked = Histogram(20, range=(-5, 5)).update(values[:1500]).merge(
+        Histogram(20, range=(-5, 5)).update(values[1500:]))
+    assert chunked.counts.tolist() == single.counts.tolist()
+    df_hist = KuyaDataFrame({'x': values})
+    df_hist.plot_histogram('x', histtype='step', cumulative=True)
+    df_hist.plot_histogram('x', histogram=single, density=True)
+    df_dates = KuyaDataFrame({'d': pd.date_range('2020-01-01', periods=50, freq='D')})
+    df_dates.loc[3, 'd'] = pd.NaT
+    df_dates.plot_histogram('d', bins=10)
+    print("✓ Histograms grow, merge and plot correctly!")
+except Exception as e:
+    print(f"✗ Histograms failed: {e!r}")
+
+print("\n8. Testing compare_all_groups()...")
+try:
+    rng = np.random.default_rng(1)
+    df_all = KuyaDataFrame({'g': rng.choice(list('abc'), 300), 'v': rng.normal(10, 1, 300),
+                            'w': rng.gamma(2, size=300)})
+    result = df_all.compare_all_groups()
+    expected = df_all.groupby('g')['v'].agg(['count', 'mean', 'median', 'std', 'min', 'max'])
+    got = result[result['value_col'] == 'v'].set_index('group')[expected.columns]
+    assert np.allclose(got.to_numpy(dtype=float), expected.to_numpy(dtype=float))
+    print("✓ compare_all_groups() matches groupby statistics!")
+except Exception as e:
+    print(f"✗ compare_all_groups() failed: {e!r}")
+
+print("\n9. Testing Kendall correlation against pandas...")
+try:
+    from kuya.correlation import kendall_matrix
+    rng = np.random.default_rng(2)
+    df_tau = pd.DataFrame(rng.integers(0, 5, size=(200, 4)).astype(float), columns=list('abcd'))
+    df_tau = df_tau.mask(rng.random(df_tau.shape) < 0.1)
+    expected = df_tau.corr(method='kendall')
+    assert np.allclose(kendall_matrix(df_tau, n_jobs=2), expected, equal_nan=True)
+    import warnings
+    df_tau['const'] = 1.0
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')  # workers must not warn on constant columns
+        result = kendall_matrix(df_tau, n_jobs=4)
+    assert result['const'].drop('const').isna().all()
+    print("✓ kendall_matrix() matches DataFrame.corr(method='kendall')!")
+except Exception as e:
+    print(f"✗ Kendall correlation failed: {e!r}")
+
+print("\n10. Testing clean_categories()...")
+try:
+    df_cat = KuyaDataFrame({'c': ['  A ', 'a', ' ', None, 'Café', 'cafe']})
+    cleaned = df_cat.clean_categories()['c']
+    assert list(cleaned.cat.categories) == ['a', 'cafe'], cleaned.cat.categories
+    assert cleaned.isna().tolist() == [False, False, True, True, False, False]
+    print("✓ clean_categories() merges variants and blanks become missing!")
+except Exception as e:
+    print(f"✗ clean_categories() failed: {e!r}")
+
+print("\n11. Testing grouped outliers with no other numeric columns...")
+try:
+    df_out = KuyaDataFrame({'store': [1, 1, 2, 2], 'label': list('abcd')})
+    result = df_out.handle_outliers(by='store', action='flag')
+    assert result.equals(df_out), result
+    print("✓ handle_outliers() skips frames whose only numeric column is the group!")
+except Exception as e:
+    print(f"✗ Grouped outliers failed: {e!r}")
+
+print("\n12. Testing merged quantile sketches...")
+try:
+    from kuya.sketches import QuantileSketch
+    rng = np.random.default_rng(3)
+    values = rng.normal(size=200_000)
+    probs = [0.1, 0.25, 0.5, 0.75, 0.9]
+    single = QuantileSketch(error=0.01).update(values)
+    merged = QuantileSketch(error=0.01).update(values[:70_000]).merge(
+        QuantileSketch(error=0.01, seed=1).update(values[70_000:]))
+    assert len(merged) == len(single) == len(values)
+    for sketch in (single, merged):
+        ranks = np.searchsorted(np.sort(values), sketch.quantile(probs)) / len(values)
+        assert np.abs(ranks - probs).max() < 0.01, ranks
+    print("✓ Merged quantile sketches stay within the rank error of one pass!")
+except Exception as e:
+    print(f"✗ Quantile sketches failed: {e!r}")
+
+print("\n13. Testing merged moment accumulators...")
+try:
+    from kuya.sketches import MomentAccumulator
+    rng = np.random.default_rng(4)
+    frame = pd.DataFrame(rng.gamma(2, size=(5000, 3)), columns=list('abc'))
+    frame = frame.mask(rng.random(frame.shape) < 0.05)
+    single = MomentAccumulator().update(frame).describe()
+    merged = MomentAccumulator().update(frame.iloc[:1234]).merge(
+        MomentAccumulator().update(frame.iloc[1234:])).describe()
+    assert np.allclose(single.to_numpy(dtype=float), merged.to_numpy(dtype=float), equal_nan=True)
+    expected = pd.DataFrame({'count': frame.count(), 'mean': frame.mean(), 'std': frame.std(),
+                             'min': frame.min(), 'max': frame.max(), 'skew': frame.skew(),
+                             'kurt': frame.kurt()}).T
+    assert np.allclose(merged.loc[expected.index].to_numpy(dtype=float), expected.to_numpy())
+    print("✓ Merged moments match one pass and pandas!")
+except Exception as e:
+    print(f"✗ Moment accumulators failed: {e!r}")
+
+print("\n14. Testing correlation_matrix() against pandas...")
+try:
+    from kuya.correlation import correlation_matrix
+    rng = np.random.default_rng(5)
+    frame = pd.DataFrame(rng.normal(size=(500, 5)), columns=list('vwxyz'))
+    with_nans = frame.mask(rng.random(frame.shape) < 0.1)
+    for block_size in (1024, 2):
+        result = correlation_matrix(with_nans, block_size=block_size)
+        assert np.allclose(result, with_nans.corr(), equal_nan=True)
+    assert np.allclose(correlation_matrix(frame, method='spearman'), frame.corr(method='spearman'))
+    print("✓ correlation_matrix() matches DataFrame.corr(), with missing values!")
+except Exception as e:
+    print(f"✗ correlation_matrix() failed: {e!r}")
+
+print("\n15. Testing merged covariance accumulators...")
+try:
+    from kuya.correlation import CovarianceAccumulator
+    rng = np.random.default_rng(6)
+    frame = pd.DataFrame(rng.normal(size=(4000, 4)), columns=list('abcd'))
+    frame['b'] += frame['a']
+    frame.iloc[2000:] = frame.iloc[2000:].mask(rng.random((2000, 4)) < 0.1)
+    acc = CovarianceAccumulator().update(frame.iloc[:2000]).merge(
+        CovarianceAccumulator().update(frame.iloc[2000:]))
+    assert np.allclose(acc.covariance(), frame.cov())
+    assert np.allclose(acc.correlation(), frame.corr())
+    print("✓ Merged covariance matches DataFrame.cov() and corr()!")
+except Exception as e:
+    print(f"✗ Covariance accumulators failed: {e!r}")
+
+print("\n16. Testing merged heavy-hitter sketches...")
+try:
+    from kuya.sketches import TopKSketch
+    rng = np.random.default_rng(7)
+    labels = pd.Series(rng.zipf(1.5, 20000) % 50)
+    merged = TopKSketch(k=100).update(labels[:8000]).merge(TopKSketch(k=100).update(labels[8000:]))
+    top = merged.top(10).set_index('value')['count']
+    expected = labels.value_counts().iloc[:10]
+    assert top.to_dict() == expected.to_dict(), top
+    assert merged.mode() == labels.mode().iloc[0]
+    print("✓ Merged top-k counts match value_counts()!")
+except Exception as e:
+    print(f"✗ Heavy-hitter sketches failed: {e!r}")
+
+print("\n17. Testing group_tests() against scipy...")
+try:
+    from scipy import stats as sp_stats
+    from kuya.groups import group_tests
+    rng = np.random.default_rng(8)
+    df_tests = pd.DataFrame({'g': rng.choice(list('abcd'), 400), 'v': rng.normal(size=400),
+                             'w': rng.exponential(size=400).round(1)})
+    df_tests.loc[df_tests['g'] == 'a', 'v'] += 0.5
+    for test, scipy_test in (('anova', sp_stats.f_oneway), ('kruskal', sp_stats.kruskal)):
+        result = group_tests(df_tests, 'g', ['v', 'w'], test=test)
+        for col in ('v', 'w'):
+            expected = scipy_test(*[group[col].to_numpy() for _, group in df_tests.groupby('g')])
+            assert np.isclose(result.loc[col, 'statistic'], expected[0]), (test, col)
+            assert np.isclose(result.loc[col, 'p_value'], expected[1]), (test, col)
+    print("✓ group_tests() matches scipy f_oneway and kruskal!")
+except Exception as e:
+    print(f"✗ group_tests() failed: {e!r}")
+
+print("\n18. Testing association_matrix() against scipy...")
+try:
+    from scipy.stats.contingency import association
+    from kuya.correlation import association_matrix
+    rng = np.random.default_rng(9)
+    df_assoc = pd.DataFrame({'x': rng.choice(list('abc'), 1000), 'y': rng.choice(list('pqrs'), 1000),
+                             'z': rng.choice(list('uv'), 1000)})
+    df_assoc['y'] = df_assoc['y'].where(rng.random(1000) < 0.7, df_assoc['x'])
+    result = association_matrix(df_assoc, n_jobs=2)
+    for a, b in (('x', 'y'), ('x', 'z'), ('y', 'z')):
+        table = pd.crosstab(df_assoc[a], df_assoc[b]).to_numpy()
+        assert np.isclose(result.loc[a, b], association(table, method='cramer')), (a, b)
+        assert result.loc[a, b] == result.loc[b, a]
+    print("✓ association_matrix() matches scipy's Cramer's V!")
+except Exception as e:
+    print(f"✗ association_matrix() failed: {e!r}")
+
+print("\n19. Testing shared null bitmaps...")
+try:
+    from kuya.missing import null_bitmap, null_counts
+    rng = np.random.default_rng(10)
+    df_nulls = KuyaDataFrame({'a': rng.random(1001), 'b': rng.choice(['x', None], 1001),
+                              'c': pd.array(rng.integers(0, 5, 1001), dtype='Int64'),
+                              'd': np.arange(1001)})
+    df_nulls.loc[df_nulls['a'] < 0.2, ['a', 'c']] = np.nan
+    bitmap = null_bitmap(df_nulls)
+    assert bitmap.counts().to_dict() == df_nulls.isnull().sum().to_dict()
+    assert (bitmap.row_mask() == df_nulls.isnull().any(axis=1).to_numpy()).all()
+    # Masks built for another frame are not used
+    assert null_counts(df_nulls.iloc[:10], bitmap).to_dict() == df_nulls.iloc[:10].isnull().sum().to_dict()
+    shared = df_nulls.quality_report(bitmap=bitmap)
+    assert shared['missing_pct'] == df_nulls.quality_report()['missing_pct']
+    assert df_nulls.auto_insights(bitmap=bitmap) == df_nulls.auto_insights()
+    assert df_nulls.summary(bitmap=bitmap)['missing'].to_dict() == df_nulls.isnull().sum().to_dict()
+    print("✓ One null bitmap serves quality_report, summary and auto_insights!")
+except Exception as e:
+    print(f"✗ Shared null bitmaps failed: {e!r}")
+
+print("\n20. Testing row sampling...")
+try:
+    from kuya.sampling import (sample_rows, reservoir_sample, sample_info, proportion_interval,
+                               mean_interval)
+    rng = np.random.default_rng(11)
+    population = pd.DataFrame({'g': rng.choice(['a', 'b', None], 3000, p=[0.5, 0.3, 0.2]),
+                               'x': rng.normal(size=3000)})
+    expected = population['g'].fillna('(missing)').value_counts() * 300 / len(population)
+    for frame in (population, population.astype({'g': 'string'})):
+        sampled = sample_rows(frame, 300, stratify='g')
+        assert len(sampled) == 300, len(sampled)
+        counts = sampled['g'].astype(object).fillna('(missing)').value_counts()
+        assert np.all(np.abs(counts - expected.reindex(counts.index)) < 1), counts
+        assert len(counts) == len(expected), counts
+    assert len(sample_rows(population, 250)) == 250
+    chunks = [population.iloc[start:start + 97] for start in range(0, len(population), 97)]
+    for size, stratify in ((250, None), (0.1, None), (250, 'g'), (0.1, 'g')):
+        whole = sample_rows(population, size, stratify=stratify)
+        streamed = reservoir_sample(iter(chunks), size, stratify=stratify)
+        assert whole.index.equals(streamed.index), (size, stratify)
+    info = sample_info(KuyaDataFrame(sample_rows(population, 300, stratify='g')))
+    assert info == {'rows': 300, 'population': 3000, 'method': 'stratified', 'stratify': 'g'}
+    assert sample_info(sample_rows(population, 300).iloc[:10]) is None
+    # 95% intervals should cover the population values in ~95% of samples
+    truth_p, truth_mean = (population['x'] > 1).mean(), population['x'].mean()
+    covered_p = covered_mean = 0
+    for seed in range(200):
+        sampled = sample_rows(population, 200, seed=seed)
+        _, lower, upper = proportion_interval((sampled['x'] > 1).sum(), 200, len(population))
+        covered_p += lower <= truth_p <= upper
+        means = mean_interval(sampled[['x']], len(population)).loc['x']
+        covered_mean += means['mean_ci_lower'] <= truth_mean <= means['mean_ci_upper']
+    assert covered_p >= 180 and covered_mean >= 180, (covered_p, covered_mean)
+    print("✓ Samples keep their size, strata (incl. missing) and interval coverage!")
+except Exception as e:
+    print(f"✗ Row sampling failed: {e!r}")
+
+print("\n21. Testing sample= in the EDA reports...")
+try:
+    import tempfile, os
+    from kuya.io import load
+    rng = np.random.default_rng(12)
+    df_big = KuyaDataFrame({'g': rng.choice(['a', 'b', None], 5000), 'x': rng.normal(size=5000)})
+    df_big['y'] = df_big['x'] * 2 + rng.normal(size=5000)
+    summary = df_big.summary(sample=500, stratify='g')
+    assert summary['sample']['rows'] == 500 and summary['sample']['population'] == 5000
+    estimates = summary['estimates'].loc['x']
+    assert estimates['mean_ci_lower'] <= estimates['mean'] <= estimates['mean_ci_upper']
+    uniques = df_big.unique_summary(sample=500)
+    assert (uniques['Lower Bound'] <= uniques['Upper Bound']).all()
+    quality = df_big.quality_report(sample=500, stratify='g')
+    lower, upper = quality['intervals']['missing_pct']
+    assert lower <= quality['missing_pct'] <= upper
+    corr = df_big.correlation_report(sample=500)
+    assert corr.attrs['sample_size'] == 500
+    assert corr.attrs['ci_lower'].loc['x', 'y'] <= corr.loc['x', 'y'] <= corr.attrs['ci_upper'].loc['x', 'y']
+    assert df_big.auto_insights(sample=500)[0] == "Dataset contains 5,000 rows and 3 columns"
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'big.csv')
+        df_big.to_csv(path, index=False)
+        loaded = load(path, sample=300, stratify='g', chunksize=700)
+    assert len(loaded) == 300 and loaded.attrs['kuya_sample']['population'] == 5000
+    print("✓ Sampled reports carry estimates and intervals!")
+except Exception as e:
+    print(f"✗ Sampled reports failed: {e!r}")
+
+print("\n22. Testing renamed and selected columns stay independent...")
+try:
+    df_src = KuyaDataFrame({'A Col': [1, 2, 3], 'c': [4.0, 5.0, 6.0]})
+    renamed = df_src.standardize_columns()
+    renamed.loc[0, 'a_col'] = 99
+    selected = df_src.select_columns(['c'])
+    selected.loc[0, 'c'] = 99.0
+    assert df_src.loc[0, 'A Col'] == 1 and df_src.loc[0, 'c'] == 4.0, df_src
+    shared = df_src.select_columns(['c'], copy=False)
+    assert np.shares_memory(shared['c'].to_numpy(), df_src['c'].to_numpy())
+    assert list(df_src.standardize_columns(copy=False).columns) == ['a_col', 'c']
+    print("✓ standardize_columns()/select_columns() copy unless copy=False!")
+except Exception as e:
+    print(f"✗ Column renaming/selection failed: {e!r}")
+
+print("\n23. Testing multivariate outliers against scipy...")
+try:
+    from scipy import stats as sp_stats
+    from scipy.spatial.distance import mahalanobis
+    rng = np.random.default_rng(13)
+    price = rng.normal(size=500)
+    df_mv = pd.DataFrame({'price': price, 'qty': price * 0.95 + rng.normal(scale=0.3, size=500)})
+    # Normal values on each axis, impossible together
+    df_mv.loc[:4, 'price'] = [1.5, -1.5, 1.2, -1.2, 1.4]
+    df_mv.loc[:4, 'qty'] = [-1.5, 1.5, -1.2, 1.2, -1.4]
+    df_mv.loc[10, 'qty'] = np.nan
+    complete = df_mv.dropna()
+    precision = np.linalg.inv(np.cov(complete.to_numpy(), rowvar=False))
+    center = complete.mean().to_numpy()
+    distances = pd.Series([mahalanobis(row, center, precision) for row in complete.to_numpy()],
+                          index=complete.index)
+    cutoff = np.sqrt(sp_stats.chi2.ppf(0.999, 2))
+    flagged = KuyaDataFrame(df_mv).handle_outliers(method='mahalanobis', action='flag',
+                                                   batch_size=64)
+    expected = distances.index[distances > cutoff]
+    assert flagged.index[flagged['outlier_flags'] > 0].equals(expected), flagged['outlier_flags']
+    assert set(range(5)) <= set(expected) and 10 not in expected
+    iqr = KuyaDataFrame(df_mv).handle_outliers(method='iqr', action='flag')
+    assert not (iqr['outlier_flags'].iloc[:5] > 0).any()  # invisible one column at a time
+    # A tight cluster of 8% outliers masks itself from the classical fit
+    df_mask = df_mv.copy()
+    df_mask.loc[:39, 'price'] = rng.normal(2, 0.1, 40)
+    df_mask.loc[:39, 'qty'] = rng.normal(-2, 0.1, 40)
+    classical = KuyaDataFrame(df_mask).handle_outliers(method='mahalanobis', action='flag')
+    robust = KuyaDataFrame(df_mask).handle_outliers(method='robust_mahalanobis', action='flag')
+    assert (classical['outlier_flags'].iloc[:40] == 0).all()
+    assert (robust['outlier_flags'].iloc[:40] > 0).all()
+    assert (robust['outlier_flags'].iloc[40:] > 0).sum() <= 2
+    print("✓ Mahalanobis distances match scipy; the robust fit sees masked outliers!")
+except Exception as e:
+    print(f"✗ Multivariate outliers failed: {e!r}")
+
+print("\n24. Testing the profiler...")
+try:
+    import json
+    import tracemalloc
+    import kuya as ky
+    df_prof = pd.DataFrame({'A': [1.0, 2.0, None, 4.0, 100.0] * 20_000,
+                            'B': ['x', 'y', 'y', None, 'x'] * 20_000})
+    with ky.profile() as prof:
+        cleaned = quick_clean(df_prof)
+    table = prof.to_frame()
+    assert table['step'].iloc[0] == 'quick_clean' and table['depth'].iloc[0] == 0
+    assert (table['depth'].iloc[1:] == 1).all(), table
+    assert table['rows_in'].iloc[0] == len(df_prof) and table['rows_out'].iloc[0] == len(cleaned)
+    assert table['wall_s'].iloc[0] >= table['wall_s'].iloc[1:].sum() * 0.99
+    # quick_clean copies the frame, so its peak is at least one copy of the data
+    assert table['peak_mb'].iloc[0] * 1024**2 >= df_prof['A'].nbytes, table
+    assert not tracemalloc.is_tracing()
+    events = json.loads(json.dumps(prof.to_chrome_trace()))['traceEvents']
+    outer, inner = events[0], events[1:]
+    assert all(outer['ts'] <= e['ts'] and e['ts'] + e['dur'] <= outer['ts'] + outer['dur'] + 1
+               for e in inner)
+    KuyaDataFrame(df_prof).check_missing()
+    assert len(prof.spans) == len(table)  # calls after the block are not recorded
+    print("✓ Profiler records nested steps, rows, time and memory!")
+except Exception as e:
+    print(f"✗ Profiler failed: {e!r}")
+
+print("\n25. Testing the benchmark suite...")
+try:
+    import contextlib, io, os, tempfile
+    from benchmarks.generators import make_messy_frame, iter_messy_chunks, write_messy_csv
+    from benchmarks.suite import BENCHMARKS, run_suite, compare_results
+    messy = make_messy_frame(3000, 22, seed=1, chunk_size=1000)
+    assert messy.equals(make_messy_frame(3000, 22, seed=1, chunk_size=1000))
+    assert messy.equals(pd.concat(list(iter_messy_chunks(3000, 22, chunk_size=1000, seed=1))))
+    assert messy.shape == (3000, 22) and messy['Customer ID'].is_unique
+    missing = messy.isna().mean()
+    assert missing.between(0.02, 0.09).sum() >= 16, missing
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_messy_csv(os.path.join(tmp, 'messy.csv'), 3000, 22, chunk_size=1000, seed=1)
+        assert pd.read_csv(path).shape == (3000, 22)
+    with contextlib.redirect_stdout(io.StringIO()):
+        document = run_suite(rows=(2000,), cols=(11,), repeat=1, memory=False, verbose=False)
+    errors = [(r['name'], r['error']) for r in document['results'] if 'error' in r]
+    assert not errors and len(document['results']) == len(BENCHMARKS), errors
+    slower = {'results': [dict(r, wall_s=r['wall_s'] * 2) for r in document['results']]}
+    comparison = compare_results(document, slower)
+    assert comparison['regression'].all() and np.allclose(comparison['ratio'], 2)
+    print("✓ Generators are reproducible and every benchmark runs!")
+except Exception as e:
+    print(f"✗ Benchmark suite failed: {e!r}")
+
+print("\n26. Testing vectorized clean_missing() fills against a per-column loop...")
+try:
+    import contextlib, io
+    rng = np.random.default_rng(15)
+    wide = pd.DataFrame({f'n{i}': rng.normal(size=400).round(1) for i in range(50)})
+    for i in range(10):
+        wide[f'c{i}'] = rng.choice(['b', 'a', 'c'], 400)
+    wide['region'] = rng.choice(['N', 'S', 'E'], 400)
+    wide = wide.mask((rng.random(wide.shape) < 0.1) & (wide.columns != 'region'))
+    wide.loc[wide['region'] == 'E', 'n0'] = np.nan  # group with nothing to fill from
+
+    def same(result, expected):
+        result = pd.DataFrame(result)
+        numeric = expected.select_dtypes('number').columns
+        return (list(result.columns) == list(expected.columns)
+                and np.allclose(result[numeric], expected[numeric])
+                and result.drop(columns=numeric).equals(expected.drop(columns=numeric)))
+
+    for strategy in ('mean', 'median', 'mode'):
+        expected = wide.copy()
+        for col in wide.columns:
+            if pd.api.types.is_numeric_dtype(wide[col]) and strategy != 'mode':
+                fill = getattr(wide[col], strategy)()
+            else:
+                fill = wide[col].mode().iloc[0]
+            expected[col] = wide[col].fillna(fill)
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = KuyaDataFrame(wide).clean_missing('fill', strategy=strategy)
+        assert same(result, expected), strategy
+
+    expected = wide.copy()
+    for col in wide.columns.drop('region'):
+        grouped = wide.groupby('region')[col]
+        if pd.api.types.is_numeric_dtype(wide[col]):
+            fill = grouped.transform('mean').fillna(wide[col].mean())
+        else:
+            fill = grouped.transform(lambda s: s.mode().iloc[0])
+        expected[col] = wide[col].fillna(fill)
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = KuyaDataFrame(wide).clean_missing('fill', strategy='mean', by='region')
+    assert same(result, expected)
+    print("✓ clean_missing() fills match a column-by-column reference!")
+except Exception as e:
+    print(f"✗ clean_missing() fills failed: {e!r}")
+
+print("\n27. Testing one-pass handle_outliers() against full-frame bounds...")
+try:
+    import contextlib, io
+    rng = np.random.default_rng(16)
+    df_iqr = pd.DataFrame({'a': rng.normal(size=300), 'b': rng.exponential(size=300),
+                           'c': rng.choice(list('xy'), 300)}, index=np.arange(300) * 3 + 7)
+    df_iqr.loc[df_iqr.index[:5], 'a'] = [8, -9, 7, np.nan, 10]
+    df_iqr.loc[df_iqr.index[50:53], 'b'] = np.nan
+    block = df_iqr[['a', 'b']]
+    for method, threshold in (('iqr', 1.5), ('zscore', 3.0)):
+        if method == 'iqr':
+            q1, q3 = block.quantile(0.25), block.quantile(0.75)
+            lower, upper = q1 - threshold * (q3 - q1), q3 + threshold * (q3 - q1)
+        else:
+            mean, std = block.mean(), block.std(ddof=0)
+            lower, upper = mean - threshold * std, mean + threshold * std
+        # Every column is judged on the full frame, not on rows left by earlier columns
+        mask = block.lt(lower) | block.gt(upper)
+        with contextlib.redirect_stdout(io.StringIO()):
+            dropped = KuyaDataFrame(df_iqr).handle_outliers(method=method, threshold=threshold)
+            clipped = KuyaDataFrame(df_iqr).handle_outliers(method=method, threshold=threshold,
+                                                            action='clip')
+            flagged = KuyaDataFrame(df_iqr).handle_outliers(method=method, threshold=threshold,
+                                                            action='flag')
+        assert dropped.index.equals(df_iqr.index[~mask.any(axis=1)]), method
+        assert pd.DataFrame(clipped[['a', 'b']]).equals(block.clip(lower, upper, axis=1)), method
+        bits = mask['a'].astype(int) + 2 * mask['b'].astype(int)
+        assert (flagged['outlier_flags'].to_numpy() == bits.to_numpy()).all(), method
+        assert flagged.attrs['outlier_flag_columns'] == ['a', 'b']
+    print("✓ handle_outliers() drop/clip/flag match full-frame bounds!")
+except Exception as e:
+    print(f"✗ One-pass outliers failed: {e!r}")
+
+print("\n28. Testing fuzzy detect_duplicates() against exact n-gram similarity...")
+try:
+    import contextlib, io, itertools, re
+    names = ['Acme Corporation of North America', 'Globex Industrial Supplies Limited',
+             'Initech Software Consulting Group', 'Umbrella Pharmaceuticals Holdings',
+             'Stark Aerospace and Defense Systems', 'Wayne Enterprises Shipping Division']
+    rows = [(name, city) for name, city in zip(names, ['Boston', 'Denver', 'Austin',
+                                                       'Raleigh', 'Seattle', 'Chicago'])]
+    rows += [('  ACME corporation of north america ', 'boston'),     # casing / spacing
+             ('Globex Industrial Supplies, Limited!', 'Denver'),     # punctuation
+             ('Initech Software Consultinq Group', 'Austin'),        # one-letter typo
+             ('Wayne Enterprises Shipping', 'Chicago')]              # truncated: not a duplicate
+    df_fuzzy = pd.DataFrame(rows, columns=['company', 'city'])
+
+    def shingles(values):
+        text = re.sub(r'[\W_]+', ' ', ' '.join(values).lower()).strip()
+        padded = f" {text} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    grams = [shingles(row) for row in rows]
+    jaccard = {(i, j): len(grams[i] & grams[j]) / len(grams[i] | grams[j])
+               for i, j in itertools.combinations(range(len(rows)), 2)}
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        found = KuyaDataFrame(df_fuzzy).detect_duplicates(fuzzy=True, columns=['company', 'city'],
+                                                          threshold=0.8, num_perm=128)
+    group = pd.Series(-1, index=df_fuzzy.index)
+    group[found.index] = found['duplicate_group']
+    for (i, j), similarity in jaccard.items():
+        same = group[i] >= 0 and group[i] == group[j]
+        if similarity >= 0.95:
+            assert same, (i, j, similarity)
+        if similarity < 0.6:
+            assert not same, (i, j, similarity)
+    assert group[6] == group[0] and group[7] == group[1] and group[8] == group[2]
+    assert group[9] == -1 and group[3] == group[4] == -1
+    assert found['duplicate_group'].nunique() == 3
+    print("✓ Fuzzy duplicates match exact n-gram similarity!")
+except Exception as e:
+    print(f"✗ Fuzzy duplicates failed: {e!r}")
+
 print("\n" + "=" * 60)
 print("✅ ADVANCED FEATURES TEST COMPLETE!")
 print("=" * 60)
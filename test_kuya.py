@@ -43,6 +43,23 @@ try:
         df_loaded = ky.load(test_path)
         print(f"   ✓ save() and load() work! Loaded shape: {df_loaded.shape}")
 
+    print("\n6. Testing missing values after an in-place edit...")
+    import numpy as np
+    df_missing = KuyaDataFrame({'a': [1.0, 2.0, 3.0], 'b': [np.nan, 'y', 'z']})
+    df_missing.check_missing()
+    df_missing.loc[0, 'a'] = np.nan
+    report = df_missing.check_missing().set_index('Column')['Missing Count']
+    assert report.to_dict() == df_missing.isnull().sum().to_dict(), report
+    assert df_missing.summary()['missing'].to_dict() == {'a': 1, 'b': 1}
+    print("   ✓ check_missing() sees in-place edits!")
+
+    print("\n7. Testing dtype fixes on formats outside the sample...")
+    dates = ['2024-01-%02d' % day for day in range(1, 29)] * 50 + ['2024-01-15 10:30:00']
+    fixed = KuyaDataFrame({'d': dates}).fix_dtypes(sample_size=10)
+    assert str(fixed['d'].dtype).startswith('datetime64'), fixed.dtypes
+    assert fixed['d'].iloc[-1] == pd.Timestamp('2024-01-15 10:30:00')
+    print("   ✓ fix_dtypes() falls back to inferred dates!")
+
     print("\n" + "=" * 60)
     print("✅ ALL TESTS PASSED!")
     print("Kuya is installed and working correctly!")